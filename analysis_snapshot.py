@@ -0,0 +1,104 @@
+import json
+import logging
+import time
+from pathlib import Path
+from player_record import PlayerRecord, ladder_of
+from elo_ladder import tier_differences, removal_mask
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_FILE = "analise_bloqueados.json"
+# Idade máxima para a limpeza reaproveitar uma análise (segundos)
+DEFAULT_MAX_AGE = 60 * 60
+
+
+class AnalysisSnapshot:
+    """
+    Resultado de uma análise, reaproveitável pela limpeza.
+
+    Guarda, por `id` da lista de bloqueados, a tupla retornada por
+    `_processar_jogador` (PlayerRecord, remover, motivo), junto com o elo do
+    jogador e o limite de diferença usados na análise.
+
+    Attributes:
+        my_elo: Elo do jogador no momento da análise
+        diff_limit: Limite de diferença de elo usado na análise
+        created_at: Timestamp da análise
+        results: Resultados por id de jogador
+    """
+    def __init__(self, my_elo, diff_limit, results, created_at=None):
+        self.my_elo = my_elo
+        self.diff_limit = diff_limit
+        self.results = dict(results)
+        self.created_at = created_at or time.time()
+
+    @classmethod
+    def from_run(cls, my_elo, diff_limit, jogadores, resultados):
+        """
+        Monta o snapshot a partir dos jogadores analisados e seus resultados.
+
+        Resultados com erro não são guardados, para a limpeza consultá-los de novo.
+        """
+        results = {}
+        for jogador, resultado in zip(jogadores, resultados):
+            if jogador.get('id') is not None and resultado is not None and not str(resultado[2]).startswith("erro"):
+                results[str(jogador['id'])] = tuple(resultado)
+        return cls(my_elo, diff_limit, results)
+
+    def is_usable(self, my_elo, max_age=DEFAULT_MAX_AGE):
+        """Indica se o snapshot é recente e foi feito com o mesmo elo."""
+        return self.my_elo == my_elo and time.time() - self.created_at <= max_age
+
+    def decisoes(self, jogadores, diff_limit):
+        """
+        Retorna (dados, remover, motivo) de cada jogador para o limite informado.
+
+        A diferença de elo e a decisão são recalculadas de uma vez para todos
+        os jogadores (NumPy), então o limite pode mudar entre a análise e a
+        limpeza. Jogadores que não foram analisados recebem None.
+        """
+        resultados = [self.results.get(str(jogador.get('id'))) for jogador in jogadores]
+        com_rank = [i for i, resultado in enumerate(resultados) if resultado is not None and resultado[0]]
+        if not com_rank:
+            return resultados
+
+        ladders = [resultados[i][0].ladder for i in com_rank]
+        diffs = tier_differences(ladders, ladder_of(self.my_elo))
+        remover = removal_mask(diffs, diff_limit)
+        for i, diff, should_remove in zip(com_rank, diffs.tolist(), remover.tolist()):
+            player_data, _, reason = resultados[i]
+            player_data.elo_diff = diff
+            resultados[i] = (player_data, should_remove, reason)
+        return resultados
+
+    def save(self, path=DEFAULT_SNAPSHOT_FILE):
+        """Salva o snapshot em disco."""
+        data = {
+            "createdAt": self.created_at,
+            "myElo": self.my_elo,
+            "diffLimit": self.diff_limit,
+            "results": {
+                player_id: [player_data.to_dict() if player_data else None, should_remove, reason]
+                for player_id, (player_data, should_remove, reason) in self.results.items()
+            }
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path=DEFAULT_SNAPSHOT_FILE):
+        """Carrega o snapshot do disco, ou None se não existir ou estiver inválido."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            results = {
+                player_id: (PlayerRecord.from_dict(player_data) if player_data else None, should_remove, reason)
+                for player_id, (player_data, should_remove, reason) in data["results"].items()
+            }
+            return cls(data["myElo"], data["diffLimit"], results, data["createdAt"])
+        except Exception as e:
+            logger.warning(f"Erro ao carregar análise salva: {e}")
+            return None
@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_BATCH_DELAY = 0.02  # segundos
+
+
+class RequestBatcher:
+    """
+    Agrupa consultas individuais de várias threads em uma única chamada em lote.
+
+    Cada `submit` bloqueia até o lote ser enviado, o que acontece quando ele
+    atinge `batch_size` itens, quando todas as threads registradas com
+    `worker()` estão aguardando o lote, ou após `batch_delay` segundos. Se a chamada em
+    lote não for suportada pelo cliente (retorna None), o batcher passa a usar
+    `single_fn` para cada item. Uma exceção de `single_fn` é entregue apenas
+    à thread que consultou aquela chave.
+
+    Attributes:
+        bulk_fn: Função que recebe uma lista de chaves e retorna {chave: valor} ou None
+        single_fn: Função que recebe uma chave e retorna o valor (ou None)
+        batch_size: Quantidade máxima de chaves por lote
+        batch_delay: Tempo máximo de espera para completar um lote
+        bulk_supported: Indica se a chamada em lote está disponível
+    """
+    def __init__(self, bulk_fn, single_fn, batch_size=DEFAULT_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY):
+        self.bulk_fn = bulk_fn
+        self.single_fn = single_fn
+        self.batch_size = max(1, batch_size)
+        self.batch_delay = batch_delay
+        self.bulk_supported = True
+        self._pending = {}
+        self._timer = None
+        self._ativos = 0
+        self._aguardando = 0
+        self._lock = threading.Lock()
+
+    def submit(self, key):
+        """Consulta uma chave, aguardando o envio do lote correspondente."""
+        if not self.bulk_supported or self.batch_size == 1:
+            return self.single_fn(key)
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+            self._aguardando += 1
+            lote = None
+            if len(self._pending) >= self.batch_size or self._todos_aguardando():
+                lote = self._retirar_lote()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.batch_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if lote:
+            self._enviar(lote)
+        return future.result()
+
+    @contextmanager
+    def worker(self):
+        """
+        Registra a thread atual como uma das que podem consultar o batcher.
+
+        Sem esperar o prazo, o lote é enviado assim que todas as threads
+        registradas estão aguardando por ele (nenhuma outra consulta pode chegar).
+        """
+        with self._lock:
+            self._ativos += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._ativos -= 1
+                lote = self._retirar_lote() if self._pending and self._todos_aguardando() else None
+            if lote:
+                self._enviar(lote)
+
+    def _todos_aguardando(self):
+        """Se todas as threads registradas aguardam o lote pendente. Deve ser chamado com o lock."""
+        return self._ativos > 0 and self._aguardando >= self._ativos
+
+    def flush(self):
+        """Envia imediatamente as chaves pendentes."""
+        with self._lock:
+            lote = self._retirar_lote()
+        if lote:
+            self._enviar(lote)
+
+    def fetch_each(self, keys):
+        """
+        Consulta as chaves individualmente com `single_fn`.
+
+        Returns:
+            dict: {chave: valor}, com a exceção como valor para as chaves que falharam
+        """
+        resultados = {}
+        for key in keys:
+            try:
+                resultados[key] = self.single_fn(key)
+            except Exception as e:
+                resultados[key] = e
+        return resultados
+
+    def _retirar_lote(self):
+        """Remove e retorna as chaves pendentes. Deve ser chamado com o lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        lote, self._pending = self._pending, {}
+        self._aguardando = 0
+        return lote
+
+    def _enviar(self, lote):
+        """Executa o lote e entrega os resultados a cada thread em espera."""
+        try:
+            resultados = self.bulk_fn(list(lote)) if self.bulk_supported else None
+            if resultados is None:
+                self.bulk_supported = False
+                resultados = self.fetch_each(lote)
+            for key, future in lote.items():
+                resultado = resultados.get(key)
+                if isinstance(resultado, Exception):
+                    future.set_exception(resultado)
+                else:
+                    future.set_result(resultado)
+        except Exception as e:
+            for future in lote.values():
+                if not future.done():
+                    future.set_exception(e)
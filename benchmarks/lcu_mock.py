@@ -0,0 +1,465 @@
+"""
+Servidor local que simula os endpoints do cliente do LoL usados pelo projeto.
+
+Gera uma lista de bloqueados sintética de tamanho configurável e permite
+injetar latência, variação de latência (jitter), respostas 404 e 429.
+Também aceita a assinatura de eventos por WebSocket (`GET /`), publicando
+os eventos de criação e remoção da lista de bloqueados.
+É usado pelos benchmarks e pode ser executado sozinho para testes manuais:
+
+    python benchmarks/lcu_mock.py --jogadores 2000 --latencia 5 --erro-429 0.01
+
+Endpoints simulados:
+    GET    /             (WebSocket; eventos OnJsonApiEvent_lol-chat_v1_blocked-players
+                          e OnJsonApiEvent_lol-summoner_v1_current-summoner)
+    GET    /lol-chat/v1/blocked-players[/{id}]
+    POST   /lol-chat/v1/blocked-players
+    DELETE /lol-chat/v1/blocked-players/{id}
+    GET    /lol-chat/v1/friends
+    GET    /lol-summoner/v1/current-summoner
+    GET    /lol-summoner/v1/summoners?name=...
+    GET    /lol-summoner/v1/summoners/by-puuid/{puuid}
+    GET    /lol-summoner/v2/summoners/by-riot-id/{nome}/{tag}
+    POST   /lol-summoner/v2/summoners/puuid
+    GET    /lol-ranked/v1/current-ranked-stats
+    GET    /lol-ranked/v1/ranked-stats/{summonerId}
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import socket
+import struct
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+TIERS = ['IRON', 'BRONZE', 'SILVER', 'GOLD', 'PLATINUM', 'EMERALD', 'DIAMOND', 'MASTER', 'GRANDMASTER', 'CHALLENGER']
+DIVISIONS = ['IV', 'III', 'II', 'I']
+APEX_TIERS = ('MASTER', 'GRANDMASTER', 'CHALLENGER')
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+BLOCKED_PLAYERS_EVENT = "OnJsonApiEvent_lol-chat_v1_blocked-players"
+
+# Endpoints que nunca recebem falhas injetadas (necessários para iniciar a execução)
+SEM_FALHAS = ("/lol-summoner/v1/current-summoner", "/lol-ranked/v1/current-ranked-stats", "/lol-chat/v1/blocked-players")
+
+
+class MockOptions:
+    """
+    Parâmetros da simulação.
+
+    Attributes:
+        players: Tamanho da lista de bloqueados
+        latency: Latência de cada resposta, em segundos
+        jitter: Variação máxima (para mais ou para menos) da latência, em segundos
+        error_404: Fração das consultas que respondem 404
+        error_429: Fração das consultas que respondem 429
+        retry_after: Valor do cabeçalho Retry-After das respostas 429 (segundos)
+        fast_path: Fração dos bloqueados que já trazem `puuid` e `summonerId`
+        unranked: Fração dos jogadores sem ranked solo
+        bulk: Se o endpoint de consulta de invocadores em lote está disponível
+        my_elo: Elo da conta conectada (tier, divisão)
+        seed: Semente dos dados e das falhas
+        password: Token exigido na autenticação básica (None aceita qualquer um)
+    """
+    def __init__(self, players=1000, latency=0.0, jitter=0.0, error_404=0.0, error_429=0.0,
+                 retry_after=0, fast_path=0.5, unranked=0.1, bulk=True, my_elo=("GOLD", "II"), seed=42,
+                 password=None):
+        self.players = players
+        self.latency = latency
+        self.jitter = jitter
+        self.error_404 = error_404
+        self.error_429 = error_429
+        self.retry_after = retry_after
+        self.fast_path = fast_path
+        self.unranked = unranked
+        self.bulk = bulk
+        self.my_elo = my_elo
+        self.seed = seed
+        self.password = password
+
+
+class MockState:
+    """Dados sintéticos e contadores do servidor."""
+    def __init__(self, options):
+        self.options = options
+        self.rng = random.Random(options.seed)
+        self.blocked = {}
+        self.by_puuid = {}
+        self.by_summoner_id = {}
+        self.by_riot_id = {}
+        self.requests = Counter()
+        self.injected = Counter()
+        self.subscribers = set()
+        self._lock = threading.Lock()
+
+        for i in range(options.players):
+            puuid = f"puuid-{i:08d}"
+            summoner_id = 100000 + i
+            game_name = f"Jogador {i}"
+            summoner = {"puuid": puuid, "summonerId": summoner_id, "id": summoner_id,
+                        "displayName": game_name, "gameName": game_name, "tagLine": "BR1"}
+            player = {"id": f"blk-{i:08d}", "gameName": game_name, "gameTag": "BR1", "pid": f"{puuid}@br1.pvp.net"}
+            if self.rng.random() < options.fast_path:
+                player.update(puuid=puuid, summonerId=summoner_id)
+
+            if self.rng.random() < options.unranked:
+                ranked = {}
+            else:
+                tier = self.rng.choice(TIERS)
+                wins = self.rng.randint(0, 300)
+                ranked = {"RANKED_SOLO_5x5": {
+                    "queueType": "RANKED_SOLO_5x5",
+                    "tier": tier,
+                    "division": "NA" if tier in APEX_TIERS else self.rng.choice(DIVISIONS),
+                    "leaguePoints": self.rng.randint(0, 1500 if tier in APEX_TIERS else 99),
+                    "wins": wins,
+                    "losses": self.rng.randint(0, 300) if wins else self.rng.randint(1, 300)
+                }}
+            summoner["_ranked"] = ranked
+
+            self.blocked[player["id"]] = player
+            self.by_puuid[puuid] = summoner
+            self.by_summoner_id[str(summoner_id)] = summoner
+            self.by_riot_id[(game_name.lower(), "br1")] = summoner
+
+    def sortear(self):
+        """Sorteia a falha injetada na próxima resposta: 404, 429 ou None."""
+        with self._lock:
+            sorteio = self.rng.random()
+            atraso = self.options.latency + self.rng.uniform(-self.options.jitter, self.options.jitter)
+        if sorteio < self.options.error_429:
+            return 429, max(0.0, atraso)
+        if sorteio < self.options.error_429 + self.options.error_404:
+            return 404, max(0.0, atraso)
+        return None, max(0.0, atraso)
+
+    def contar(self, chave, injetado=None):
+        with self._lock:
+            self.requests[chave] += 1
+            if injetado:
+                self.injected[injetado] += 1
+
+    def publish(self, topic, uri, event_type, data=None):
+        """Envia um evento `[8, tópico, {...}]` às conexões WebSocket que assinaram `topic`."""
+        mensagem = json.dumps([8, topic, {"data": data, "eventType": event_type, "uri": uri}]).encode("utf-8")
+        with self._lock:
+            assinantes = [c for c in self.subscribers if topic in c.topics]
+        for conexao in assinantes:
+            try:
+                conexao.send(0x1, mensagem)
+            except OSError:
+                with self._lock:
+                    self.subscribers.discard(conexao)
+
+
+class _ConexaoWebSocket:
+    """Conexão WebSocket aceita pelo servidor simulado."""
+    def __init__(self, rfile, wfile):
+        self.rfile = rfile
+        self.wfile = wfile
+        self.topics = set()
+        self._lock = threading.Lock()
+
+    def send(self, opcode, payload):
+        # Frames do servidor não são mascarados
+        n = len(payload)
+        if n < 126:
+            cabecalho = struct.pack("!BB", 0x80 | opcode, n)
+        elif n < 1 << 16:
+            cabecalho = struct.pack("!BBH", 0x80 | opcode, 126, n)
+        else:
+            cabecalho = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+        with self._lock:
+            self.wfile.write(cabecalho + payload)
+
+    def receive(self):
+        """Lê um frame do cliente. Returns: (opcode, conteúdo)"""
+        b0, b1 = self._ler(2)
+        n = b1 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", self._ler(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", self._ler(8))[0]
+        mascara = self._ler(4) if b1 & 0x80 else b"\0\0\0\0"
+        payload = bytes(b ^ mascara[i % 4] for i, b in enumerate(self._ler(n)))
+        return b0 & 0x0F, payload
+
+    def _ler(self, n):
+        dados = self.rfile.read(n)
+        if len(dados) < n:
+            raise ConnectionError("conexão encerrada")
+        return dados
+
+
+def _publico(summoner):
+    return {k: v for k, v in summoner.items() if not k.startswith("_")}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo são escritos separadamente; sem isso, o atraso de ACK
+    # do TCP somaria ~40ms a cada resposta em conexões keep-alive
+    disable_nagle_algorithm = True
+    state = None  # Definido por `start`
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.track(self.connection)
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            self.server.untrack(self.connection)
+
+    def _responder(self, status, body=None, headers=None):
+        conteudo = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(conteudo)))
+        for nome, valor in (headers or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def _atender(self, metodo):
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        corpo = json.loads(self.rfile.read(tamanho)) if tamanho else None
+
+        if not self._autorizado():
+            self.state.contar(f"{metodo} {_familia(path)}", 401)
+            return self._responder(401, {"message": "unauthorized"})
+        if metodo == "GET" and path == "/" and self.headers.get("Upgrade", "").lower() == "websocket":
+            self.state.contar("GET websocket")
+            return self._websocket()
+
+        falha, atraso = (None, 0.0) if path in SEM_FALHAS else self.state.sortear()
+        self.state.contar(f"{metodo} {_familia(path)}", falha)
+        if atraso:
+            time.sleep(atraso)
+        if falha == 429:
+            return self._responder(429, {"message": "rate limited"}, {"Retry-After": str(self.state.options.retry_after)})
+        if falha == 404:
+            return self._responder(404, {"message": "not found"})
+
+        status, body = self._rota(metodo, path, urllib.parse.parse_qs(url.query), corpo)
+        self._responder(status, body)
+
+    def _autorizado(self):
+        password = self.state.options.password
+        if password is None:
+            return True
+        esperado = "Basic " + base64.b64encode(f"riot:{password}".encode("utf-8")).decode("ascii")
+        return self.headers.get("Authorization") == esperado
+
+    def _websocket(self):
+        """Aceita a conexão WebSocket e atende as assinaturas até ela ser fechada."""
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        aceite = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", aceite)
+        self.end_headers()
+        self.close_connection = True
+
+        conexao = _ConexaoWebSocket(self.rfile, self.wfile)
+        with self.state._lock:
+            self.state.subscribers.add(conexao)
+        try:
+            while True:
+                opcode, payload = conexao.receive()
+                if opcode == 0x8:
+                    conexao.send(0x8, payload[:2])
+                    break
+                if opcode == 0x9:
+                    conexao.send(0xA, payload)
+                elif opcode == 0x1:
+                    mensagem = json.loads(payload)
+                    if mensagem and mensagem[0] == 5:
+                        conexao.topics.add(mensagem[1])
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self.state._lock:
+                self.state.subscribers.discard(conexao)
+
+    def do_GET(self):
+        self._atender("GET")
+
+    def do_POST(self):
+        self._atender("POST")
+
+    def do_DELETE(self):
+        self._atender("DELETE")
+
+    def _rota(self, metodo, path, query, corpo):
+        state = self.state
+        if metodo == "GET" and path == "/lol-chat/v1/blocked-players":
+            with state._lock:
+                return 200, list(state.blocked.values())
+        if metodo == "POST" and path == "/lol-chat/v1/blocked-players":
+            player = dict(corpo or {})
+            with state._lock:
+                player.setdefault("id", f"blk-novo-{len(state.blocked)}")
+                state.blocked[player["id"]] = player
+            state.publish(BLOCKED_PLAYERS_EVENT, f"/lol-chat/v1/blocked-players/{player['id']}", "Create", player)
+            return 200, player
+        m = re.fullmatch(r"/lol-chat/v1/blocked-players/([^/]+)", path)
+        if m:
+            player_id = urllib.parse.unquote(m[1])
+            if metodo == "DELETE":
+                with state._lock:
+                    removido = state.blocked.pop(player_id, None)
+                if not removido:
+                    return 404, {"message": "not blocked"}
+                state.publish(BLOCKED_PLAYERS_EVENT, f"/lol-chat/v1/blocked-players/{player_id}", "Delete")
+                return 204, None
+            with state._lock:
+                player = state.blocked.get(player_id)
+            return (200, player) if player else (404, {"message": "not blocked"})
+        if path == "/lol-chat/v1/friends":
+            return 200, []
+        if path == "/lol-summoner/v1/current-summoner":
+            return 200, {"displayName": "Benchmark", "puuid": "puuid-me", "summonerId": 1}
+        if path == "/lol-ranked/v1/current-ranked-stats":
+            tier, division = state.options.my_elo
+            return 200, {"queueMap": {"RANKED_SOLO_5x5": {"queueType": "RANKED_SOLO_5x5", "tier": tier, "division": division}}}
+        if path == "/lol-summoner/v1/summoners":
+            nome = (query.get("name") or [""])[0].lower()
+            return 200, [_publico(s) for (n, _), s in state.by_riot_id.items() if n == nome]
+        m = re.fullmatch(r"/lol-summoner/v1/summoners/by-puuid/([^/]+)", path)
+        if m:
+            summoner = state.by_puuid.get(m[1])
+            return (200, _publico(summoner)) if summoner else (404, {"message": "not found"})
+        m = re.fullmatch(r"/lol-summoner/v2/summoners/by-riot-id/([^/]+)/([^/]+)", path)
+        if m:
+            chave = (urllib.parse.unquote(m[1]).lower(), urllib.parse.unquote(m[2]).lower())
+            summoner = state.by_riot_id.get(chave)
+            return (200, _publico(summoner)) if summoner else (404, {"message": "not found"})
+        if metodo == "POST" and path == "/lol-summoner/v2/summoners/puuid":
+            if not state.options.bulk:
+                return 404, {"message": "not found"}
+            return 200, [_publico(state.by_puuid[p]) for p in corpo or [] if p in state.by_puuid]
+        m = re.fullmatch(r"/lol-ranked/v1/ranked-stats/([^/]+)", path)
+        if m:
+            summoner = state.by_summoner_id.get(m[1])
+            return (200, {"queueMap": summoner["_ranked"]}) if summoner else (404, {"message": "not found"})
+        return 404, {"message": "unknown endpoint"}
+
+
+def _familia(path):
+    return path.strip("/").split("/", 1)[0]
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Servidor que, ao ser encerrado, também fecha as conexões abertas.
+
+    Sem isso, as conexões keep-alive (e o WebSocket) continuariam sendo
+    atendidas depois de `shutdown()`, e um "reinício" do cliente simulado
+    não causaria conexões recusadas.
+    """
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = set()
+        self._connections_lock = threading.Lock()
+
+    def track(self, conexao):
+        with self._connections_lock:
+            self.connections.add(conexao)
+
+    def untrack(self, conexao):
+        with self._connections_lock:
+            self.connections.discard(conexao)
+
+    def shutdown(self):
+        super().shutdown()
+        self.server_close()
+        with self._connections_lock:
+            conexoes, self.connections = list(self.connections), set()
+        for conexao in conexoes:
+            try:
+                conexao.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def start(options=None, port=0, state=None):
+    """
+    Inicia o servidor em segundo plano.
+
+    Passar o `state` de um servidor encerrado (`server.shutdown()`, que
+    também fecha as conexões abertas) simula o cliente reiniciado (nova
+    porta ou token) mantendo a mesma lista de bloqueados.
+
+    Returns:
+        tuple: (servidor, estado); a URL é `http://127.0.0.1:<servidor.server_port>`
+    """
+    if state is None:
+        state = MockState(options or MockOptions())
+    elif options is not None:
+        state.options = options
+    handler = type("Handler", (MockHandler,), {"state": state})
+    server = MockServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def add_arguments(parser):
+    """Adiciona ao parser as opções da simulação (compartilhadas com os benchmarks)."""
+    parser.add_argument("--jogadores", type=int, default=1000, help="Tamanho da lista de bloqueados (padrão: 1000)")
+    parser.add_argument("--latencia", type=float, default=0.0, help="Latência por resposta em ms (padrão: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Variação da latência em ms (padrão: 0)")
+    parser.add_argument("--erro-404", type=float, default=0.0, help="Fração de respostas 404 (padrão: 0)")
+    parser.add_argument("--erro-429", type=float, default=0.0, help="Fração de respostas 429 (padrão: 0)")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After das respostas 429 em segundos (padrão: 0)")
+    parser.add_argument("--fast-path", type=float, default=0.5, help="Fração dos bloqueados que já trazem PUUID e Summoner ID (padrão: 0.5)")
+    parser.add_argument("--sem-lote", action="store_true", help="Simula um cliente sem a consulta de invocadores em lote")
+    parser.add_argument("--semente", type=int, default=42, help="Semente dos dados e das falhas (padrão: 42)")
+
+
+def options_from_args(args):
+    return MockOptions(
+        players=args.jogadores,
+        latency=args.latencia / 1000,
+        jitter=args.jitter / 1000,
+        error_404=args.erro_404,
+        error_429=args.erro_429,
+        retry_after=args.retry_after,
+        fast_path=args.fast_path,
+        bulk=not args.sem_lote,
+        seed=args.semente
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor local que simula o cliente do LoL")
+    add_arguments(parser)
+    parser.add_argument("--porta", type=int, default=0, help="Porta do servidor (padrão: qualquer porta livre)")
+    args = parser.parse_args(argv)
+
+    server, _ = start(options_from_args(args), port=args.porta)
+    print(f"Servidor simulado em http://127.0.0.1:{server.server_port} ({args.jogadores} bloqueados). Ctrl+C para encerrar.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark de inicialização: tempo até a janela e tempo até conectar ao cliente.
+
+Cada medição roda em um processo Python novo, para incluir o custo real de
+importação. A conexão é medida contra o cliente simulado (`lcu_mock.py`),
+encontrado pelo lockfile em `LOL_LOCKFILE`. O script termina com código 1
+se algum tempo passar do orçamento, se a conexão falhar ou se uma
+dependência pesada for carregada antes de ser usada. Sem display, a medição
+da janela é ignorada, a menos que `--require-window` seja usado.
+
+Uso:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget-window 1.0 --budget-connect 1.5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import lcu_mock  # noqa: E402
+
+DEFAULT_BUDGET_WINDOW = 1.5   # segundos
+DEFAULT_BUDGET_CONNECT = 2.0  # segundos
+REPEAT = 3
+# Token do cliente simulado usado na medição da conexão
+MOCK_PASSWORD = "startup"
+
+# Dependências que só devem ser carregadas quando o recurso for usado
+LAZY_MODULES = ("pandas", "numpy", "openpyxl", "psutil")
+
+WINDOW_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+import tkinter as tk
+from gerenciador_bloqueio import GerenciadorBloqueios
+root = tk.Tk()
+app = GerenciadorBloqueios(root)
+root.update()
+elapsed = time.perf_counter() - t0
+lazy = [m for m in {lazy!r} if m in sys.modules]
+root.destroy()
+print(json.dumps({{"elapsed": elapsed, "lazy_loaded": lazy}}))
+"""
+
+CONNECT_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+from motor_bloqueio import MotorBloqueios
+motor = MotorBloqueios()
+connected = motor.connect()
+if connected:
+    motor.get_account_info()
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed, "connected": connected}))
+"""
+
+
+def _executar(snippet, env=None):
+    """Executa o trecho em um novo processo e retorna o JSON impresso por ele."""
+    # Diretório temporário para não criar caches e logs na raiz do projeto (nem
+    # reaproveitar as credenciais salvas do cliente real)
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run(
+            [sys.executable, "-c", snippet],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1",
+                     XDG_CACHE_HOME=cwd, LOCALAPPDATA=cwd, **(env or {}))
+        )
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "erro desconhecido"
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def _sem_display(erro):
+    """Indica se o erro é do Tk sem display (ex.: máquina sem interface gráfica)."""
+    return erro.split(":", 1)[0].endswith("TclError")
+
+
+def medir(snippet, repeat=REPEAT, env=None):
+    """Retorna a melhor de `repeat` execuções (ou None e o erro)."""
+    melhor = None
+    for _ in range(repeat):
+        dados, erro = _executar(snippet, env)
+        if dados is None:
+            return None, erro
+        if melhor is None or dados["elapsed"] < melhor["elapsed"]:
+            melhor = dados
+    return melhor, None
+
+
+def medir_conexao(repeat=REPEAT):
+    """Mede a conexão contra o cliente simulado, encontrado pelo lockfile."""
+    server, _ = lcu_mock.start(lcu_mock.MockOptions(players=10, password=MOCK_PASSWORD))
+    try:
+        with tempfile.TemporaryDirectory() as pasta:
+            lockfile = Path(pasta) / "lockfile"
+            lockfile.write_text(f"LeagueClient:{os.getpid()}:{server.server_port}:{MOCK_PASSWORD}:http", encoding="utf-8")
+            return medir(CONNECT_SNIPPET, repeat, env={"LOL_LOCKFILE": str(lockfile)})
+    finally:
+        server.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização")
+    parser.add_argument("--budget-window", type=float, default=DEFAULT_BUDGET_WINDOW,
+                        help=f"Orçamento para abrir a janela em segundos (padrão: {DEFAULT_BUDGET_WINDOW})")
+    parser.add_argument("--budget-connect", type=float, default=DEFAULT_BUDGET_CONNECT,
+                        help=f"Orçamento para conectar ao cliente em segundos (padrão: {DEFAULT_BUDGET_CONNECT})")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"Repetições por medição (padrão: {REPEAT})")
+    parser.add_argument("--require-window", action="store_true",
+                        help="Falha em vez de ignorar a medição da janela quando não há display")
+    args = parser.parse_args(argv)
+
+    falhas = []
+
+    janela, erro = medir(WINDOW_SNIPPET.format(lazy=LAZY_MODULES), args.repeat)
+    if janela is None and _sem_display(erro) and not args.require_window:
+        print(f"Tempo até a janela: ignorado ({erro})")
+    elif janela is None:
+        falhas.append(f"falha ao abrir a janela: {erro}")
+    else:
+        print(f"Tempo até a janela: {janela['elapsed']:.3f}s (orçamento {args.budget_window:.3f}s)")
+        if janela["elapsed"] > args.budget_window:
+            falhas.append("tempo até a janela acima do orçamento")
+        if janela["lazy_loaded"]:
+            falhas.append(f"dependências carregadas na abertura: {', '.join(janela['lazy_loaded'])}")
+
+    conexao, erro = medir_conexao(args.repeat)
+    if conexao is None:
+        falhas.append(f"falha ao medir a conexão: {erro}")
+    elif not conexao["connected"]:
+        falhas.append("não conectou ao cliente simulado")
+    else:
+        print(f"Tempo até conectar: {conexao['elapsed']:.3f}s (orçamento {args.budget_connect:.3f}s)")
+        if conexao["elapsed"] > args.budget_connect:
+            falhas.append("tempo até conectar acima do orçamento")
+
+    for falha in falhas:
+        print(f"FALHA: {falha}")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
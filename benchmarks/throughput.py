@@ -0,0 +1,163 @@
+"""
+Benchmark de vazão da análise e da limpeza contra o servidor simulado.
+
+Cada cenário roda com um servidor novo (`lcu_mock.py`) e em um diretório
+temporário, para que caches, diário e relatórios de uma execução não
+influenciem a seguinte. Para cada ação são exibidos jogadores/s e os
+percentis p50/p99 do tempo de processamento por jogador.
+
+Uso:
+    python benchmarks/throughput.py
+    python benchmarks/throughput.py --jogadores 5000 --latencia 10 --jitter 5 --paralelo 4 8 16
+    python benchmarks/throughput.py --erro-429 0.02 --acao limpar --json resultado.json
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import lcu_mock  # noqa: E402
+from motor_bloqueio import MotorBloqueios, DEFAULT_WORKERS  # noqa: E402
+from rate_limiter import RateLimiter  # noqa: E402
+
+DEFAULT_DIFF = 3
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) pelo método do posto mais próximo."""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, math.ceil(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+class _Cronometro:
+    """Mede a duração de cada chamada de uma função, de várias threads."""
+    def __init__(self, funcao):
+        self.funcao = funcao
+        self.duracoes = []
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return self.funcao(*args, **kwargs)
+        finally:
+            duracao = time.perf_counter() - inicio
+            with self._lock:
+                self.duracoes.append(duracao)
+
+
+def executar(acao, options, workers, diff_limit=DEFAULT_DIFF, taxa=None):
+    """
+    Executa uma ação ('analisar' ou 'limpar') contra um servidor simulado novo.
+
+    Returns:
+        dict: Métricas da execução
+    """
+    server, state = lcu_mock.start(options)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            motor = MotorBloqueios(workers=workers, on_log=lambda mensagem, nivel: None)
+            if taxa:
+                motor.client.rate_limiter = RateLimiter(limits={}, default_rate=taxa, default_burst=max(1, int(taxa)))
+            motor.client.use_endpoint(f"http://127.0.0.1:{server.server_port}", "benchmark")
+            my_elo = motor.get_account_info()['elo']
+
+            por_jogador = _Cronometro(motor._processar_jogador)
+            motor._processar_jogador = por_jogador
+            desbloqueio = _Cronometro(motor.client.unblock_request)
+            motor.client.unblock_request = desbloqueio
+
+            inicio = time.perf_counter()
+            if acao == "analisar":
+                resumo = motor.analyze(my_elo, diff_limit)
+                processados = resumo['analisados']
+            else:
+                resumo = motor.clean(my_elo, diff_limit)
+                processados = resumo['total']
+            duracao = time.perf_counter() - inicio
+            motor.identity_cache.close()
+            motor.client.close()
+        finally:
+            os.chdir(cwd)
+            server.shutdown()
+            server.server_close()
+
+    metricas = {
+        "acao": acao,
+        "jogadores": processados,
+        "paralelo": workers,
+        "duracao_s": duracao,
+        "jogadores_por_s": processados / duracao if duracao else 0.0,
+        "p50_ms": percentil(por_jogador.duracoes, 50) * 1000,
+        "p99_ms": percentil(por_jogador.duracoes, 99) * 1000,
+        "requisicoes": dict(state.requests),
+        "falhas_injetadas": {str(k): v for k, v in state.injected.items()},
+        "endpoints": motor.client.metrics.snapshot(),
+    }
+    if acao == "limpar":
+        metricas.update(
+            removidos=resumo['removidos'],
+            falhas=resumo['falhas'],
+            desbloqueio_p50_ms=percentil(desbloqueio.duracoes, 50) * 1000,
+            desbloqueio_p99_ms=percentil(desbloqueio.duracoes, 99) * 1000,
+        )
+    return metricas
+
+
+def _exibir(metricas):
+    linha = (f"{metricas['acao']:<9} paralelo={metricas['paralelo']:<3} "
+             f"{metricas['jogadores']} jogadores em {metricas['duracao_s']:.2f}s  "
+             f"{metricas['jogadores_por_s']:8.1f} jogadores/s  "
+             f"p50={metricas['p50_ms']:.1f}ms  p99={metricas['p99_ms']:.1f}ms")
+    if metricas['acao'] == "limpar":
+        linha += (f"  removidos={metricas['removidos']} falhas={metricas['falhas']} "
+                  f"(desbloqueio p50={metricas['desbloqueio_p50_ms']:.1f}ms p99={metricas['desbloqueio_p99_ms']:.1f}ms)")
+    print(linha)
+    total = sum(metricas['requisicoes'].values())
+    detalhes = ", ".join(f"{chave}: {valor}" for chave, valor in sorted(metricas['requisicoes'].items()))
+    print(f"          {total} requisições ({detalhes})")
+    if metricas['falhas_injetadas']:
+        print(f"          falhas injetadas: {metricas['falhas_injetadas']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de vazão contra o servidor simulado do cliente do LoL")
+    lcu_mock.add_arguments(parser)
+    parser.add_argument("--acao", choices=["analisar", "limpar", "ambos"], default="ambos", help="Ação a medir (padrão: ambos)")
+    parser.add_argument("--paralelo", type=int, nargs="+", default=[DEFAULT_WORKERS],
+                        help=f"Jogadores em paralelo; vários valores geram vários cenários (padrão: {DEFAULT_WORKERS})")
+    parser.add_argument("--diff", type=int, default=DEFAULT_DIFF, help=f"Diferença de elo para remover (padrão: {DEFAULT_DIFF})")
+    parser.add_argument("--taxa", type=float, default=None,
+                        help="Substitui o limite de requisições/s por família de endpoint (padrão: limites do cliente)")
+    parser.add_argument("--json", default=None, help="Grava as métricas de todos os cenários neste arquivo")
+    args = parser.parse_args(argv)
+
+    acoes = ["analisar", "limpar"] if args.acao == "ambos" else [args.acao]
+    resultados = []
+    for workers in args.paralelo:
+        for acao in acoes:
+            metricas = executar(acao, lcu_mock.options_from_args(args), workers, args.diff, args.taxa)
+            _exibir(metricas)
+            resultados.append(metricas)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,8 @@ import json
 import requests
 import random
 import time
-import pandas as pd
+from report_writer import StreamingReportWriter, export_sorted_xlsx
+from player_record import ladder_of
 
 # Caminho para o arquivo JSON
 json_path = "bloqueados.json"
@@ -29,8 +30,8 @@ BASE_URL = f'https://{REGION}.api.riotgames.com'
 REQUEST_COUNT = 0  # Contador de requisições
 LAST_REQUEST_TIME = time.time()  # Tempo da última requisição
 
-# Lista para armazenar os dados de ranked
-ranked_data = []
+# Relatório gravado incrementalmente (resultados parciais ficam em disco)
+REPORT_FILE = 'ranked_info_ordenado.jsonl'
 
 # Mapeamento dos tiers para ordenação
 TIER_ORDER = {
@@ -140,14 +141,12 @@ def check_rate_limit():
 
 # Função para ordenar os dados pelo elo
 def sort_by_elo(entry):
-    if entry['Elo'] == 'unranked':
-        return (0, 0)
-    tier = entry['Elo'].split()[0]  # Extrai o tier (ex: 'GOLD')
-    rank = entry['Elo'].split()[1]  # Extrai a divisão (ex: 'IV')
-    return (TIER_ORDER.get(tier, 0), RANK_ORDER.get(rank, 0))
+    # Posição inteira na escada de elo (ex: 'GOLD IV'); sem rank fica por último
+    return ladder_of(entry['Elo'])
 
 # Execução do código
 if __name__ == '__main__':
+    report = StreamingReportWriter(REPORT_FILE)
     for usuario in usuarios99:
         puuid = get_puuid(usuario.get('gameName'), usuario.get('gameTag'))
         if puuid:
@@ -158,8 +157,8 @@ if __name__ == '__main__':
                 
                 if ranked_info:
                     for entry in ranked_info:
-                        # Adicionar os dados à lista
-                        ranked_data.append({
+                        # Adicionar os dados ao relatório
+                        report.append({
                             'Nome': usuario.get('gameName') + '#' + usuario.get('gameTag'),
                             'id': usuario.get('id'),
                             'Summoner ID': summoner_id,
@@ -172,7 +171,7 @@ if __name__ == '__main__':
                             'Winrate':  str((entry['wins']/(entry['wins'] + entry['losses']))*100) + "%"
                         })
                 else:
-                    ranked_data.append({
+                    report.append({
                             'Nome': usuario.get('gameName') + '#' + usuario.get('gameTag'),
                             'id': usuario.get('id'),
                             'Summoner ID': summoner_id,
@@ -186,12 +185,11 @@ if __name__ == '__main__':
             else:
                 print("Summoner ID não encontrado.")
 
-    ranked_data_sorted = sorted(ranked_data, key=sort_by_elo, reverse=True)
+    report.close()
 
     # Exportar os dados ordenados para um arquivo Excel
-    if ranked_data_sorted:
-        df = pd.DataFrame(ranked_data_sorted)
-        df.to_excel('ranked_info_ordenado.xlsx', index=False)
+    if report.rows:
+        export_sorted_xlsx(REPORT_FILE, 'ranked_info_ordenado.xlsx', key=sort_by_elo, reverse=True)
         print("Dados ordenados exportados para 'ranked_info_ordenado.xlsx'.")
     else:
         print("Nenhum dado para exportar.")
\ No newline at end of file
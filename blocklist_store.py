@@ -0,0 +1,185 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKLIST_FILE = "bloqueados.json"
+DEFAULT_CHANGELOG_FILE = "bloqueados_alteracoes.jsonl"
+# Quantidade de registros no histórico antes de consolidá-lo no arquivo principal
+DEFAULT_MAX_LOG_ENTRIES = 1000
+
+
+class BlocklistStore:
+    """
+    Cópia local da lista de bloqueados (`bloqueados.json`), usada quando o
+    cliente não responde.
+
+    As gravações são compactas e atômicas (arquivo temporário + renomeação),
+    e são ignoradas quando o conteúdo não mudou. Com `changelog_path`, as
+    alterações seguintes são acrescentadas a um histórico (JSON lines) de
+    bloqueios e desbloqueios em vez de regravar a lista inteira; o histórico
+    é consolidado no arquivo principal ao passar de `max_log_entries`.
+
+    Attributes:
+        path: Arquivo principal com a lista completa
+        changelog_path: Histórico opcional de alterações
+        max_log_entries: Tamanho máximo do histórico antes da consolidação
+        writes: Quantidade de gravações efetivamente feitas em disco
+        skipped: Quantidade de gravações ignoradas por falta de alterações
+    """
+    def __init__(self, path=DEFAULT_BLOCKLIST_FILE, changelog_path=None, max_log_entries=DEFAULT_MAX_LOG_ENTRIES):
+        self.path = Path(path)
+        self.changelog_path = Path(changelog_path) if changelog_path else None
+        self.max_log_entries = max_log_entries
+        self.writes = 0
+        self.skipped = 0
+        self._players = None  # Estado conhecido, por id
+        self._hash = None
+        self._log_entries = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _serializar(players):
+        return json.dumps({"usuariosBlock": players}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _chave(player):
+        return str(player.get('id'))
+
+    def load(self):
+        """
+        Carrega a lista salva (arquivo principal + histórico).
+
+        Returns:
+            list: Jogadores bloqueados, ou [] se não houver cópia local válida
+        """
+        with self._lock:
+            try:
+                self._carregar()
+            except Exception as e:
+                logger.warning(f"Erro ao carregar arquivo de bloqueados: {e}")
+                return []
+            return list(self._players.values())
+
+    def _carregar(self):
+        """
+        Lê o arquivo principal e aplica o histórico.
+
+        Um arquivo principal ilegível (ex.: gravação interrompida) deixa o
+        estado como desconhecido (`_hash` None), e a próxima gravação
+        regrava a lista inteira.
+        """
+        players = []
+        self._hash = None
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    players = json.load(f).get("usuariosBlock", [])
+            self._hash = hashlib.sha256(self._serializar(players)).hexdigest()
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Arquivo de bloqueados corrompido, será regravado: {e}")
+            players = []
+        self._players = {self._chave(p): p for p in players}
+        self._log_entries = 0
+
+        if self.changelog_path and self.changelog_path.exists():
+            with open(self.changelog_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Linha incompleta de uma gravação interrompida
+                    if record.get("type") == "block":
+                        self._players[record["id"]] = record["player"]
+                    elif record.get("type") == "unblock":
+                        self._players.pop(record["id"], None)
+                    self._log_entries += 1
+
+    def save(self, players):
+        """
+        Salva a lista de bloqueados, se ela mudou desde a última leitura ou gravação.
+
+        Returns:
+            bool: True se a lista está salva (gravada ou já atualizada)
+        """
+        with self._lock:
+            try:
+                if self._players is None:
+                    self._carregar()
+
+                atual = {self._chave(p): p for p in players}
+                if atual == self._players and self._hash is not None:
+                    self.skipped += 1
+                    return True
+
+                if self.changelog_path and self.path.exists() and self._hash is not None:
+                    self._registrar_alteracoes(atual)
+                    if self._log_entries > self.max_log_entries:
+                        self._gravar_lista(list(atual.values()))
+                else:
+                    self._gravar_lista(players)
+                self._players = atual
+                self.writes += 1
+                return True
+            except Exception as e:
+                logger.error(f"Erro ao salvar arquivo de bloqueados: {e}")
+                return False
+
+    def _registrar_alteracoes(self, atual):
+        """Acrescenta ao histórico os bloqueios e desbloqueios em relação ao estado conhecido."""
+        agora = time.time()
+        registros = [
+            {"type": "block", "id": chave, "player": player, "ts": agora}
+            for chave, player in atual.items() if self._players.get(chave) != player
+        ]
+        registros += [
+            {"type": "unblock", "id": chave, "ts": agora}
+            for chave in self._players if chave not in atual
+        ]
+        with open(self.changelog_path, 'a', encoding='utf-8') as f:
+            for registro in registros:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_entries += len(registros)
+
+    def _gravar_lista(self, players):
+        """Grava a lista completa de forma atômica e zera o histórico."""
+        conteudo = self._serializar(players)
+        digest = hashlib.sha256(conteudo).hexdigest()
+        if digest != self._hash:
+            _gravar_atomico(self.path, conteudo)
+            self._hash = digest
+        if self.changelog_path and self.changelog_path.exists():
+            self.changelog_path.unlink()
+        self._log_entries = 0
+
+    def compact(self):
+        """Consolida o histórico no arquivo principal (nada a fazer sem histórico)."""
+        with self._lock:
+            if not self.changelog_path or not self.changelog_path.exists():
+                return
+            if self._players is None:
+                self._carregar()
+            self._gravar_lista(list(self._players.values()))
+
+
+def _gravar_atomico(path, conteudo):
+    """Grava `conteudo` em um arquivo temporário no mesmo diretório e o renomeia para `path`."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
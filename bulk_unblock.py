@@ -0,0 +1,87 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # segundos, dobrado a cada nova tentativa
+
+
+def _deve_repetir(response):
+    """Indica se a falha é temporária (sem resposta, 429 ou 5xx)."""
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+class UnblockReport:
+    """
+    Resultado de uma remoção em massa.
+
+    Attributes:
+        succeeded: Jogadores desbloqueados com sucesso
+        failed: Jogadores que continuaram bloqueados
+        retried: Jogadores que precisaram de mais de uma tentativa
+    """
+    def __init__(self):
+        self.succeeded = []
+        self.failed = []
+        self.retried = []
+
+
+class BulkUnblocker:
+    """
+    Executor de desbloqueios em paralelo com novas tentativas.
+
+    O ritmo das requisições é controlado pelo limitador de taxa do cliente,
+    que reduz a velocidade quando o cliente responde 429/503. Falhas
+    temporárias são repetidas com espera exponencial.
+
+    Attributes:
+        client (LolClient): Cliente usado para os desbloqueios
+        workers: Quantidade de desbloqueios simultâneos
+        max_retries: Número máximo de novas tentativas por jogador
+        backoff: Espera inicial entre tentativas (segundos)
+    """
+    def __init__(self, client, workers=8, max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF):
+        self.client = client
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def _desbloquear(self, player):
+        """Tenta desbloquear um jogador. Retorna (sucesso, tentativas)."""
+        tentativas = 0
+        while True:
+            tentativas += 1
+            response = self.client.unblock_request(player.get('id'))
+            if response is not None and response.status_code == 204:
+                return True, tentativas
+            if tentativas > self.max_retries or not _deve_repetir(response):
+                return False, tentativas
+            time.sleep(self.backoff * 2 ** (tentativas - 1))
+
+    def run(self, players, on_result=None):
+        """
+        Desbloqueia os jogadores informados.
+
+        Args:
+            players: Lista de entradas da lista de bloqueados
+            on_result: Função opcional chamada com (jogador, sucesso, tentativas)
+
+        Returns:
+            UnblockReport: Jogadores removidos, não removidos e repetidos
+        """
+        report = UnblockReport()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futuros = {executor.submit(self._desbloquear, player): player for player in players}
+            for futuro in as_completed(futuros):
+                player = futuros[futuro]
+                try:
+                    sucesso, tentativas = futuro.result()
+                except Exception:
+                    sucesso, tentativas = False, 1
+                (report.succeeded if sucesso else report.failed).append(player)
+                if tentativas > 1:
+                    report.retried.append(player)
+                if on_result:
+                    on_result(player, sucesso, tentativas)
+
+        return report
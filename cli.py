@@ -0,0 +1,85 @@
+"""
+Linha de comando para analisar e limpar a lista de bloqueados sem interface gráfica.
+
+Exemplos:
+    python cli.py analisar --diff 3
+    python cli.py limpar --diff 3 --paralelo 8 --confirmar
+
+O resumo de cada execução é impresso em JSON na saída padrão; o log vai
+para a saída de erro.
+"""
+import argparse
+import json
+import logging
+import sys
+from motor_bloqueio import MotorBloqueios, DEFAULT_WORKERS, DEFAULT_EXPORT_FILE
+from profiler import StageProfiler
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Gerenciador de Lista de Bloqueados - LoL (modo sem interface)")
+    parser.add_argument("acao", choices=["analisar", "limpar"], help="Ação a executar")
+    parser.add_argument("--diff", type=int, default=3, help="Diferença de elo (em tiers) para remover (padrão: 3)")
+    parser.add_argument("--quantidade", type=int, default=None, help="Quantidade de jogadores a processar (padrão: todos)")
+    parser.add_argument("--paralelo", type=int, default=DEFAULT_WORKERS, help=f"Jogadores processados em paralelo (padrão: {DEFAULT_WORKERS})")
+    parser.add_argument("--elo", default=None, help="Usa este elo (ex.: \"GOLD II\") em vez do elo da conta conectada")
+    parser.add_argument("--retomar", action="store_true", help="Retoma uma execução interrompida")
+    parser.add_argument("--saida", default=DEFAULT_EXPORT_FILE, help=f"Arquivo Excel da análise (padrão: {DEFAULT_EXPORT_FILE})")
+    parser.add_argument("--csv", default=None, help="Também grava a análise em CSV durante a execução")
+    parser.add_argument("--metricas", default=None, help="Grava as métricas das requisições ao final (JSON, ou Prometheus se terminar em .prom)")
+    parser.add_argument("--perfil", default=None,
+                        help="Mede as etapas de cada jogador e grava um trace do Chrome neste arquivo (mais .folded para flame graphs)")
+    parser.add_argument("--perfil-modo", choices=["etapas", "cprofile", "amostragem"], default="etapas",
+                        help="Com --perfil, acrescenta o cProfile (.prof) ou um perfil por amostragem às etapas (padrão: etapas)")
+    parser.add_argument("--confirmar", action="store_true", help="Necessário para a ação 'limpar' remover jogadores")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Exibe o log detalhado")
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stderr
+    )
+
+    if args.acao == "limpar" and not args.confirmar:
+        print("A ação 'limpar' remove jogadores da lista de bloqueados. Use --confirmar para continuar.", file=sys.stderr)
+        return 2
+
+    modos = {"etapas": None, "cprofile": "cprofile", "amostragem": "sampling"}
+    profiler = StageProfiler(enabled=bool(args.perfil), mode=modos[args.perfil_modo])
+    motor = MotorBloqueios(workers=args.paralelo, profiler=profiler)
+    if not motor.connect():
+        print(json.dumps({"erro": "Não foi possível conectar ao cliente do League of Legends."}, ensure_ascii=False))
+        return 1
+
+    my_elo = args.elo or motor.get_account_info()['elo']
+    if not my_elo:
+        print(json.dumps({"erro": "Não foi possível determinar seu elo atual."}, ensure_ascii=False))
+        return 1
+
+    profiler.start()
+    try:
+        if args.acao == "analisar":
+            resumo = motor.analyze(my_elo, args.diff, quantidade=args.quantidade, resume=args.retomar, export_file=args.saida, csv_file=args.csv)
+        else:
+            resumo = motor.clean(my_elo, args.diff, quantidade=args.quantidade, resume=args.retomar)
+    finally:
+        profiler.stop()
+
+    if args.perfil:
+        arquivos = profiler.save(args.perfil)
+        logging.info("Tempo por etapa:\n%s", profiler.summary())
+        logging.info("Perfil gravado em: %s", ", ".join(str(arquivo) for arquivo in arquivos))
+
+    resumo.update(acao=args.acao, elo=my_elo, diff=args.diff)
+    if args.metricas:
+        motor.client.metrics.save(args.metricas)
+    print(json.dumps(resumo, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
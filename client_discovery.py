@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CREDENTIALS_FILE = "credenciais_cliente.json"
+APP_DIR_NAME = "GerenciadorBloqueio"
+# Tempo máximo do teste de conexão com credenciais conhecidas (segundos)
+DEFAULT_PING_TIMEOUT = 0.5
+# Endpoint leve usado para validar as credenciais
+PING_ENDPOINT = "/lol-summoner/v1/current-summoner"
+CLIENT_PROCESS_NAME = "LeagueClientUx.exe"
+
+# Locais de instalação conhecidos do cliente (o lockfile fica na raiz da instalação)
+KNOWN_INSTALL_DIRS = (
+    r"C:\Riot Games\League of Legends",
+    r"D:\Riot Games\League of Legends",
+    "/Applications/League of Legends.app/Contents/LoL",
+)
+
+
+def credentials_path():
+    """
+    Caminho padrão das últimas credenciais válidas, na pasta de cache do usuário.
+
+    `%LOCALAPPDATA%` no Windows e `$XDG_CACHE_HOME` (ou `~/.cache`) nos demais
+    sistemas, para o token não ficar na pasta de trabalho.
+    """
+    if os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / APP_DIR_NAME / DEFAULT_CREDENTIALS_FILE
+
+
+def lockfile_paths():
+    """
+    Caminhos candidatos do lockfile, em ordem de preferência.
+
+    `LOL_LOCKFILE` aponta diretamente para o arquivo e `LOL_INSTALL_DIR` para
+    a pasta de instalação; depois vêm os locais de instalação conhecidos.
+    """
+    caminhos = []
+    if os.environ.get("LOL_LOCKFILE"):
+        caminhos.append(Path(os.environ["LOL_LOCKFILE"]))
+    if os.environ.get("LOL_INSTALL_DIR"):
+        caminhos.append(Path(os.environ["LOL_INSTALL_DIR"]) / "lockfile")
+    caminhos.extend(Path(pasta) / "lockfile" for pasta in KNOWN_INSTALL_DIRS)
+    return caminhos
+
+
+def parse_lockfile(content):
+    """
+    Lê o conteúdo do lockfile (`nome:pid:porta:senha:protocolo`).
+
+    Returns:
+        dict: Credenciais, ou None se o conteúdo for inválido
+    """
+    partes = content.strip().split(":")
+    if len(partes) != 5:
+        return None
+    _, pid, port, password, protocol = partes
+    if not port.isdigit() or not password:
+        return None
+    return {"pid": int(pid) if pid.isdigit() else None, "port": int(port), "password": password, "protocol": protocol or "https"}
+
+
+def parse_cmdline(cmdline):
+    """Extrai a porta e o token de autenticação dos argumentos do processo do cliente."""
+    port = None
+    password = None
+    for arg in cmdline:
+        if arg.startswith("--app-port="):
+            port = arg.split("=", 1)[1]
+        elif arg.startswith("--remoting-auth-token="):
+            password = arg.split("=", 1)[1]
+    if not port or not port.isdigit() or not password:
+        return None
+    return {"port": int(port), "password": password, "protocol": "https"}
+
+
+def base_url(credentials):
+    return f"{credentials['protocol']}://127.0.0.1:{credentials['port']}"
+
+
+class ClientDiscovery:
+    """
+    Localiza a porta e o token de autenticação do cliente do LoL.
+
+    Tenta, em ordem: o lockfile da instalação, as últimas credenciais
+    usadas (validadas com uma requisição leve) e, por último, a busca pelo
+    processo do cliente, que é a opção mais lenta.
+
+    Attributes:
+        lockfiles: Caminhos candidatos do lockfile
+        cache_path: Arquivo com as últimas credenciais válidas (padrão: `credentials_path()`; False desativa)
+        ping_timeout: Tempo máximo do teste de conexão (segundos)
+        last_source: Origem das últimas credenciais ("lockfile", "cache" ou "processo")
+    """
+    def __init__(self, lockfiles=None, cache_path=None, ping_timeout=DEFAULT_PING_TIMEOUT):
+        self.lockfiles = [Path(p) for p in lockfiles] if lockfiles is not None else lockfile_paths()
+        self.cache_path = credentials_path() if cache_path is None else (Path(cache_path) if cache_path else None)
+        self.ping_timeout = ping_timeout
+        self.last_source = None
+
+    def discover(self):
+        """
+        Retorna as credenciais do cliente em execução, ou None.
+
+        Returns:
+            dict: {'port', 'password', 'protocol', 'pid'}
+        """
+        for origem, buscar, validar in (
+            ("lockfile", self._ler_lockfile, True),
+            ("cache", self._ler_cache, True),
+            ("processo", self._buscar_processo, False),
+        ):
+            credentials = buscar()
+            if credentials and (not validar or self.ping(credentials)):
+                self.last_source = origem
+                self._salvar_cache(credentials)
+                return credentials
+        self.last_source = None
+        return None
+
+    def ping(self, credentials):
+        """
+        Verifica se as credenciais são aceitas pelo cliente.
+
+        Só um 200 é aceito: outro serviço que passou a usar a porta antiga
+        responderia com outros códigos.
+        """
+        try:
+            response = requests.get(
+                base_url(credentials) + PING_ENDPOINT,
+                auth=("riot", credentials["password"]),
+                timeout=self.ping_timeout,
+                verify=False
+            )
+        except requests.RequestException:
+            return False
+        return response.status_code == 200
+
+    def invalidate(self):
+        """Descarta as credenciais salvas (ex.: depois que o cliente foi reiniciado)."""
+        if self.cache_path and self.cache_path.exists():
+            self.cache_path.unlink()
+
+    def _ler_lockfile(self):
+        for path in self.lockfiles:
+            try:
+                credentials = parse_lockfile(path.read_text(encoding="utf-8"))
+            except OSError:
+                continue
+            if credentials:
+                return credentials
+        return None
+
+    def _ler_cache(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {"port": int(data["port"]), "password": data["password"],
+                    "protocol": data.get("protocol", "https"), "pid": data.get("pid")}
+        except Exception:
+            return None
+
+    def _salvar_cache(self, credentials):
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Legível apenas pelo usuário (o token dá acesso à API do cliente)
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(dict(credentials, savedAt=time.time()), f)
+        except OSError as e:
+            logger.warning(f"Erro ao salvar credenciais do cliente: {e}")
+
+    def _buscar_processo(self):
+        """Procura o processo do cliente e lê a porta e o token da linha de comando."""
+        # Importado sob demanda para não atrasar a abertura da janela
+        import psutil
+
+        for proc in psutil.process_iter(["name"]):
+            if proc.info["name"] != CLIENT_PROCESS_NAME:
+                continue
+            try:
+                credentials = parse_cmdline(proc.cmdline())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if credentials:
+                credentials["pid"] = proc.pid
+                return credentials
+            logger.warning("Não foi possível encontrar a porta ou o token de autenticação.")
+        return None
@@ -0,0 +1,87 @@
+import threading
+import urllib.parse
+
+BLOCKED_PLAYERS_URI = "/lol-chat/v1/blocked-players"
+CURRENT_SUMMONER_URI = "/lol-summoner/v1/current-summoner"
+
+
+class ClientMirror:
+    """
+    Cópia em memória da lista de bloqueados e do invocador atual.
+
+    Carregada por completo a cada (re)assinatura dos eventos do cliente e
+    atualizada incrementalmente pelos eventos de criação, alteração e
+    remoção. Enquanto não está sincronizada (`ready` falso), as leituras
+    devem ir ao cliente. Os jogadores são indexados pelo id em texto, como
+    aparece na URI dos eventos.
+
+    Attributes:
+        ready: Se a cópia está sincronizada com o cliente
+        version: Incrementado a cada alteração da lista de bloqueados
+        summoner: Invocador atual, ou None
+    """
+    def __init__(self):
+        self.ready = False
+        self.version = 0
+        self.summoner = None
+        self._blocked = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._blocked)
+
+    def replace(self, players, summoner=None):
+        """Substitui a cópia pelo estado completo recém-carregado do cliente."""
+        with self._lock:
+            self._blocked = {str(player.get('id')): player for player in players or []}
+            self.summoner = summoner
+            self.version += 1
+            self.ready = True
+
+    def invalidate(self):
+        """Marca a cópia como desatualizada (ex.: quando a assinatura cai)."""
+        with self._lock:
+            self.ready = False
+
+    def players(self):
+        """Lista de bloqueados, na ordem do cliente."""
+        with self._lock:
+            return list(self._blocked.values())
+
+    def get(self, player_id):
+        """Retorna o jogador bloqueado com o id informado, ou None."""
+        with self._lock:
+            return self._blocked.get(str(player_id))
+
+    def remove(self, player_id):
+        """Remove um jogador desbloqueado (antes mesmo do evento chegar)."""
+        with self._lock:
+            if self._blocked.pop(str(player_id), None) is not None:
+                self.version += 1
+
+    def apply(self, event):
+        """
+        Aplica um evento da API JSON do cliente.
+
+        Args:
+            event: {'uri', 'eventType' ("Create", "Update" ou "Delete"), 'data'}
+        """
+        uri = event.get('uri') or ''
+        tipo = event.get('eventType')
+        data = event.get('data')
+
+        with self._lock:
+            if uri == CURRENT_SUMMONER_URI:
+                self.summoner = data if tipo != "Delete" else None
+            elif uri == BLOCKED_PLAYERS_URI:
+                # Alteração da coleção inteira
+                self._blocked = {str(player.get('id')): player for player in data or []} if tipo != "Delete" else {}
+                self.version += 1
+            elif uri.startswith(BLOCKED_PLAYERS_URI + "/"):
+                player_id = urllib.parse.unquote(uri[len(BLOCKED_PLAYERS_URI) + 1:])
+                if tipo == "Delete" or not isinstance(data, dict):
+                    if self._blocked.pop(player_id, None) is None:
+                        return
+                else:
+                    self._blocked[str(data.get('id', player_id))] = data
+                self.version += 1
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Tempo máximo aguardando o cliente voltar (segundos)
+DEFAULT_MAX_WAIT = 60.0
+DEFAULT_INITIAL_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 5.0
+
+
+class ConnectionSupervisor:
+    """
+    Recupera a conexão com o cliente do LoL durante uma execução.
+
+    Quando uma requisição falha por conexão recusada ou por 401 (o cliente
+    foi reiniciado e a porta ou o token mudaram), a primeira thread que
+    detecta a falha redescobre as credenciais com espera exponencial; as
+    demais requisições ficam pausadas até o fim da recuperação e então são
+    refeitas. Se o cliente não voltar em `max_wait` segundos, o cliente é
+    marcado como indisponível e as requisições falham imediatamente até a
+    próxima conexão manual.
+
+    Attributes:
+        client: LolClient supervisionado
+        max_wait: Tempo máximo aguardando o cliente voltar (segundos)
+        initial_backoff: Primeira espera entre tentativas (segundos)
+        max_backoff: Maior espera entre tentativas (segundos)
+        available: Se o cliente está disponível
+        generation: Incrementado a cada recuperação (identifica as credenciais em uso)
+        outages: Quantidade de quedas detectadas
+        on_event: Função opcional chamada com mensagens de status
+    """
+    def __init__(self, client, max_wait=DEFAULT_MAX_WAIT, initial_backoff=DEFAULT_INITIAL_BACKOFF,
+                 max_backoff=DEFAULT_MAX_BACKOFF, on_event=None):
+        self.client = client
+        self.max_wait = max_wait
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.on_event = on_event
+        self.available = True
+        self.generation = 0
+        self.outages = 0
+        self._recovering = False
+        self._ready = threading.Event()
+        self._ready.set()
+        self._lock = threading.Lock()
+
+    def _avisar(self, mensagem):
+        if self.on_event:
+            self.on_event(mensagem)
+        else:
+            logger.warning(mensagem)
+
+    def wait_ready(self):
+        """
+        Aguarda uma eventual recuperação em andamento.
+
+        Returns:
+            int: Geração das credenciais em uso, ou None se o cliente está indisponível
+        """
+        self._ready.wait()
+        with self._lock:
+            return self.generation if self.available else None
+
+    def reset(self):
+        """Marca o cliente como disponível (após uma conexão manual)."""
+        with self._lock:
+            self.available = True
+            self.generation += 1
+
+    def recover(self, generation):
+        """
+        Recupera a conexão após uma falha observada com as credenciais de `generation`.
+
+        Returns:
+            bool: True se a requisição pode ser refeita
+        """
+        with self._lock:
+            if generation != self.generation:
+                # Outra thread já recuperou a conexão depois desta falha
+                return self.available
+            lider = not self._recovering
+            if lider:
+                self._recovering = True
+                self._ready.clear()
+
+        if not lider:
+            self._ready.wait()
+            with self._lock:
+                return self.available
+
+        recuperado = False
+        try:
+            recuperado = self._redescobrir()
+        finally:
+            with self._lock:
+                self.available = recuperado
+                self.generation += 1
+                self.outages += 1
+                self._recovering = False
+                self._ready.set()
+        return recuperado
+
+    def _redescobrir(self):
+        """Procura as novas credenciais do cliente, com espera exponencial."""
+        self._avisar("Conexão com o cliente perdida. Aguardando o cliente do League of Legends...")
+        inicio = time.monotonic()
+        espera = self.initial_backoff
+        tentativas = 0
+        while True:
+            tentativas += 1
+            credentials = self.client.discovery.discover()
+            if credentials:
+                self.client.use_credentials(credentials)
+                self._avisar(f"Conexão recuperada após {time.monotonic() - inicio:.1f}s ({tentativas} tentativas).")
+                return True
+            if time.monotonic() - inicio + espera > self.max_wait:
+                self._avisar(f"Cliente indisponível após {self.max_wait:.0f}s. Interrompendo as requisições.")
+                return False
+            time.sleep(espera)
+            espera = min(espera * 2, self.max_backoff)
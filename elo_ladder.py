@@ -0,0 +1,98 @@
+"""
+Escada de elo em inteiros.
+
+Cada posição da escada equivale a uma divisão: IRON IV vale 0 e DIAMOND I
+vale 27. MASTER, GRANDMASTER e CHALLENGER não têm divisões, então ocupam
+apenas o início do seu tier (28, 32 e 36). A diferença em tiers é sempre a
+distância na escada dividida por 4.
+
+A chave de ordenação acrescenta os pontos de liga (LP) à posição na escada.
+As operações sobre o conjunto inteiro de resultados usam NumPy, carregado
+apenas quando necessário.
+"""
+# Mapeamento dos tiers para ordenação
+TIER_ORDER = {
+    'IRON': 0,
+    'BRONZE': 1,
+    'SILVER': 2,
+    'GOLD': 3,
+    'PLATINUM': 4,
+    'EMERALD': 5,
+    'DIAMOND': 6,
+    'MASTER': 7,
+    'GRANDMASTER': 8,
+    'CHALLENGER': 9
+}
+
+# Mapeamento das divisões para ordenação
+RANK_ORDER = {
+    'IV': 0,
+    'III': 1,
+    'II': 2,
+    'I': 3
+}
+
+# Valor de tier usado para jogadores sem ranked solo
+UNRANKED = -1
+
+DIVISIONS_PER_TIER = 4
+# Tiers sem divisões (MASTER, GRANDMASTER e CHALLENGER)
+APEX_TIER = TIER_ORDER['MASTER']
+# Espaço reservado para os LP em cada posição da escada (tiers altos passam de 1000 LP)
+LP_SPAN = 10000
+# Posição na escada usada para jogadores sem ranked
+UNRANKED_LADDER = -1
+
+
+def ladder_value(tier, division):
+    """Posição do elo na escada, ou UNRANKED_LADDER para jogadores sem rank."""
+    if tier == UNRANKED:
+        return UNRANKED_LADDER
+    if tier >= APEX_TIER:
+        return tier * DIVISIONS_PER_TIER
+    return tier * DIVISIONS_PER_TIER + division
+
+
+def sort_key(ladder, lp):
+    """Chave de ordenação: posição na escada e, dentro dela, os LP."""
+    if ladder == UNRANKED_LADDER:
+        return UNRANKED_LADDER
+    return ladder * LP_SPAN + lp
+
+
+def tier_difference(ladder, my_ladder):
+    """Diferença em tiers entre duas posições da escada (0 se alguma for sem rank)."""
+    if ladder == UNRANKED_LADDER or my_ladder == UNRANKED_LADDER:
+        return 0
+    return abs(ladder - my_ladder) // DIVISIONS_PER_TIER
+
+
+def tier_differences(ladders, my_ladder):
+    """Versão vetorizada de `tier_difference` para um array de posições."""
+    import numpy as np
+
+    ladders = np.asarray(ladders, dtype=np.int64)
+    if my_ladder == UNRANKED_LADDER:
+        return np.zeros(len(ladders), dtype=np.int64)
+    diffs = np.abs(ladders - my_ladder) // DIVISIONS_PER_TIER
+    diffs[ladders == UNRANKED_LADDER] = 0
+    return diffs
+
+
+def removal_mask(diffs, diff_limit):
+    """Máscara booleana dos jogadores com diferença >= `diff_limit`."""
+    import numpy as np
+
+    return np.asarray(diffs, dtype=np.int64) >= diff_limit
+
+
+def sort_order(keys, reverse=False):
+    """
+    Índices que ordenam `keys` (estável, como `sorted`).
+
+    Com `reverse`, a ordem é decrescente e os empates mantêm a ordem original.
+    """
+    import numpy as np
+
+    keys = np.asarray(keys, dtype=np.int64)
+    return np.argsort(-keys if reverse else keys, kind='stable')
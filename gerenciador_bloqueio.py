@@ -1,34 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
-import json
-import requests
-import time
-import pandas as pd
-from lol_client import LolClient
-import urllib.parse
+import logging
+from motor_bloqueio import MotorBloqueios, DEFAULT_WORKERS, MAX_WORKERS
+from log_sink import LogSink, LEVELS
 
-# Mapeamento dos tiers para ordenação
-TIER_ORDER = {
-    'IRON': 0,
-    'BRONZE': 1,
-    'SILVER': 2,
-    'GOLD': 3,
-    'PLATINUM': 4,
-    'EMERALD': 5,
-    'DIAMOND': 6,
-    'MASTER': 7,
-    'GRANDMASTER': 8,
-    'CHALLENGER': 9
-}
-
-# Mapeamento das divisões para ordenação
-RANK_ORDER = {
-    'IV': 0,
-    'III': 1,
-    'II': 2,
-    'I': 3
-}
+# Intervalo de atualização do resumo de requisições (ms)
+METRICS_INTERVAL_MS = 1000
 
 class GerenciadorBloqueios:
     """
@@ -39,8 +17,12 @@ class GerenciadorBloqueios:
     - Analisar jogadores na lista de bloqueados
     - Limpar a lista automaticamente com base em critérios de elo
     
+    A lógica de análise e limpeza fica em `MotorBloqueios`; esta classe
+    apenas lê os parâmetros dos widgets e exibe os resultados.
+    
     Attributes:
         root (tk.Tk): O widget raiz da aplicação
+        motor (MotorBloqueios): Motor de análise e limpeza
         client (LolClient): Instância para comunicação com o cliente do LoL
         region (str): Região do servidor (br1, na1, etc.)
         riot_region (str): Região da API Riot (americas, europe, etc.)
@@ -51,7 +33,11 @@ class GerenciadorBloqueios:
         self.root.geometry("800x600")
         self.root.resizable(True, True)
         
-        self.client = LolClient()
+        self.motor = MotorBloqueios(
+            on_log=self.log,
+            on_progress=lambda percentual: self.progress_var.set(percentual)
+        )
+        self.client = self.motor.client
         self.region = "br1"
         self.riot_region = "americas"
         
@@ -135,9 +121,20 @@ class GerenciadorBloqueios:
         self.users_count_entry = ttk.Entry(action_frame, textvariable=self.users_count_var, width=10)
         self.users_count_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
+        # Quantidade de jogadores processados simultaneamente
+        ttk.Label(action_frame, text="Jogadores em paralelo:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.workers_var = tk.StringVar(value=str(DEFAULT_WORKERS))
+        self.workers_spin = ttk.Spinbox(action_frame, from_=1, to=MAX_WORKERS, textvariable=self.workers_var, width=5)
+        self.workers_spin.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Retomar execução interrompida
+        self.resume_var = tk.BooleanVar(value=False)
+        self.resume_check = ttk.Checkbutton(action_frame, text="Retomar execução interrompida", variable=self.resume_var)
+        self.resume_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        
         # Botões de ação
         buttons_frame = ttk.Frame(action_frame)
-        buttons_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        buttons_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
         self.analyze_button = ttk.Button(buttons_frame, text="Analisar Bloqueados", command=self.analyze_blocked)
         self.analyze_button.pack(side=tk.LEFT, padx=5)
@@ -151,18 +148,44 @@ class GerenciadorBloqueios:
         log_frame = ttk.LabelFrame(parent_frame, text="Log", padding=10)
         log_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Nível de detalhe do log exibido
+        level_frame = ttk.Frame(log_frame)
+        level_frame.pack(fill=tk.X)
+        ttk.Label(level_frame, text="Nível:").pack(side=tk.LEFT, padx=5)
+        self.log_level_var = tk.StringVar(value="Normal")
+        self.log_level_combo = ttk.Combobox(level_frame, textvariable=self.log_level_var, values=list(LEVELS), state="readonly", width=12)
+        self.log_level_combo.pack(side=tk.LEFT, padx=5)
+        self.log_level_combo.bind("<<ComboboxSelected>>", self._alterar_nivel_log)
+        
         self.log_text = scrolledtext.ScrolledText(log_frame, height=10)
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.log_sink = LogSink(self.root, self.log_text, level=LEVELS[self.log_level_var.get()])
         
         # Barra de progresso
         self.progress_var = tk.DoubleVar()
         self.progress = ttk.Progressbar(parent_frame, variable=self.progress_var, maximum=100)
         self.progress.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Resumo das requisições ao cliente, atualizado durante a execução
+        metrics_frame = ttk.LabelFrame(parent_frame, text="Requisições (endpoints mais lentos)", padding=5)
+        metrics_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.metrics_label = ttk.Label(metrics_frame, text="-", justify=tk.LEFT, font="TkFixedFont")
+        self.metrics_label.pack(fill=tk.X)
+        self.root.after(METRICS_INTERVAL_MS, self._atualizar_metricas)
+    
+    def log(self, message, level=logging.INFO):
+        """Registra uma mensagem no log (seguro para chamadas a partir de threads)."""
+        self.log_sink.write(message, level)
+    
+    def _atualizar_metricas(self):
+        """Atualiza o resumo das requisições e agenda a próxima atualização."""
+        if self.client.metrics.endpoints:
+            self.metrics_label.config(text=self.client.metrics.summary(top=3))
+        self.root.after(METRICS_INTERVAL_MS, self._atualizar_metricas)
     
-    def log(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    def _alterar_nivel_log(self, event=None):
+        """Atualiza o nível de detalhe exibido no log."""
+        self.log_sink.level = LEVELS[self.log_level_var.get()]
     
     def connect_to_client(self):
         def connect_thread():
@@ -170,31 +193,20 @@ class GerenciadorBloqueios:
             
             self.log("Conectando ao cliente do League of Legends...")
             
-            if self.client.connect():
+            if self.motor.connect():
                 self.status_label.config(text="Conectado")
                 
-                # Obter informações do invocador
-                summoner = self.client.get_current_summoner()
-                if summoner:
-                    self.summoner_label.config(text=f"{summoner.get('displayName', '-')}")
-                    self.log(f"Conectado como: {summoner.get('displayName', '-')}")
-                
-                # Obter elo
-                ranked_stats = self.client.get_player_elo()
-                if ranked_stats:
-                    for queue in ranked_stats.get("queueMap", {}).values():
-                        if queue.get("queueType") == "RANKED_SOLO_5x5":
-                            tier = queue.get("tier", "UNRANKED")
-                            division = queue.get("division", "")
-                            if tier != "UNRANKED":
-                                self.elo_label.config(text=f"{tier} {division}")
-                                self.log(f"Elo atual: {tier} {division}")
-                            else:
-                                self.elo_label.config(text="Unranked")
-                                self.log("Elo atual: Unranked")
+                # Obter informações do invocador e elo
+                info = self.motor.get_account_info()
+                if info['summoner']:
+                    self.summoner_label.config(text=info['summoner'])
+                    self.log(f"Conectado como: {info['summoner']}")
+                if info['elo']:
+                    self.elo_label.config(text=info['elo'])
+                    self.log(f"Elo atual: {info['elo']}")
                 
                 # Carregar lista de bloqueados
-                blocked = self.client.load_blocked_players()
+                blocked = self.motor.carregar_blocklist()
                 self.blocked_label.config(text=str(len(blocked)))
                 self.log(f"Total de jogadores bloqueados: {len(blocked)}")
                 
@@ -203,254 +215,40 @@ class GerenciadorBloqueios:
                 self.clean_button.config(state=tk.NORMAL)
             else:
                 self.status_label.config(text="Falha na conexão")
-                self.log("Falha ao conectar ao cliente. Verifique se o jogo está aberto.")
+                self.log("Falha ao conectar ao cliente. Verifique se o jogo está aberto.", logging.WARNING)
                 messagebox.showerror("Erro", "Não foi possível conectar ao cliente do League of Legends. Verifique se o jogo está aberto.")
         
         threading.Thread(target=connect_thread).start()
     
-    def check_rate_limit(self):
-        time.sleep(1.2)  # Espera básica para respeitar o rate limit da API
-    
-    def get_puuid(self, game_name, tagline):
-        self.check_rate_limit()
-        
-        try:
-            # Log para diagnóstico
-            self.log(f"Tentando obter PUUID para {game_name}#{tagline}...")
-            
-            # Codificar corretamente os caracteres especiais e espaços
-            encoded_game_name = urllib.parse.quote(game_name)
-            encoded_tagline = urllib.parse.quote(tagline)
-            
-            # Tentar primeiro o endpoint v2 com LCU API - método mais direto
-            summoner_data = self.client.request("GET", f"/lol-summoner/v2/summoners/by-riot-id/{encoded_game_name}/{encoded_tagline}")
-            
-            if summoner_data and summoner_data.status_code == 200:
-                puuid = summoner_data.json().get('puuid')
-                self.log(f"PUUID obtido com sucesso usando endpoint v2.")
-                return puuid
-            
-            # Tentar obter informações via accountId
-            self.log(f"Tentando via LCU API alternativa para {game_name}...")
-            
-            # Tentar o endpoint que busca por nome exato
-            account_data = self.client.request("GET", f"/lol-summoner/v1/summoners?name={encoded_game_name}")
-            
-            if account_data and account_data.status_code == 200 and isinstance(account_data.json(), list):
-                summoners = account_data.json()
-                for summoner in summoners:
-                    # Verificamos pelo nome exato (case sensitive)
-                    if summoner.get('displayName', '').lower() == game_name.lower():
-                        puuid = summoner.get('puuid')
-                        self.log(f"PUUID obtido via nome de invocador.")
-                        return puuid
-            
-            # Tentar buscar pelo XMPP Name (nome de chat)
-            self.log("Tentando via API de chat...")
-            chat_data = self.client.request("GET", "/lol-chat/v1/friends")
-            
-            if chat_data and chat_data.status_code == 200:
-                friends = chat_data.json()
-                for friend in friends:
-                    if friend.get('name', '').lower() == game_name.lower() or friend.get('gameName', '').lower() == game_name.lower():
-                        puuid = friend.get('puuid')
-                        if puuid:
-                            self.log(f"PUUID obtido via lista de amigos.")
-                            return puuid
-            
-            # Se todas as tentativas falharam, reportar o erro
-            self.log(f"Erro ao obter PUUID após múltiplas tentativas: {summoner_data.status_code if summoner_data else 'Falha na requisição'}")
-            return None
-        except Exception as e:
-            self.log(f"Exceção ao obter PUUID: {str(e)}")
-            return None
-    
-    def get_summoner_id(self, puuid):
-        self.check_rate_limit()
-        
-        # Usar o cliente em vez da API da Riot
-        summoner_data = self.client.request("GET", f"/lol-summoner/v1/summoners/by-puuid/{puuid}")
-        
-        if summoner_data and summoner_data.status_code == 200:
-            return summoner_data.json().get('id')
-        else:
-            self.log(f"Erro ao obter Summoner ID: {summoner_data.status_code if summoner_data else 'Falha na requisição'}")
-            return None
-    
-    def get_summoner_rank(self, summoner_id):
-        self.check_rate_limit()
-        
-        # Usar o cliente em vez da API da Riot
-        ranked_data = self.client.request("GET", f"/lol-ranked/v1/ranked-stats/{summoner_id}")
-        
-        if ranked_data and ranked_data.status_code == 200:
-            # Converter do formato do cliente para o formato da API pública
-            data = ranked_data.json()
-            result = []
-            
-            for queue_type, queue_data in data.get('queueMap', {}).items():
-                if queue_type == 'RANKED_SOLO_5x5':
-                    entry = {
-                        'queueType': 'RANKED_SOLO_5x5',
-                        'tier': queue_data.get('tier', 'UNRANKED'),
-                        'rank': queue_data.get('division', 'I'),
-                        'leaguePoints': queue_data.get('leaguePoints', 0),
-                        'wins': queue_data.get('wins', 0),
-                        'losses': queue_data.get('losses', 0)
-                    }
-                    result.append(entry)
-            
-            return result
-        else:
-            self.log(f"Erro ao obter informações de rank: {ranked_data.status_code if ranked_data else 'Falha na requisição'}")
-            return None
-    
-    def sort_by_elo(self, player_data):
-        """Ordena os jogadores por elo para exibição ordenada."""
-        elo = player_data.get('Elo', 'UNRANKED I')
-        
-        if elo.lower() == 'unranked':
-            return -1  # Coloca jogadores sem rank no final
-        
-        parts = elo.split()
-        tier = parts[0].upper()  # Normaliza para maiúsculas
-        division = parts[1] if len(parts) > 1 else 'I'
-        
-        tier_value = TIER_ORDER.get(tier, -1)
-        rank_value = RANK_ORDER.get(division, 0)
-        
-        return tier_value * 10 + rank_value
-    
-    def calculate_elo_difference(self, player_elo, my_elo):
-        """Calcula a diferença de elo entre dois jogadores em tiers."""
-        if player_elo.lower() == 'unranked' or my_elo == 'UNRANKED I':
-            return 0  # Não podemos calcular a diferença para jogadores sem ranked
-        
-        # Separar tier e divisão
-        player_parts = player_elo.split()
-        my_parts = my_elo.split()
-        
-        player_tier = player_parts[0].upper()
-        player_division = player_parts[1] if len(player_parts) > 1 else 'I'
-        
-        my_tier = my_parts[0].upper()
-        my_division = my_parts[1] if len(my_parts) > 1 else 'I'
-        
-        # Converter para valores numéricos
-        player_tier_value = TIER_ORDER.get(player_tier, 0)
-        player_rank_value = RANK_ORDER.get(player_division, 0)
-        
-        my_tier_value = TIER_ORDER.get(my_tier, 0)
-        my_rank_value = RANK_ORDER.get(my_division, 0)
-        
-        # Calcular diferença (em divisões)
-        player_total = player_tier_value * 4 + player_rank_value
-        my_total = my_tier_value * 4 + my_rank_value
-        
-        return abs(player_total - my_total) // 4  # Diferença em tiers
-    
-    def _validar_quantidade_usuarios(self, total_usuarios, proposito="analisar"):
-        """Valida a quantidade de usuários a processar."""
+    def _validar_quantidade_usuarios(self, proposito="analisar"):
+        """Valida a quantidade de usuários a processar. Retorna None para todos."""
         usuarios_a_processar = self.users_count_var.get().strip()
         
         if usuarios_a_processar.lower() == "todos":
-            return total_usuarios
+            return None
         
         try:
-            usuarios_a_processar = int(usuarios_a_processar)
-            if usuarios_a_processar > total_usuarios:
-                usuarios_a_processar = total_usuarios
-            elif usuarios_a_processar < 1:
-                usuarios_a_processar = 1
+            return max(1, int(usuarios_a_processar))
         except ValueError:
             self.log(f"Valor inválido para quantidade de usuários. {proposito.capitalize()}ando todos.")
-            usuarios_a_processar = total_usuarios
-        
-        return usuarios_a_processar
+            return None
 
-    def _obter_jogadores_a_processar(self, todos_jogadores, quantidade):
-        """Retorna a lista limitada de jogadores a processar e o restante a manter."""
-        if quantidade < len(todos_jogadores):
-            return todos_jogadores[:quantidade], todos_jogadores[quantidade:]
-        return todos_jogadores, []
+    def _validar_concorrencia(self):
+        """Valida a quantidade de jogadores processados em paralelo."""
+        try:
+            workers = int(self.workers_var.get())
+        except ValueError:
+            self.log(f"Valor inválido para jogadores em paralelo. Usando {DEFAULT_WORKERS}.")
+            return DEFAULT_WORKERS
+        return max(1, min(workers, MAX_WORKERS))
 
-    def _processar_jogador(self, jogador, my_elo, diff_limit):
-        """Processa um jogador bloqueado e determina se deve ser mantido ou removido."""
-        game_name = jogador.get('gameName', '')
-        game_tag = jogador.get('gameTag', '')
-        
-        self.log(f"Processando {game_name}#{game_tag}...")
-        
-        # Tentar obter o PUUID
-        puuid = self.get_puuid(game_name, game_tag)
-        if not puuid:
-            # Tentar método alternativo sem tagline
-            self.log(f"Tentando método alternativo para {game_name}...")
-            summoner = self.get_summoner_by_name(game_name)
-            if summoner:
-                puuid = summoner.get('puuid')
-        
-        # Se não conseguiu obter PUUID
-        if not puuid:
-            self.log(f" - Mantendo {game_name}#{game_tag} (PUUID não encontrado)")
-            return None, None, "PUUID não encontrado"
-        
-        # Obter Summoner ID
-        summoner_id = self.get_summoner_id(puuid)
-        if not summoner_id:
-            self.log(f" - Mantendo {game_name}#{game_tag} (Summoner ID não encontrado)")
-            return None, None, "Summoner ID não encontrado"
-        
-        # Obter informações de ranked
-        ranked_info = self.get_summoner_rank(summoner_id)
-        if not ranked_info:
-            self.log(f" - Mantendo {game_name}#{game_tag} (sem informações de rank)")
-            return None, None, "Sem informações de rank"
-        
-        # Verificar filas ranqueadas
-        for entry in ranked_info:
-            if entry['queueType'] == 'RANKED_SOLO_5x5':
-                elo = f"{entry['tier']} {entry['rank']}"
-                diff = self.calculate_elo_difference(elo, my_elo)
-                
-                # Dados do jogador para retorno
-                player_data = {
-                    'Nome': f"{game_name}#{game_tag}",
-                    'id': jogador.get('id'),
-                    'Summoner ID': summoner_id,
-                    'puuid': puuid,
-                    'Fila': entry['queueType'],
-                    'Elo': elo,
-                    'Pontos de Liga (LP)': entry['leaguePoints'],
-                    'Vitórias': entry['wins'],
-                    'Derrotas': entry['losses'],
-                    'Winrate': f"{(entry['wins']/(entry['wins'] + entry['losses']))*100:.2f}%",
-                    'Diferença de Elo': diff
-                }
-                
-                # Decisão se deve remover
-                if diff >= diff_limit:
-                    return player_data, True, f"diferença de elo: {diff}"
-                else:
-                    return player_data, False, f"diferença de elo: {diff}"
-        
-        # Se não encontrou RANKED_SOLO_5x5
-        player_data = {
-            'Nome': f"{game_name}#{game_tag}",
-            'id': jogador.get('id'),
-            'Summoner ID': summoner_id,
-            'puuid': puuid,
-            'Fila': "",
-            'Elo': "unranked",
-            'Pontos de Liga (LP)': "",
-            'Vitórias': "",
-            'Derrotas': "",
-            'Winrate': "",
-            'Diferença de Elo': 0
-        }
-        
-        self.log(f" - Mantendo {game_name}#{game_tag} (sem ranked solo)")
-        return player_data, False, "sem ranked solo"
+    def _obter_elo_atual(self):
+        """Retorna o elo exibido na interface, ou None se ainda não foi obtido."""
+        my_elo = self.elo_label.cget("text")
+        if not my_elo or my_elo == "-":
+            messagebox.showerror("Erro", "Não foi possível determinar seu elo atual.")
+            return None
+        return my_elo
 
     def analyze_blocked(self):
         """Analisa os jogadores bloqueados e exporta para Excel."""
@@ -459,74 +257,27 @@ class GerenciadorBloqueios:
             self._desativar_botoes()
             
             # Obter elo do jogador atual
-            my_elo = self.elo_label.cget("text")
-            if not my_elo or my_elo == "-":
-                messagebox.showerror("Erro", "Não foi possível determinar seu elo atual.")
+            my_elo = self._obter_elo_atual()
+            if not my_elo:
                 self._ativar_botoes()
                 return
             
-            # Obter lista de bloqueados
-            blocked_players = self.client.load_blocked_players()
-            total = len(blocked_players)
-            
-            if total == 0:
-                self.log("Nenhum jogador bloqueado encontrado.")
-                self._ativar_botoes()
-                return
-            
-            # Determinar o número de usuários a analisar
-            users_to_analyze = self._validar_quantidade_usuarios(total, "analisar")
-            
-            self.log(f"Iniciando análise de {users_to_analyze} jogadores bloqueados...")
-            
-            # Limitar a quantidade de jogadores a analisar
-            blocked_to_analyze, _ = self._obter_jogadores_a_processar(blocked_players, users_to_analyze)
-            
-            # Lista para armazenar dados de ranked
-            ranked_data = []
-            
             # Diferença de elo para considerar na remoção
             diff_limit = int(self.elo_diff_var.get())
             
-            for i, usuario in enumerate(blocked_to_analyze):
-                # Atualizar barra de progresso
-                progress = (i + 1) / users_to_analyze * 100
-                self.progress_var.set(progress)
-                
-                game_name = usuario.get('gameName', '')
-                game_tag = usuario.get('gameTag', '')
-                
-                self.log(f"Analisando {game_name}#{game_tag} ({i+1}/{users_to_analyze})...")
-                
-                player_data, should_remove, reason = self._processar_jogador(usuario, my_elo, diff_limit)
-                
-                if player_data:
-                    ranked_data.append(player_data)
+            self.motor.workers = self._validar_concorrencia()
+            resumo = self.motor.analyze(
+                my_elo,
+                diff_limit,
+                quantidade=self._validar_quantidade_usuarios("analisar"),
+                resume=self.resume_var.get()
+            )
             
-            # Ordenar os dados
-            ranked_data_sorted = sorted(ranked_data, key=self.sort_by_elo, reverse=True)
-            
-            # Exportar os dados para Excel (para referência)
-            if ranked_data_sorted:
-                df = pd.DataFrame(ranked_data_sorted)
-                df.to_excel('ranked_info_completo.xlsx', index=False)
-                self.log("Dados exportados para 'ranked_info_completo.xlsx'")
-                
-                # Mostrar resumo
-                self.log("\nResumo da análise:")
-                
-                to_remove = [p for p in ranked_data_sorted if p['Diferença de Elo'] >= diff_limit]
-                
-                self.log(f"Total de jogadores bloqueados: {total}")
-                self.log(f"Jogadores com diferença de elo >= {diff_limit}: {len(to_remove)}")
-                self.log(f"Jogadores a manter: {total - len(to_remove)}")
-                
+            if resumo['arquivo']:
                 messagebox.showinfo("Análise Concluída", 
-                                   f"Total de jogadores bloqueados: {total}\n"
-                                   f"Jogadores com diferença de elo >= {diff_limit}: {len(to_remove)}\n"
-                                   f"Jogadores a manter: {total - len(to_remove)}")
-            else:
-                self.log("Nenhum dado para analisar.")
+                                   f"Total de jogadores bloqueados: {resumo['total']}\n"
+                                   f"Jogadores com diferença de elo >= {diff_limit}: {resumo['remover']}\n"
+                                   f"Jogadores a manter: {resumo['manter']}")
             
             # Reativar botões
             self._ativar_botoes()
@@ -536,90 +287,33 @@ class GerenciadorBloqueios:
     def clean_blocked_list(self):
         """Remove jogadores bloqueados com base na diferença de elo configurada."""
         def clean_thread():
-            self.log("Iniciando limpeza da lista de bloqueados...")
-            
             # Desativar botões durante a limpeza
             self._desativar_botoes()
             
             # Obter elo do jogador atual
-            my_elo = self.elo_label.cget("text")
-            if not my_elo or my_elo == "-":
-                messagebox.showerror("Erro", "Não foi possível determinar seu elo atual.")
+            my_elo = self._obter_elo_atual()
+            if not my_elo:
                 self._ativar_botoes()
                 return
             
-            # Carregar lista de bloqueados
-            blocked_players = self.client.load_blocked_players()
-            total = len(blocked_players)
-            
-            if total == 0:
-                self.log("Nenhum jogador bloqueado encontrado.")
-                self._ativar_botoes()
-                return
-            
-            # Determinar o número de usuários a processar
-            users_to_process = self._validar_quantidade_usuarios(total, "processar")
-            
-            self.log(f"Processando {users_to_process} de {total} jogadores bloqueados...")
-            
-            # Limitar a quantidade de jogadores a processar
-            blocked_to_process, blocked_to_keep = self._obter_jogadores_a_processar(blocked_players, users_to_process)
-            
-            # Lista para manter jogadores que não serão removidos
-            players_to_keep = blocked_to_keep.copy()  # Já inclui os que não serão processados
-            players_to_remove = []
-            
             diff_limit = int(self.elo_diff_var.get())
             
-            for i, usuario in enumerate(blocked_to_process):
-                # Atualizar barra de progresso
-                progress = (i + 1) / users_to_process * 100
-                self.progress_var.set(progress)
-                
-                game_name = usuario.get('gameName', '')
-                game_tag = usuario.get('gameTag', '')
-                
-                self.log(f"Verificando {game_name}#{game_tag} ({i+1}/{users_to_process})...")
-                
-                _, should_remove, reason = self._processar_jogador(usuario, my_elo, diff_limit)
-                
-                if should_remove:
-                    self.log(f" - Removendo {game_name}#{game_tag} ({reason})")
-                    players_to_remove.append(usuario)
-                else:
-                    self.log(f" - Mantendo {game_name}#{game_tag} ({reason})")
-                    players_to_keep.append(usuario)
-            
-            # Remover jogadores
-            removed_count = 0
-            for player in players_to_remove:
-                player_id = player.get('id')
-                if self.client.unblock_player(player_id):
-                    removed_count += 1
-                    self.log(f"Removido com sucesso: {player.get('gameName')}#{player.get('gameTag')}")
-                else:
-                    self.log(f"Falha ao remover: {player.get('gameName')}#{player.get('gameTag')}")
-                    players_to_keep.append(player)
+            self.motor.workers = self._validar_concorrencia()
+            resumo = self.motor.clean(
+                my_elo,
+                diff_limit,
+                quantidade=self._validar_quantidade_usuarios("processar"),
+                resume=self.resume_var.get()
+            )
+            
+            if resumo['total'] > 0:
+                # Atualizar contagem de bloqueados
+                self.blocked_label.config(text=str(resumo['mantidos']))
                 
-                time.sleep(0.5)  # Pequena pausa para não sobrecarregar o cliente
-            
-            # Atualizar arquivo JSON
-            if self.client.save_blocked_players(players_to_keep):
-                self.log("Arquivo de bloqueados atualizado com sucesso.")
-            else:
-                self.log("Erro ao atualizar arquivo de bloqueados.")
-            
-            # Atualizar contagem de bloqueados
-            self.blocked_label.config(text=str(len(players_to_keep)))
-            
-            self.log(f"\nLimpeza concluída:")
-            self.log(f"Jogadores removidos: {removed_count}")
-            self.log(f"Jogadores mantidos: {len(players_to_keep)}")
-            
-            messagebox.showinfo("Limpeza Concluída", 
-                               f"Total de jogadores bloqueados originalmente: {total}\n"
-                               f"Jogadores removidos: {removed_count}\n"
-                               f"Jogadores mantidos: {len(players_to_keep)}")
+                messagebox.showinfo("Limpeza Concluída", 
+                                   f"Total de jogadores bloqueados originalmente: {resumo['total']}\n"
+                                   f"Jogadores removidos: {resumo['removidos']}\n"
+                                   f"Jogadores mantidos: {resumo['mantidos']}")
             
             # Reativar botões
             self._ativar_botoes()
@@ -642,76 +336,6 @@ class GerenciadorBloqueios:
         self.analyze_button.config(state=tk.NORMAL)
         self.clean_button.config(state=tk.NORMAL)
 
-    def get_summoner_by_name(self, game_name):
-        """Tenta obter o invocador usando apenas o nome de exibição"""
-        self.check_rate_limit()
-        
-        try:
-            encoded_name = urllib.parse.quote(game_name)
-            
-            # Tentar primeiro pelo endpoint específico
-            self.log(f"Buscando invocador por nome exato: {game_name}")
-            response = self.client.request("GET", f"/lol-summoner/v1/summoners?name={encoded_name}")
-            
-            if response and response.status_code == 200:
-                summoners = response.json()
-                if isinstance(summoners, list) and summoners:
-                    # Procurar por correspondência exata ou parcial
-                    for summoner in summoners:
-                        display_name = summoner.get('displayName', '')
-                        if display_name.lower() == game_name.lower():
-                            self.log(f"Invocador encontrado: {display_name}")
-                            return summoner
-                    
-                    # Se não encontrou correspondência exata, use a primeira
-                    self.log(f"Usando primeira correspondência: {summoners[0].get('displayName')}")
-                    return summoners[0]
-            
-            # Tentar via a lista de bloqueados
-            self.log("Tentando buscar nas informações da lista de bloqueados...")
-            blocked = self.client.load_blocked_players()
-            for blocked_user in blocked:
-                if blocked_user.get('gameName', '').lower() == game_name.lower():
-                    # Encontrado o usuário bloqueado, tentar obter seu summoner_id
-                    if 'id' in blocked_user:
-                        self.log(f"Encontrado na lista de bloqueados, tentando obter summonerId")
-                        summoner_info = self.client.request("GET", f"/lol-chat/v1/blocked-players/{blocked_user['id']}")
-                        if summoner_info and summoner_info.status_code == 200:
-                            return summoner_info.json()
-            
-            self.log(f"Nenhum invocador encontrado com o nome: {game_name}")
-            return None
-        except Exception as e:
-            self.log(f"Erro ao buscar invocador por nome: {str(e)}")
-            return None
-
-    def reconnect_client(self):
-        self.log("Tentando reconectar ao cliente do League of Legends...")
-        if self.client.connect():
-            self.log("Reconexão bem-sucedida!")
-            return True
-        else:
-            self.log("Falha na reconexão.")
-            return False
-
-    def get_blocked_player_info(self, player_id):
-        """Obtém informações do jogador bloqueado diretamente pelo ID"""
-        self.check_rate_limit()
-        
-        try:
-            response = self.client.request("GET", f"/lol-chat/v1/blocked-players/{player_id}")
-            
-            if response and response.status_code == 200:
-                player_info = response.json()
-                self.log(f"Informações obtidas para jogador bloqueado ID: {player_id}")
-                return player_info
-            else:
-                self.log(f"Erro ao obter informações do jogador bloqueado: {response.status_code if response else 'Falha na requisição'}")
-                return None
-        except Exception as e:
-            self.log(f"Erro ao obter informações do jogador bloqueado: {str(e)}")
-            return None
-
 if __name__ == "__main__":
     root = tk.Tk()
     app = GerenciadorBloqueios(root)
@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Validade das entradas em segundos
+FOUND_TTL = 30 * 24 * 3600      # Identidades encontradas quase nunca mudam
+NOT_FOUND_TTL = 24 * 3600       # "Não encontrado" pode mudar (ex.: cliente reiniciado)
+MAX_ENTRIES = 50000
+
+
+def _summoner_id(valor):
+    """Devolve o id no tipo usado pelo cliente (a coluna TEXT converte números em texto)."""
+    if isinstance(valor, str) and valor.isdigit():
+        return int(valor)
+    return valor
+
+
+class IdentityCache:
+    """
+    Cache local (SQLite) de identidades de jogadores bloqueados.
+
+    Cada identidade é gravada com duas chaves: o `id` da lista de bloqueados
+    e o Riot ID (`gameName#gameTag`, sem diferenciar maiúsculas). Também
+    guarda resultados negativos ("não encontrado") com validade menor.
+
+    Attributes:
+        path: Caminho do arquivo do banco de dados
+        found_ttl: Validade das identidades encontradas (segundos)
+        not_found_ttl: Validade dos resultados negativos (segundos)
+        max_entries: Quantidade máxima de linhas mantidas após a limpeza
+    """
+    def __init__(self, path="identidades.db", found_ttl=FOUND_TTL,
+                 not_found_ttl=NOT_FOUND_TTL, max_entries=MAX_ENTRIES):
+        self.path = Path(path)
+        self.found_ttl = found_ttl
+        self.not_found_ttl = not_found_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS identities ("
+            " key TEXT PRIMARY KEY,"
+            " puuid TEXT,"
+            " summoner_id TEXT,"
+            " found INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _chaves(player_id, game_name, game_tag):
+        """Monta as chaves de busca de um jogador."""
+        chaves = []
+        if player_id:
+            chaves.append(f"id:{player_id}")
+        if game_name:
+            chaves.append(f"name:{game_name.lower()}#{(game_tag or '').lower()}")
+        return chaves
+
+    def get(self, player_id, game_name, game_tag):
+        """
+        Retorna a identidade em cache ou None se não houver entrada válida.
+
+        O resultado é um dicionário com `puuid`, `summoner_id` e `found`.
+        """
+        chaves = self._chaves(player_id, game_name, game_tag)
+        if not chaves:
+            return None
+
+        agora = time.time()
+        with self._lock:
+            for chave in chaves:
+                row = self._conn.execute(
+                    "SELECT puuid, summoner_id, found, updated_at FROM identities WHERE key = ?",
+                    (chave,)
+                ).fetchone()
+                if not row:
+                    continue
+                puuid, summoner_id, found, updated_at = row
+                ttl = self.found_ttl if found else self.not_found_ttl
+                if agora - updated_at > ttl:
+                    continue
+                return {"puuid": puuid, "summoner_id": _summoner_id(summoner_id), "found": bool(found)}
+        return None
+
+    def put(self, player_id, game_name, game_tag, puuid=None, summoner_id=None):
+        """Grava uma identidade. Sem `summoner_id`, a entrada é considerada negativa."""
+        found = 1 if puuid and summoner_id else 0
+        agora = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO identities (key, puuid, summoner_id, found, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(chave, puuid, summoner_id, found, agora)
+                 for chave in self._chaves(player_id, game_name, game_tag)]
+            )
+            self._conn.commit()
+
+    def invalidate(self, player_id, game_name, game_tag):
+        """Remove as entradas de um jogador."""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM identities WHERE key = ?",
+                [(chave,) for chave in self._chaves(player_id, game_name, game_tag)]
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """Remove entradas expiradas e as mais antigas acima do limite. Retorna o total removido."""
+        agora = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM identities WHERE (found = 1 AND updated_at < ?)"
+                " OR (found = 0 AND updated_at < ?)",
+                (agora - self.found_ttl, agora - self.not_found_ttl)
+            )
+            removidos = cursor.rowcount
+            cursor = self._conn.execute(
+                "DELETE FROM identities WHERE key IN ("
+                " SELECT key FROM identities ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            removidos += cursor.rowcount
+            self._conn.commit()
+        return removidos
+
+    def close(self):
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,262 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import socket
+import ssl
+import struct
+import threading
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+# Eventos da API JSON do cliente (WAMP sobre WebSocket)
+BLOCKED_PLAYERS_EVENT = "OnJsonApiEvent_lol-chat_v1_blocked-players"
+CURRENT_SUMMONER_EVENT = "OnJsonApiEvent_lol-summoner_v1_current-summoner"
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_INITIAL_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 30.0
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_CONTINUACAO = 0x0
+_OP_TEXTO = 0x1
+_OP_BINARIO = 0x2
+_OP_FECHAR = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+
+class WebSocketError(Exception):
+    """Falha no handshake ou no protocolo do WebSocket."""
+
+
+def accept_key(key):
+    """Valor esperado em `Sec-WebSocket-Accept` para a chave enviada no handshake."""
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode("ascii")).digest()).decode("ascii")
+
+
+def _mascarar(payload, mascara):
+    """Aplica (ou remove) a máscara de 4 bytes do WebSocket."""
+    if not payload:
+        return b""
+    n = len(payload)
+    repetida = (mascara * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repetida, "big")).to_bytes(n, "big")
+
+
+def encode_frame(opcode, payload):
+    """Monta um frame final do cliente (frames do cliente são sempre mascarados)."""
+    cabecalho = bytearray([0x80 | opcode])
+    n = len(payload)
+    if n < 126:
+        cabecalho.append(0x80 | n)
+    elif n < 1 << 16:
+        cabecalho.append(0x80 | 126)
+        cabecalho += struct.pack("!H", n)
+    else:
+        cabecalho.append(0x80 | 127)
+        cabecalho += struct.pack("!Q", n)
+    mascara = os.urandom(4)
+    return bytes(cabecalho) + mascara + _mascarar(payload, mascara)
+
+
+class LcuEventStream:
+    """
+    Assinatura dos eventos da API JSON do cliente do LoL via WebSocket.
+
+    Conecta ao mesmo endereço e token da API REST, assina os `topics`
+    (mensagens WAMP `[5, tópico]`) e entrega o conteúdo de cada evento
+    `[8, tópico, evento]` para `on_event`. Após cada (re)assinatura,
+    `on_subscribed` é chamado para que o estado seja recarregado por
+    completo; quando a conexão cai, `on_closed` é chamado e a conexão é
+    refeita em segundo plano com espera exponencial.
+
+    Implementado com a biblioteca padrão (RFC 6455), apenas com o que o
+    cliente usa: frames de texto, fragmentação, ping/pong e fechamento.
+
+    Attributes:
+        url: Endereço da API do cliente (http:// ou https://)
+        topics: Eventos assinados
+        connected: Se a assinatura está ativa
+        subscriptions: Quantidade de assinaturas feitas (inclusive reconexões)
+    """
+    def __init__(self, url, password, topics, on_event, on_subscribed=None, on_closed=None,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, initial_backoff=DEFAULT_INITIAL_BACKOFF,
+                 max_backoff=DEFAULT_MAX_BACKOFF):
+        self.url = url
+        self.password = password
+        self.topics = list(topics)
+        self.on_event = on_event
+        self.on_subscribed = on_subscribed
+        self.on_closed = on_closed
+        self.connect_timeout = connect_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.connected = False
+        self.subscriptions = 0
+        self._sock = None
+        self._buffer = bytearray()
+        self._send_lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Inicia a assinatura em uma thread de segundo plano."""
+        if self._thread is None:
+            self._parar.clear()
+            self._thread = threading.Thread(target=self._executar, name="eventos-lcu", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Encerra a assinatura e a thread de segundo plano."""
+        self._parar.set()
+        self._fechar_socket()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.connect_timeout)
+        self._thread = None
+
+    def _executar(self):
+        espera = self.initial_backoff
+        while not self._parar.is_set():
+            try:
+                self._conectar()
+                for topic in self.topics:
+                    self._enviar(_OP_TEXTO, json.dumps([WAMP_SUBSCRIBE, topic]).encode("utf-8"))
+                self.connected = True
+                self.subscriptions += 1
+                espera = self.initial_backoff
+                if self.on_subscribed:
+                    self.on_subscribed()
+                self._ler_eventos()
+            except (OSError, WebSocketError) as e:
+                if self.connected and not self._parar.is_set():
+                    logger.warning(f"Conexão de eventos do cliente encerrada: {e}")
+            finally:
+                foi_conectado, self.connected = self.connected, False
+                self._fechar_socket()
+                # Depois de stop() a cópia pertence à nova assinatura, então não é invalidada aqui
+                if foi_conectado and self.on_closed and not self._parar.is_set():
+                    self.on_closed()
+            if self._parar.wait(espera):
+                break
+            espera = min(espera * 2, self.max_backoff)
+
+    def _conectar(self):
+        """Abre o socket e faz o handshake do WebSocket com autenticação básica."""
+        url = urllib.parse.urlsplit(self.url)
+        sock = socket.create_connection((url.hostname, url.port), timeout=self.connect_timeout)
+        if url.scheme == "https":
+            # O cliente do LoL usa um certificado autoassinado
+            contexto = ssl.create_default_context()
+            contexto.check_hostname = False
+            contexto.verify_mode = ssl.CERT_NONE
+            sock = contexto.wrap_socket(sock, server_hostname=url.hostname)
+        self._sock = sock
+        self._buffer = bytearray()
+
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        auth = base64.b64encode(f"riot:{self.password}".encode("utf-8")).decode("ascii")
+        sock.sendall((
+            f"GET / HTTP/1.1\r\n"
+            f"Host: {url.hostname}:{url.port}\r\n"
+            f"Upgrade: websocket\r\n"
+            f"Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            f"Sec-WebSocket-Version: 13\r\n"
+            f"Authorization: Basic {auth}\r\n\r\n"
+        ).encode("ascii"))
+
+        while b"\r\n\r\n" not in self._buffer:
+            self._receber()
+        fim = self._buffer.index(b"\r\n\r\n")
+        linhas = self._buffer[:fim].decode("latin-1").split("\r\n")
+        del self._buffer[:fim + 4]
+
+        status = linhas[0].split(" ", 2)
+        if len(status) < 2 or status[1] != "101":
+            raise WebSocketError(f"handshake recusado: {linhas[0]}")
+        cabecalhos = {nome.strip().lower(): valor.strip() for nome, _, valor in (l.partition(":") for l in linhas[1:])}
+        if cabecalhos.get("sec-websocket-accept") != accept_key(key):
+            raise WebSocketError("Sec-WebSocket-Accept inválido")
+        # Após o handshake, a leitura bloqueia até chegar um evento (stop() fecha o socket)
+        sock.settimeout(None)
+
+    def _receber(self):
+        sock = self._sock
+        if sock is None:
+            raise WebSocketError("conexão encerrada")
+        dados = sock.recv(65536)
+        if not dados:
+            raise WebSocketError("conexão fechada pelo cliente")
+        self._buffer += dados
+
+    def _ler_exato(self, n):
+        while len(self._buffer) < n:
+            self._receber()
+        dados = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return dados
+
+    def _ler_frame(self):
+        """Lê um frame. Returns: (final, opcode, conteúdo)"""
+        b0, b1 = self._ler_exato(2)
+        n = b1 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", self._ler_exato(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", self._ler_exato(8))[0]
+        mascara = self._ler_exato(4) if b1 & 0x80 else None
+        payload = self._ler_exato(n)
+        if mascara:
+            payload = _mascarar(payload, mascara)
+        return bool(b0 & 0x80), b0 & 0x0F, payload
+
+    def _ler_mensagens(self):
+        """Gera as mensagens de texto recebidas, respondendo ping e fechamento."""
+        partes = []
+        while True:
+            final, opcode, payload = self._ler_frame()
+            if opcode == _OP_PING:
+                self._enviar(_OP_PONG, payload)
+            elif opcode == _OP_FECHAR:
+                self._enviar(_OP_FECHAR, payload[:2])
+                return
+            elif opcode in (_OP_TEXTO, _OP_BINARIO, _OP_CONTINUACAO):
+                partes.append(payload)
+                if final:
+                    yield b"".join(partes)
+                    partes = []
+
+    def _ler_eventos(self):
+        for mensagem in self._ler_mensagens():
+            try:
+                dados = json.loads(mensagem)
+            except ValueError:
+                continue
+            if isinstance(dados, list) and len(dados) == 3 and dados[0] == WAMP_EVENT and isinstance(dados[2], dict):
+                try:
+                    self.on_event(dados[2])
+                except Exception as e:
+                    logger.warning(f"Erro ao processar evento do cliente: {e}")
+        raise WebSocketError("conexão encerrada pelo cliente")
+
+    def _enviar(self, opcode, payload):
+        sock = self._sock
+        if sock is None:
+            raise WebSocketError("conexão encerrada")
+        with self._send_lock:
+            sock.sendall(encode_frame(opcode, payload))
+
+    def _fechar_socket(self):
+        sock, self._sock = self._sock, None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
@@ -0,0 +1,80 @@
+import logging
+import queue
+import time
+import tkinter as tk
+
+DEFAULT_LOG_FILE = "gerenciador_bloqueio.log"
+DEFAULT_MAX_LINES = 1000
+DEFAULT_INTERVAL_MS = 100
+MAX_BATCH = 500
+
+# Níveis disponíveis na interface
+LEVELS = {
+    "Detalhado": logging.DEBUG,
+    "Normal": logging.INFO,
+    "Apenas erros": logging.WARNING,
+}
+
+
+class LogSink:
+    """
+    Destino de log seguro para uso a partir de várias threads.
+
+    As mensagens são colocadas em uma fila e o loop principal do Tk as
+    descarrega em lotes via `root.after`. O widget mantém apenas as últimas
+    `max_lines` linhas, enquanto o log completo (todos os níveis) é gravado
+    em arquivo.
+
+    Attributes:
+        widget: Widget de texto que exibe o log
+        level: Nível mínimo exibido no widget
+        path: Arquivo com o log completo
+        max_lines: Quantidade máxima de linhas mantidas no widget
+    """
+    def __init__(self, root, widget, path=DEFAULT_LOG_FILE, level=logging.INFO,
+                 max_lines=DEFAULT_MAX_LINES, interval_ms=DEFAULT_INTERVAL_MS):
+        self.root = root
+        self.widget = widget
+        self.level = level
+        self.path = path
+        self.max_lines = max_lines
+        self.interval_ms = interval_ms
+        self._queue = queue.Queue()
+        self._file = open(path, 'a', encoding='utf-8')
+        self.root.after(self.interval_ms, self._drain)
+
+    def write(self, message, level=logging.INFO):
+        """Enfileira uma mensagem. Pode ser chamado de qualquer thread."""
+        self._queue.put((time.time(), level, message))
+
+    def _drain(self):
+        """Descarrega um lote de mensagens no arquivo e no widget (thread do Tk)."""
+        linhas_arquivo = []
+        linhas_widget = []
+        try:
+            for _ in range(MAX_BATCH):
+                ts, level, message = self._queue.get_nowait()
+                horario = time.strftime('%H:%M:%S', time.localtime(ts))
+                linhas_arquivo.append(f"{horario} {logging.getLevelName(level)} {message}\n")
+                if level >= self.level:
+                    linhas_widget.append(f"{message}\n")
+        except queue.Empty:
+            pass
+
+        if linhas_arquivo:
+            self._file.writelines(linhas_arquivo)
+            self._file.flush()
+
+        if linhas_widget:
+            self.widget.insert(tk.END, "".join(linhas_widget))
+            # Manter apenas as últimas linhas no widget
+            excesso = int(self.widget.index('end-1c').split('.')[0]) - self.max_lines
+            if excesso > 0:
+                self.widget.delete('1.0', f'{excesso + 1}.0')
+            self.widget.see(tk.END)
+
+        self.root.after(self.interval_ms, self._drain)
+
+    def close(self):
+        """Fecha o arquivo de log."""
+        self._file.close()
@@ -1,14 +1,45 @@
+import logging
 import requests
 import base64
 import urllib3
-import psutil
 import time
-import json
-from pathlib import Path
+import threading
+from requests.adapters import HTTPAdapter
+from rate_limiter import RateLimiter, BACKOFF_STATUS
+from batcher import RequestBatcher, DEFAULT_BATCH_SIZE, DEFAULT_BATCH_DELAY
+from blocklist_store import BlocklistStore, DEFAULT_CHANGELOG_FILE
+from request_metrics import RequestMetrics
+from client_discovery import ClientDiscovery, base_url
+from connection_supervisor import ConnectionSupervisor
+from client_mirror import ClientMirror
+from lcu_events import LcuEventStream, BLOCKED_PLAYERS_EVENT, CURRENT_SUMMONER_EVENT
+
+logger = logging.getLogger(__name__)
+
+# Quantas vezes uma requisição é refeita após recuperar a conexão
+MAX_REPLAYS = 3
+# Quantas vezes uma requisição respondida com 429/503 é refeita
+MAX_RATE_RETRIES = 3
 
 # Desabilitar avisos de SSL - o cliente do LoL usa um certificado autoassinado
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Indica que a requisição falhou por conexão recusada ou interrompida
+_CONEXAO_PERDIDA = object()
+
+class LookupFailed(Exception):
+    """A consulta não teve resposta conclusiva (falha de conexão, 429/5xx etc.)."""
+
+
+def _tamanho_corpo(body):
+    """Tamanho em bytes do corpo enviado (o requests pode guardá-lo como str)."""
+    if not body:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(body)
+
+
 class LolClient:
     """
     Classe para comunicação com o cliente do League of Legends.
@@ -17,86 +48,221 @@ class LolClient:
     sobre o jogador atual, gerenciar lista de bloqueados e outras operações.
     
     Attributes:
-        process: Processo do cliente do LoL
+        discovery: Localizador da porta e do token do cliente (lockfile, cache ou processo)
+        pid: PID do processo do cliente, quando conhecido
         auth: Token de autenticação codificado em base64
         port: Porta em que o cliente está operando
         base_url: URL base para as requisições
         connected: Status da conexão com o cliente
-        blocklist_file: Caminho para o arquivo de bloqueados
+        blocklist_store: Cópia local da lista de bloqueados (`bloqueados.json` e o histórico de alterações)
+        pool_size: Número máximo de conexões keep-alive mantidas abertas
+        transport: Adapter HTTP opcional (ex.: para apontar para um servidor local de testes)
+        session: Sessão HTTP persistente compartilhada entre as threads
+        rate_limiter: Limitador de taxa compartilhado por família de endpoint
+        summoner_batcher: Agrupador das consultas de invocador por PUUID
+        metrics: Métricas de latência, status e erros por endpoint
+        supervisor: Recupera a conexão quando o cliente é reiniciado durante a execução
+        mirror: Cópia da lista de bloqueados e do invocador atual mantida pelos eventos do cliente
+        events: Assinatura dos eventos do cliente (None se `live_events` for falso)
     """
-    def __init__(self):
-        self.process = None
+    def __init__(self, pool_size=10, transport=None, rate_limiter=None,
+                 batch_size=DEFAULT_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY, blocklist_store=None,
+                 discovery=None, live_events=True):
+        self.discovery = discovery or ClientDiscovery()
+        self.pid = None
         self.auth = None
         self.port = None
         self.base_url = None
         self.connected = False
-        self.blocklist_file = Path("bloqueados.json")
+        self.blocklist_store = blocklist_store or BlocklistStore(changelog_path=DEFAULT_CHANGELOG_FILE)
+        self.pool_size = pool_size
+        self.transport = transport
+        self.session = None
+        self._session_lock = threading.Lock()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.metrics = RequestMetrics()
+        self.supervisor = ConnectionSupervisor(self)
+        self.live_events = live_events
+        self.mirror = ClientMirror()
+        self.events = None
+        self._versao_salva = None
+        self.summoner_batcher = RequestBatcher(
+            self._buscar_summoners_por_puuids,
+            self._buscar_summoner_por_puuid,
+            batch_size=batch_size,
+            batch_delay=batch_delay
+        )
 
     def connect(self):
-        """Conecta ao cliente do LoL procurando o processo em execução"""
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            if proc.name() == "LeagueClientUx.exe":
-                self.process = proc
-                break
-        
-        if not self.process:
-            print("Cliente do League of Legends não está em execução.")
-            return False
-        
-        # Extrair porta e token de autenticação dos argumentos de linha de comando
-        cmdline = self.process.cmdline()
-        port = None
-        password = None
-        
-        for arg in cmdline:
-            if "--app-port" in arg:
-                port = arg.split("=")[1]
-            if "--remoting-auth-token" in arg:
-                password = arg.split("=")[1]
-        
-        if not port or not password:
-            print("Não foi possível encontrar a porta ou o token de autenticação.")
+        """
+        Conecta ao cliente do LoL.
+
+        Usa o lockfile da instalação ou as últimas credenciais válidas e só
+        recorre à busca pelo processo do cliente (mais lenta) se necessário.
+        """
+        credentials = self.discovery.discover()
+        if not credentials:
+            logger.warning("Cliente do League of Legends não está em execução.")
             return False
-        
-        self.port = port
+
+        self.use_credentials(credentials)
+        self.supervisor.reset()
+        return True
+
+    def use_credentials(self, credentials):
+        """Aponta o cliente para as credenciais encontradas pelo `discovery`."""
+        self.pid = credentials.get("pid")
+        self.use_endpoint(base_url(credentials), credentials["password"])
+
+    @property
+    def available(self):
+        """Se o cliente está acessível (False depois que o supervisor desiste de reconectar)."""
+        return self.connected and self.supervisor.available
+
+    def use_endpoint(self, base_url, password):
+        """Configura manualmente o endereço e o token do cliente.
+
+        Usado pelo `connect` e também para apontar o cliente para um
+        servidor local que simula a API do LoL.
+        """
+        self.port = base_url.rsplit(":", 1)[-1].rstrip("/")
         auth_string = f"riot:{password}"
         self.auth = base64.b64encode(auth_string.encode()).decode()
-        self.base_url = f"https://127.0.0.1:{port}"
+        self.base_url = base_url.rstrip("/")
+        self._reset_session()
         self.connected = True
-        return True
+        if self.live_events:
+            self._assinar_eventos(password)
+
+    def _assinar_eventos(self, password):
+        """(Re)inicia a assinatura dos eventos com as credenciais atuais."""
+        if self.events is not None:
+            self.events.stop()
+        self.mirror.invalidate()
+        self.events = LcuEventStream(
+            self.base_url, password, (BLOCKED_PLAYERS_EVENT, CURRENT_SUMMONER_EVENT),
+            on_event=self.mirror.apply,
+            on_subscribed=self._sincronizar_espelho,
+            on_closed=self.mirror.invalidate
+        )
+        self.events.start()
+
+    def _sincronizar_espelho(self):
+        """Recarrega a cópia completa após cada (re)assinatura dos eventos."""
+        blocked_list = self._buscar_bloqueados()
+        if blocked_list is not None:
+            self.mirror.replace(blocked_list, self._buscar_invocador_atual())
+
+    def _criar_sessao(self):
+        """Cria a sessão HTTP com pool de conexões e cabeçalhos fixos."""
+        session = requests.Session()
+        adapter = self.transport or HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept": "application/json",
+            "Authorization": f"Basic {self.auth}"
+        })
+        session.verify = False
+        return session
+
+    def _obter_sessao(self):
+        """Retorna a sessão atual, criando-a na primeira utilização."""
+        with self._session_lock:
+            if self.session is None:
+                self.session = self._criar_sessao()
+            return self.session
+
+    def _reset_session(self):
+        """Descarta a sessão atual (ex.: quando as credenciais mudam)."""
+        with self._session_lock:
+            if self.session is not None:
+                self.session.close()
+            self.session = None
+
+    def close(self):
+        """Fecha as conexões abertas com o cliente e consolida o histórico da cópia local."""
+        if self.events is not None:
+            self.events.stop()
+            self.events = None
+        self.mirror.invalidate()
+        self._reset_session()
+        self.blocklist_store.compact()
 
     def request(self, method, endpoint, data=None):
-        """Faz uma requisição para a API do cliente"""
+        """
+        Faz uma requisição para a API do cliente.
+        
+        Se a conexão for recusada ou o token rejeitado (401), por exemplo
+        porque o cliente foi reiniciado, a requisição aguarda o supervisor
+        encontrar as novas credenciais e é refeita. Respostas 429/503 também
+        são refeitas (até MAX_RATE_RETRIES vezes), depois da espera imposta
+        pelo limitador de taxa e pelo Retry-After.
+        """
         if not self.connected:
             if not self.connect():
                 return None
         
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Basic {self.auth}"
-        }
-        
+        replays = 0
+        tentativas_taxa = 0
+        while True:
+            geracao = self.supervisor.wait_ready()
+            if geracao is None:
+                return None
+            response = self._enviar(method, endpoint, data)
+            if response is _CONEXAO_PERDIDA or (response is not None and response.status_code == 401):
+                if replays < MAX_REPLAYS and self.supervisor.recover(geracao):
+                    replays += 1
+                    continue
+            elif response is not None and response.status_code in BACKOFF_STATUS and tentativas_taxa < MAX_RATE_RETRIES:
+                # O limitador já reduziu a taxa (e registrou o Retry-After); a próxima aquisição espera por eles
+                tentativas_taxa += 1
+                continue
+            break
+        return None if response is _CONEXAO_PERDIDA else response
+    
+    def _enviar(self, method, endpoint, data):
+        """Envia uma requisição. Retorna a resposta, None ou _CONEXAO_PERDIDA."""
         url = f"{self.base_url}{endpoint}"
+        session = self._obter_sessao()
+        espera = self.rate_limiter.acquire(endpoint)
         
+        inicio = time.perf_counter()
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, verify=False)
+                response = session.get(url)
             elif method.upper() == "POST":
-                headers["Content-Type"] = "application/json"
-                response = requests.post(url, headers=headers, json=data, verify=False)
+                response = session.post(url, json=data)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers, verify=False)
+                response = session.delete(url)
             else:
-                print(f"Método não suportado: {method}")
+                logger.error(f"Método não suportado: {method}")
                 return None
             
+            self.metrics.record(
+                method, endpoint, time.perf_counter() - inicio, espera,
+                status=response.status_code,
+                bytes_sent=_tamanho_corpo(response.request.body),
+                bytes_received=len(response.content)
+            )
+            self.rate_limiter.feedback(endpoint, response)
             return response
+        except requests.ConnectionError as e:
+            self.metrics.record(method, endpoint, time.perf_counter() - inicio, espera, exception=type(e).__name__)
+            logger.warning(f"Erro na requisição: {e}")
+            return _CONEXAO_PERDIDA
         except Exception as e:
-            print(f"Erro na requisição: {e}")
+            self.metrics.record(method, endpoint, time.perf_counter() - inicio, espera, exception=type(e).__name__)
+            logger.warning(f"Erro na requisição: {e}")
             return None
     
     def get_current_summoner(self):
         """Obter informações do invocador atual"""
+        if self.mirror.ready and self.mirror.summoner:
+            return self.mirror.summoner
+        return self._buscar_invocador_atual()
+
+    def _buscar_invocador_atual(self):
         response = self.request("GET", "/lol-summoner/v1/current-summoner")
         if response and response.status_code == 200:
             return response.json()
@@ -111,52 +277,98 @@ class LolClient:
     
     def unblock_player(self, player_id):
         """Desbloquear um jogador pelo ID"""
-        endpoint = f"/lol-chat/v1/blocked-players/{player_id}"
-        response = self.request("DELETE", endpoint)
+        response = self.unblock_request(player_id)
         return response and response.status_code == 204
     
+    def unblock_request(self, player_id):
+        """Envia o desbloqueio e retorna a resposta completa (ou None)"""
+        response = self.request("DELETE", f"/lol-chat/v1/blocked-players/{player_id}")
+        if response is not None and response.status_code == 204:
+            self.mirror.remove(player_id)
+        return response
+    
     def load_blocked_players(self):
-        """Carrega a lista de jogadores bloqueados."""
-        # Primeiro tenta obter a lista do cliente
-        response = self.request("GET", "/lol-chat/v1/blocked-players")
+        """
+        Carrega a lista de jogadores bloqueados.
         
-        if response and response.status_code == 200:
-            blocked_list = response.json()
-            
-            # Salva a lista atualizada para uso futuro
-            if blocked_list:
-                with open(self.blocklist_file, 'w', encoding='utf-8') as f:
-                    json.dump({"usuariosBlock": blocked_list}, f, ensure_ascii=False, indent=2)
-            
-            return blocked_list
+        Com a assinatura de eventos ativa, a lista vem da cópia em memória;
+        caso contrário, é baixada do cliente e, se ele não responder, lida
+        do arquivo local.
+        """
+        versao = self.mirror.version
+        if self.mirror.ready:
+            blocked_list = self.mirror.players()
+        else:
+            blocked_list = self._buscar_bloqueados()
+            versao = None
+            if blocked_list is None:
+                return self.blocklist_store.load()
         
-        # Se falhar, tenta carregar do arquivo local
-        if self.blocklist_file.exists():
-            try:
-                with open(self.blocklist_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get("usuariosBlock", [])
-            except Exception as e:
-                print(f"Erro ao carregar arquivo de bloqueados: {e}")
+        # Salva a lista atualizada para uso futuro (ignorado se não mudou)
+        if blocked_list and (versao is None or versao != self._versao_salva):
+            self.blocklist_store.save(blocked_list)
+            self._versao_salva = versao
         
-        return []
+        return blocked_list
+    
+    def _buscar_bloqueados(self):
+        """Baixa a lista completa de bloqueados do cliente (None em caso de falha)."""
+        response = self.request("GET", "/lol-chat/v1/blocked-players")
+        if response and response.status_code == 200:
+            return response.json()
+        return None
+    
+    def get_blocked_player(self, player_id):
+        """Retorna um jogador bloqueado pelo ID (da cópia em memória, quando sincronizada)."""
+        if self.mirror.ready:
+            return self.mirror.get(player_id)
+        response = self.request("GET", f"/lol-chat/v1/blocked-players/{player_id}")
+        if response and response.status_code == 200:
+            return response.json()
+        return None
     
     def save_blocked_players(self, blocked_list):
         """Salva a lista de jogadores bloqueados no arquivo JSON."""
-        try:
-            with open(self.blocklist_file, 'w', encoding='utf-8') as f:
-                json.dump({"usuariosBlock": blocked_list}, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"Erro ao salvar arquivo de bloqueados: {e}")
-            return False
+        return self.blocklist_store.save(blocked_list)
     
     def get_summoner_by_puuid(self, puuid):
-        """Obtém informações de um invocador pelo PUUID"""
+        """
+        Obtém informações de um invocador pelo PUUID.
+        
+        Consultas simultâneas de várias threads são agrupadas em uma única
+        requisição em lote quando o cliente suporta.
+
+        Returns:
+            dict: O invocador, ou None se o cliente respondeu que ele não existe
+
+        Raises:
+            LookupFailed: Se o cliente não deu uma resposta conclusiva
+        """
+        return self.summoner_batcher.submit(puuid)
+    
+    def _buscar_summoner_por_puuid(self, puuid):
+        """Consulta individual de um invocador pelo PUUID"""
         response = self.request("GET", f"/lol-summoner/v1/summoners/by-puuid/{puuid}")
-        if response and response.status_code == 200:
+        if response is not None and response.status_code == 200:
             return response.json()
-        return None
+        if response is not None and response.status_code == 404:
+            return None
+        raise LookupFailed(f"invocador {puuid}: {response.status_code if response is not None else 'sem resposta'}")
+    
+    def _buscar_summoners_por_puuids(self, puuids):
+        """
+        Consulta vários invocadores em uma única requisição.
+        
+        Returns:
+            dict: {puuid: invocador}, ou None se o cliente não suportar a consulta em lote
+        """
+        response = self.request("POST", "/lol-summoner/v2/summoners/puuid", data=puuids)
+        if response is not None and response.status_code in (400, 404, 405, 501):
+            return None
+        if not response or response.status_code != 200:
+            # Falha temporária: consulta individualmente sem desativar o lote
+            return self.summoner_batcher.fetch_each(puuids)
+        return {summoner.get('puuid'): summoner for summoner in response.json()}
     
     def get_ranked_stats_by_summonerId(self, summoner_id):
         """Obtém estatísticas de ranked de um jogador pelo summoner ID"""
@@ -0,0 +1,728 @@
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import urllib.parse
+from pathlib import Path
+from lol_client import LolClient, LookupFailed
+from identity_cache import IdentityCache
+from rank_cache import RankCache
+from player_index import FriendsIndex, BlocklistSnapshot
+from bulk_unblock import BulkUnblocker
+from analysis_snapshot import AnalysisSnapshot
+from run_journal import RunJournal
+from report_writer import StreamingReportWriter, export_sorted_xlsx
+from profiler import StageProfiler
+from player_record import PlayerRecord, TIER_ORDER, RANK_ORDER, UNRANKED, ladder_of
+from elo_ladder import tier_difference, removal_mask
+
+logger = logging.getLogger(__name__)
+
+# Limites de processamento simultâneo de jogadores
+DEFAULT_WORKERS = 4
+MAX_WORKERS = 16
+
+DEFAULT_EXPORT_FILE = 'ranked_info_completo.xlsx'
+# Motivo dos jogadores não processados porque o cliente ficou fora do ar
+MOTIVO_INDISPONIVEL = "erro: cliente indisponível"
+
+def extrair_identificadores(jogador):
+    """
+    Extrai o PUUID e o Summoner ID já presentes em uma entrada da lista de bloqueados.
+
+    O cliente costuma enviar `puuid` e `summonerId` diretamente; o `pid`
+    (formato `<puuid>@<servidor>`) serve como alternativa para o PUUID.
+
+    Returns:
+        tuple: (puuid, summoner_id), com None para o que não estiver disponível
+    """
+    puuid = jogador.get('puuid') or None
+    if not puuid:
+        pid = jogador.get('pid') or ''
+        puuid = pid.split('@', 1)[0] or None
+    summoner_id = jogador.get('summonerId') or None
+    return puuid, summoner_id
+
+class MotorBloqueios:
+    """
+    Motor de análise e limpeza da lista de bloqueados, sem interface gráfica.
+
+    Concentra a resolução de identidades, consulta de ranks, decisão de
+    remoção e exportação. É usado tanto pela interface Tk quanto pela linha
+    de comando.
+
+    Attributes:
+        client (LolClient): Instância para comunicação com o cliente do LoL
+        workers (int): Quantidade de jogadores processados em paralelo
+        on_log: Função opcional chamada com (mensagem, nível)
+        on_progress: Função opcional chamada com o percentual concluído
+        identity_cache (IdentityCache): Cache local de PUUID/Summoner ID
+        rank_cache (RankCache): Cache em memória dos ranks consultados
+        friends_index (FriendsIndex): Índice da lista de amigos por nome
+        blocklist (BlocklistSnapshot): Lista de bloqueados da execução atual
+        analysis (AnalysisSnapshot): Resultado da última análise, reaproveitado na limpeza
+        journal (RunJournal): Diário em disco dos jogadores já processados
+        report (StreamingReportWriter): Relatório incremental da análise em andamento
+        profiler (StageProfiler): Perfil opcional das etapas de cada jogador
+    """
+    def __init__(self, client=None, workers=DEFAULT_WORKERS, on_log=None, on_progress=None, profiler=None):
+        self.client = client or LolClient(pool_size=MAX_WORKERS)
+        self.workers = workers
+        self.on_log = on_log
+        self.on_progress = on_progress
+        self.identity_cache = IdentityCache()
+        self.rank_cache = RankCache()
+        self.friends_index = FriendsIndex(self.client)
+        self.blocklist = None
+        self.analysis = None
+        self.journal = RunJournal()
+        self.report = None
+        self.profiler = profiler or StageProfiler()
+        self.fast_path_hits = 0
+        self._stats_lock = threading.Lock()
+        # Por thread: se alguma consulta da identidade em andamento foi inconclusiva
+        self._consulta = threading.local()
+        self.client.supervisor.on_event = lambda mensagem: self.log(mensagem, logging.WARNING)
+
+    def log(self, message, level=logging.INFO):
+        """Encaminha a mensagem para a interface ou, sem ela, para o logging padrão."""
+        if self.on_log:
+            self.on_log(message, level)
+        else:
+            logger.log(level, message)
+
+    def _progresso(self, percentual):
+        if self.on_progress:
+            self.on_progress(percentual)
+
+    def connect(self):
+        """Conecta ao cliente do LoL."""
+        return self.client.connect()
+
+    def reconnect_client(self):
+        self.log("Tentando reconectar ao cliente do League of Legends...")
+        if self.client.connect():
+            self.log("Reconexão bem-sucedida!")
+            return True
+        else:
+            self.log("Falha na reconexão.", logging.WARNING)
+            return False
+
+    def get_account_info(self):
+        """
+        Obtém o nome e o elo (fila solo) do jogador conectado.
+
+        Returns:
+            dict: {'summoner': nome ou None, 'elo': "TIER DIVISÃO", "Unranked" ou None}
+        """
+        info = {'summoner': None, 'elo': None}
+
+        summoner = self.client.get_current_summoner()
+        if summoner:
+            info['summoner'] = summoner.get('displayName', '-')
+
+        ranked_stats = self.client.get_player_elo()
+        if ranked_stats:
+            for queue in ranked_stats.get("queueMap", {}).values():
+                if queue.get("queueType") == "RANKED_SOLO_5x5":
+                    tier = queue.get("tier", "UNRANKED")
+                    division = queue.get("division", "")
+                    info['elo'] = f"{tier} {division}" if tier != "UNRANKED" else "Unranked"
+
+        return info
+
+    def carregar_blocklist(self):
+        """Carrega a lista de bloqueados do cliente e a indexa para a execução atual."""
+        self.blocklist = BlocklistSnapshot(self.client.load_blocked_players())
+        return self.blocklist
+
+    def _conferir_resposta(self, response):
+        """
+        Marca a identidade em resolução como inconclusiva se a resposta não
+        for definitiva (só 200 e 404 dizem se o jogador existe).
+        """
+        if response is None or response.status_code not in (200, 404):
+            self._consulta.inconclusiva = True
+        return response
+
+    def get_puuid(self, game_name, tagline):
+        try:
+            # Log para diagnóstico
+            self.log(f"Tentando obter PUUID para {game_name}#{tagline}...", logging.DEBUG)
+
+            # Codificar corretamente os caracteres especiais e espaços
+            encoded_game_name = urllib.parse.quote(game_name)
+            encoded_tagline = urllib.parse.quote(tagline)
+
+            # Tentar primeiro o endpoint v2 com LCU API - método mais direto
+            summoner_data = self._conferir_resposta(self.client.request("GET", f"/lol-summoner/v2/summoners/by-riot-id/{encoded_game_name}/{encoded_tagline}"))
+
+            if summoner_data and summoner_data.status_code == 200:
+                puuid = summoner_data.json().get('puuid')
+                self.log(f"PUUID obtido com sucesso usando endpoint v2.", logging.DEBUG)
+                return puuid
+
+            # Tentar obter informações via accountId
+            self.log(f"Tentando via LCU API alternativa para {game_name}...", logging.DEBUG)
+
+            # Tentar o endpoint que busca por nome exato
+            account_data = self._conferir_resposta(self.client.request("GET", f"/lol-summoner/v1/summoners?name={encoded_game_name}"))
+
+            if account_data and account_data.status_code == 200 and isinstance(account_data.json(), list):
+                summoners = account_data.json()
+                for summoner in summoners:
+                    # Verificamos pelo nome exato (case sensitive)
+                    if summoner.get('displayName', '').lower() == game_name.lower():
+                        puuid = summoner.get('puuid')
+                        self.log(f"PUUID obtido via nome de invocador.", logging.DEBUG)
+                        return puuid
+
+            # Tentar buscar pelo XMPP Name (nome de chat)
+            self.log("Tentando via API de chat...", logging.DEBUG)
+            puuid = self.friends_index.lookup(game_name)
+            if puuid:
+                self.log(f"PUUID obtido via lista de amigos.", logging.DEBUG)
+                return puuid
+
+            # Se todas as tentativas falharam, reportar o erro
+            self.log(f"Erro ao obter PUUID após múltiplas tentativas: {summoner_data.status_code if summoner_data else 'Falha na requisição'}", logging.WARNING)
+            return None
+        except Exception as e:
+            self._consulta.inconclusiva = True
+            self.log(f"Exceção ao obter PUUID: {str(e)}", logging.WARNING)
+            return None
+
+    def get_summoner_id(self, puuid):
+        # Usar o cliente em vez da API da Riot (consultas agrupadas em lote)
+        try:
+            summoner_data = self.client.get_summoner_by_puuid(puuid)
+        except LookupFailed as e:
+            self._consulta.inconclusiva = True
+            self.log(f"Erro ao obter Summoner ID: {e}", logging.WARNING)
+            return None
+
+        if summoner_data:
+            return summoner_data.get('id') or summoner_data.get('summonerId')
+        else:
+            self.log("Erro ao obter Summoner ID: invocador não encontrado", logging.WARNING)
+            return None
+
+    def get_summoner_rank(self, summoner_id):
+        """
+        Obtém o rank do jogador, usando o cache quando possível.
+
+        Cada entrada retornada inclui `fetchedAt`, o timestamp em que os dados
+        foram obtidos do cliente.
+        """
+        ranked_info, fetched_at = self.rank_cache.get(summoner_id, lambda: self._buscar_rank(summoner_id))
+        if ranked_info is None:
+            return None
+        return [dict(entry, fetchedAt=fetched_at) for entry in ranked_info]
+
+    def _buscar_rank(self, summoner_id):
+        """Busca o rank do jogador diretamente no cliente."""
+        # Usar o cliente em vez da API da Riot
+        ranked_data = self.client.request("GET", f"/lol-ranked/v1/ranked-stats/{summoner_id}")
+
+        if ranked_data and ranked_data.status_code == 200:
+            # Converter do formato do cliente para o formato da API pública
+            data = ranked_data.json()
+            result = []
+
+            for queue_type, queue_data in data.get('queueMap', {}).items():
+                if queue_type == 'RANKED_SOLO_5x5':
+                    entry = {
+                        'queueType': 'RANKED_SOLO_5x5',
+                        'tier': queue_data.get('tier', 'UNRANKED'),
+                        'rank': queue_data.get('division', 'I'),
+                        'leaguePoints': queue_data.get('leaguePoints', 0),
+                        'wins': queue_data.get('wins', 0),
+                        'losses': queue_data.get('losses', 0)
+                    }
+                    result.append(entry)
+
+            return result
+        else:
+            self.log(f"Erro ao obter informações de rank: {ranked_data.status_code if ranked_data else 'Falha na requisição'}", logging.WARNING)
+            return None
+
+    def get_summoner_by_name(self, game_name):
+        """Tenta obter o invocador usando apenas o nome de exibição"""
+        try:
+            encoded_name = urllib.parse.quote(game_name)
+
+            # Tentar primeiro pelo endpoint específico
+            self.log(f"Buscando invocador por nome exato: {game_name}", logging.DEBUG)
+            response = self._conferir_resposta(self.client.request("GET", f"/lol-summoner/v1/summoners?name={encoded_name}"))
+
+            if response and response.status_code == 200:
+                summoners = response.json()
+                if isinstance(summoners, list) and summoners:
+                    # Procurar por correspondência exata ou parcial
+                    for summoner in summoners:
+                        display_name = summoner.get('displayName', '')
+                        if display_name.lower() == game_name.lower():
+                            self.log(f"Invocador encontrado: {display_name}", logging.DEBUG)
+                            return summoner
+
+                    # Se não encontrou correspondência exata, use a primeira
+                    self.log(f"Usando primeira correspondência: {summoners[0].get('displayName')}", logging.DEBUG)
+                    return summoners[0]
+
+            # Tentar via a lista de bloqueados
+            self.log("Tentando buscar nas informações da lista de bloqueados...", logging.DEBUG)
+            blocked = self.blocklist if self.blocklist is not None else self.carregar_blocklist()
+            for blocked_user in blocked.by_name(game_name):
+                # Encontrado o usuário bloqueado, tentar obter seu summoner_id
+                if 'id' in blocked_user:
+                    self.log(f"Encontrado na lista de bloqueados, tentando obter summonerId", logging.DEBUG)
+                    summoner_info = self.get_blocked_player_info(blocked_user['id'])
+                    if summoner_info:
+                        return summoner_info
+
+            self.log(f"Nenhum invocador encontrado com o nome: {game_name}", logging.WARNING)
+            return None
+        except Exception as e:
+            self._consulta.inconclusiva = True
+            self.log(f"Erro ao buscar invocador por nome: {str(e)}", logging.WARNING)
+            return None
+
+    def get_blocked_player_info(self, player_id):
+        """Obtém informações do jogador bloqueado pelo ID (da lista da execução atual ou do cliente)"""
+        try:
+            player_info = self.blocklist.by_id(player_id) if self.blocklist is not None else None
+            if player_info is None:
+                player_info = self.client.get_blocked_player(player_id)
+
+            if player_info:
+                self.log(f"Informações obtidas para jogador bloqueado ID: {player_id}", logging.DEBUG)
+                return player_info
+            else:
+                self.log(f"Erro ao obter informações do jogador bloqueado: {player_id} não encontrado", logging.WARNING)
+                return None
+        except Exception as e:
+            self.log(f"Erro ao obter informações do jogador bloqueado: {str(e)}", logging.WARNING)
+            return None
+
+    def sort_by_elo(self, player_data):
+        """Chave de ordenação por elo (e LP) de um PlayerRecord, para exibição ordenada."""
+        return player_data.sort_key
+
+    def calculate_elo_difference(self, player_elo, my_elo):
+        """
+        Calcula a diferença de elo entre dois jogadores em tiers.
+
+        Aceita elos em texto (ex.: "GOLD II") ou posições já calculadas na
+        escada (`elo_ladder`). Retorna 0 se algum dos dois não tiver ranked.
+        """
+        if isinstance(player_elo, str):
+            player_elo = ladder_of(player_elo)
+        if isinstance(my_elo, str):
+            my_elo = ladder_of(my_elo)
+        return tier_difference(player_elo, my_elo)
+
+    def _iniciar_diario(self, modo, resume):
+        """Inicia o diário da execução, retomando o anterior se solicitado."""
+        self.journal.start(modo, resume=resume)
+        if resume:
+            self.log(f"Retomando execução: {len(self.journal.results)} jogadores já processados.")
+
+    def _obter_jogadores_a_processar(self, todos_jogadores, quantidade):
+        """Retorna a lista limitada de jogadores a processar e o restante a manter."""
+        if quantidade is not None and quantidade < len(todos_jogadores):
+            return todos_jogadores[:quantidade], todos_jogadores[quantidade:]
+        return todos_jogadores, []
+
+    def _processar_jogadores(self, jogadores, my_elo, diff_limit, acao="Analisando"):
+        """Processa os jogadores em paralelo e retorna os resultados na ordem original."""
+        total = len(jogadores)
+        resultados = [None] * total
+        concluidos = 0
+        self.fast_path_hits = 0
+        self.friends_index.invalidate()
+        # Converter o elo do jogador uma única vez para a execução inteira
+        meu_elo = ladder_of(my_elo)
+
+        def tarefa(indice, jogador):
+            anterior = self.journal.completed(jogador)
+            if anterior is not None:
+                player_data, should_remove, reason = anterior
+                if player_data:
+                    should_remove = player_data.elo_diff >= diff_limit
+                return player_data, should_remove, reason
+
+            # Cliente fora do ar: não consultar nem gravar no diário, para o jogador ser refeito ao retomar
+            if not self.client.available:
+                return None, False, MOTIVO_INDISPONIVEL
+
+            nome = f"{jogador.get('gameName', '')}#{jogador.get('gameTag', '')}"
+            self.log(f"{acao} {nome} ({indice+1}/{total})...", logging.DEBUG)
+            with self.profiler.task(), self.profiler.span("jogador", nome), self.client.summoner_batcher.worker():
+                resultado = self._processar_jogador(jogador, meu_elo, diff_limit)
+                if not self.client.available:
+                    return None, False, MOTIVO_INDISPONIVEL
+                with self.profiler.span("diario"):
+                    self.journal.record_result(jogador, resultado)
+            return resultado
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, MAX_WORKERS))) as executor:
+            futuros = {executor.submit(tarefa, i, jogador): i for i, jogador in enumerate(jogadores)}
+            for futuro in as_completed(futuros):
+                indice = futuros[futuro]
+                try:
+                    resultados[indice] = futuro.result()
+                except Exception as e:
+                    self.log(f"Erro ao processar jogador: {str(e)}", logging.WARNING)
+                    resultados[indice] = (None, False, f"erro: {e}")
+
+                # Gravar a linha no relatório assim que o jogador é concluído
+                if self.report and resultados[indice][0]:
+                    self.report.append(resultados[indice][0].to_dict())
+
+                # Atualizar progresso
+                concluidos += 1
+                self._progresso(concluidos / total * 100)
+
+        self.log(f"Identificadores obtidos da própria lista de bloqueados: {self.fast_path_hits}/{total}")
+        pendentes = sum(1 for resultado in resultados if resultado[2] == MOTIVO_INDISPONIVEL)
+        if pendentes:
+            self.log(
+                f"{pendentes} jogadores não foram processados porque o cliente ficou indisponível. "
+                "Abra o cliente e use 'Retomar' para continuar de onde parou.",
+                logging.WARNING
+            )
+        return resultados
+
+    def _resolver_identidade(self, jogador):
+        """
+        Obtém o PUUID e o Summoner ID de um jogador.
+
+        Usa primeiro os identificadores da própria lista de bloqueados, depois
+        o cache local e, por último, as consultas ao cliente.
+
+        Returns:
+            tuple: (puuid, summoner_id, motivo), onde motivo é None em caso de sucesso
+        """
+        game_name = jogador.get('gameName', '')
+        game_tag = jogador.get('gameTag', '')
+        player_id = jogador.get('id')
+
+        puuid, summoner_id = extrair_identificadores(jogador)
+        if puuid and summoner_id:
+            with self._stats_lock:
+                self.fast_path_hits += 1
+            return puuid, summoner_id, None
+
+        # O cache só é usado para os identificadores que ainda faltam
+        with self.profiler.span("cache_identidade"):
+            cached = self.identity_cache.get(player_id, game_name, game_tag)
+        if cached:
+            if cached['found']:
+                return puuid or cached['puuid'], summoner_id or cached['summoner_id'], None
+            if not puuid and not cached['puuid']:
+                return None, None, "PUUID não encontrado (cache)"
+            if cached['puuid'] and not summoner_id and puuid in (None, cached['puuid']):
+                return cached['puuid'], None, "Summoner ID não encontrado (cache)"
+
+        self._consulta.inconclusiva = False
+
+        # Tentar obter o PUUID
+        if not puuid:
+            with self.profiler.span("puuid"):
+                puuid = self.get_puuid(game_name, game_tag)
+        if not puuid:
+            # Tentar método alternativo sem tagline
+            self.log(f"Tentando método alternativo para {game_name}...", logging.DEBUG)
+            with self.profiler.span("busca_por_nome"):
+                summoner = self.get_summoner_by_name(game_name)
+            if summoner:
+                puuid = summoner.get('puuid')
+
+        # Se não conseguiu obter PUUID (a falha só vai para o cache se o cliente respondeu que não existe)
+        if not puuid:
+            if not self._consulta.inconclusiva:
+                self.identity_cache.put(player_id, game_name, game_tag)
+            return None, None, "PUUID não encontrado"
+
+        # Obter Summoner ID
+        if not summoner_id:
+            with self.profiler.span("summoner_id"):
+                summoner_id = self.get_summoner_id(puuid)
+        if summoner_id or not self._consulta.inconclusiva:
+            self.identity_cache.put(player_id, game_name, game_tag, puuid, summoner_id)
+        if not summoner_id:
+            return puuid, None, "Summoner ID não encontrado"
+
+        return puuid, summoner_id, None
+
+    def _processar_jogador(self, jogador, my_elo, diff_limit):
+        """
+        Processa um jogador bloqueado e determina se deve ser mantido ou removido.
+
+        Returns:
+            tuple: (PlayerRecord ou None, remover, motivo)
+        """
+        game_name = jogador.get('gameName', '')
+        game_tag = jogador.get('gameTag', '')
+
+        self.log(f"Processando {game_name}#{game_tag}...", logging.DEBUG)
+
+        with self.profiler.span("identidade"):
+            puuid, summoner_id, motivo = self._resolver_identidade(jogador)
+        if motivo:
+            self.log(f" - Mantendo {game_name}#{game_tag} ({motivo})")
+            return None, None, motivo
+
+        # Obter informações de ranked
+        with self.profiler.span("rank"):
+            ranked_info = self.get_summoner_rank(summoner_id)
+        if not ranked_info:
+            self.log(f" - Mantendo {game_name}#{game_tag} (sem informações de rank)")
+            return None, None, "Sem informações de rank"
+
+        player_data = PlayerRecord(f"{game_name}#{game_tag}", jogador.get('id'), summoner_id, puuid)
+
+        # Verificar filas ranqueadas
+        for entry in ranked_info:
+            if entry['queueType'] == 'RANKED_SOLO_5x5':
+                player_data.queue = entry['queueType']
+                player_data.tier = TIER_ORDER.get(entry['tier'].upper(), UNRANKED)
+                player_data.division = RANK_ORDER.get(entry['rank'], 0)
+                player_data.lp = entry['leaguePoints']
+                player_data.wins = entry['wins']
+                player_data.losses = entry['losses']
+                player_data.fetched_at = entry['fetchedAt']
+                diff = self.calculate_elo_difference(player_data.ladder, my_elo)
+                player_data.elo_diff = diff
+
+                # Decisão se deve remover
+                if diff >= diff_limit:
+                    return player_data, True, f"diferença de elo: {diff}"
+                else:
+                    return player_data, False, f"diferença de elo: {diff}"
+
+        # Se não encontrou RANKED_SOLO_5x5
+        self.log(f" - Mantendo {game_name}#{game_tag} (sem ranked solo)")
+        return player_data, False, "sem ranked solo"
+
+    def _processar_com_analise(self, jogadores, my_elo, diff_limit):
+        """
+        Reaproveita a última análise e processa apenas os jogadores não cobertos por ela.
+
+        Returns:
+            list: Resultados na mesma ordem de `jogadores`
+        """
+        analysis = self.analysis or AnalysisSnapshot.load()
+        if not analysis or not analysis.is_usable(my_elo):
+            return self._processar_jogadores(jogadores, my_elo, diff_limit, "Verificando")
+
+        resultados = analysis.decisoes(jogadores, diff_limit)
+        faltantes = [i for i, resultado in enumerate(resultados) if resultado is None]
+        for jogador, resultado in zip(jogadores, resultados):
+            if resultado is not None and self.journal.completed(jogador) is None:
+                self.journal.record_result(jogador, resultado)
+        self.log(f"Reaproveitando análise anterior para {len(jogadores) - len(faltantes)} jogadores.")
+
+        if faltantes:
+            novos = self._processar_jogadores([jogadores[i] for i in faltantes], my_elo, diff_limit, "Verificando")
+            for i, resultado in zip(faltantes, novos):
+                resultados[i] = resultado
+        else:
+            self._progresso(100)
+
+        return resultados
+
+    @staticmethod
+    def _linha_relatorio(data):
+        """Aplica os rótulos de exibição a uma linha gravada no relatório."""
+        return PlayerRecord.from_dict(data).to_row()
+
+    @staticmethod
+    def _resumo_jogadores(jogadores, resultados):
+        """Monta a lista estruturada de decisões por jogador."""
+        resumo = []
+        for jogador, (player_data, should_remove, reason) in zip(jogadores, resultados):
+            resumo.append({
+                'id': jogador.get('id'),
+                'nome': f"{jogador.get('gameName', '')}#{jogador.get('gameTag', '')}",
+                'elo': player_data.elo if player_data else None,
+                'diferenca': player_data.elo_diff if player_data else None,
+                'remover': bool(should_remove),
+                'motivo': reason
+            })
+        return resumo
+
+    def analyze(self, my_elo, diff_limit, quantidade=None, resume=False, export_file=DEFAULT_EXPORT_FILE, csv_file=None):
+        """
+        Analisa os jogadores bloqueados e exporta o resultado para Excel.
+
+        Args:
+            my_elo: Elo do jogador conectado (ex.: "GOLD II")
+            diff_limit: Diferença de elo (em tiers) a partir da qual o jogador seria removido
+            quantidade: Quantidade máxima de jogadores a analisar (None para todos)
+            resume: Retoma uma execução interrompida a partir do diário
+            export_file: Arquivo Excel de saída (as linhas são gravadas durante a
+                execução em um arquivo `.jsonl` com o mesmo nome)
+            csv_file: Arquivo CSV opcional, também gravado durante a execução
+
+        Returns:
+            dict: Resumo da análise e decisão por jogador
+        """
+        # Obter lista de bloqueados
+        blocked_players = self.carregar_blocklist().players
+        total = len(blocked_players)
+        resumo = {'total': total, 'analisados': 0, 'remover': 0, 'manter': total, 'arquivo': None, 'jogadores': []}
+
+        if total == 0:
+            self.log("Nenhum jogador bloqueado encontrado.")
+            return resumo
+
+        # Limitar a quantidade de jogadores a analisar
+        blocked_to_analyze, _ = self._obter_jogadores_a_processar(blocked_players, quantidade)
+
+        self.log(f"Iniciando análise de {len(blocked_to_analyze)} jogadores bloqueados...")
+        self._iniciar_diario("analisar", resume)
+
+        # Relatório incremental: resultados parciais ficam sempre em disco
+        self.report = StreamingReportWriter(Path(export_file).with_suffix('.jsonl'), csv_path=csv_file, format_row=self._linha_relatorio)
+        try:
+            resultados = self._processar_jogadores(blocked_to_analyze, my_elo, diff_limit, "Analisando")
+        finally:
+            report, self.report = self.report, None
+            report.close()
+
+        # Guardar o resultado para a limpeza reaproveitar
+        self.analysis = AnalysisSnapshot.from_run(my_elo, diff_limit, blocked_to_analyze, resultados)
+        self.analysis.save()
+
+        resumo['analisados'] = len(blocked_to_analyze)
+        resumo['jogadores'] = self._resumo_jogadores(blocked_to_analyze, resultados)
+
+        # Exportar os dados ordenados para Excel (para referência)
+        if report.rows:
+            export_sorted_xlsx(
+                report.path, export_file, reverse=True,
+                key=lambda data: self.sort_by_elo(PlayerRecord.from_dict(data)),
+                format_row=self._linha_relatorio
+            )
+            self.log(f"Dados exportados para '{export_file}'")
+
+            diffs = [player_data.elo_diff for player_data, _, _ in resultados if player_data]
+            to_remove = int(removal_mask(diffs, diff_limit).sum())
+            resumo.update(remover=to_remove, manter=total - to_remove, arquivo=export_file)
+
+            # Mostrar resumo
+            self.log("\nResumo da análise:")
+            self.log(f"Total de jogadores bloqueados: {total}")
+            self.log(f"Jogadores com diferença de elo >= {diff_limit}: {to_remove}")
+            self.log(f"Jogadores a manter: {total - to_remove}")
+
+            taxas = ", ".join(
+                f"{familia}: {'sem limite' if taxa is None else f'{taxa:.1f}/s'}"
+                for familia, taxa in self.client.rate_limiter.rates().items()
+            )
+            self.log(f"Taxa atual de requisições: {taxas}")
+            self.log(f"Requisições por endpoint:\n{self.client.metrics.summary()}", logging.DEBUG)
+        else:
+            self.log("Nenhum dado para analisar.")
+
+        self.identity_cache.evict()
+        return resumo
+
+    def clean(self, my_elo, diff_limit, quantidade=None, resume=False):
+        """
+        Remove da lista de bloqueados os jogadores com diferença de elo >= `diff_limit`.
+
+        Args:
+            my_elo: Elo do jogador conectado (ex.: "GOLD II")
+            diff_limit: Diferença de elo (em tiers) a partir da qual o jogador é removido
+            quantidade: Quantidade máxima de jogadores a verificar (None para todos)
+            resume: Retoma uma execução interrompida a partir do diário
+
+        Returns:
+            dict: Resumo da limpeza e decisão por jogador
+        """
+        self.log("Iniciando limpeza da lista de bloqueados...")
+
+        # Carregar lista de bloqueados
+        blocked_players = self.carregar_blocklist().players
+        total = len(blocked_players)
+        resumo = {'total': total, 'removidos': 0, 'falhas': 0, 'repetidos': 0, 'mantidos': total, 'jogadores': []}
+
+        if total == 0:
+            self.log("Nenhum jogador bloqueado encontrado.")
+            return resumo
+
+        # Limitar a quantidade de jogadores a processar
+        blocked_to_process, blocked_to_keep = self._obter_jogadores_a_processar(blocked_players, quantidade)
+
+        self.log(f"Processando {len(blocked_to_process)} de {total} jogadores bloqueados...")
+        self._iniciar_diario("limpar", resume)
+
+        # Lista para manter jogadores que não serão removidos
+        players_to_keep = blocked_to_keep.copy()  # Já inclui os que não serão processados
+        players_to_remove = []
+
+        resultados = self._processar_com_analise(blocked_to_process, my_elo, diff_limit)
+
+        # Sem o cliente não é possível desbloquear: manter a lista e o diário para retomar depois
+        if not self.client.available:
+            self.log("Limpeza interrompida: o cliente do League of Legends está indisponível.", logging.WARNING)
+            resumo['jogadores'] = self._resumo_jogadores(blocked_to_process, resultados)
+            return resumo
+
+        for usuario, (_, should_remove, reason) in zip(blocked_to_process, resultados):
+            game_name = usuario.get('gameName', '')
+            game_tag = usuario.get('gameTag', '')
+
+            if should_remove:
+                self.log(f" - Removendo {game_name}#{game_tag} ({reason})")
+                players_to_remove.append(usuario)
+            else:
+                self.log(f" - Mantendo {game_name}#{game_tag} ({reason})")
+                players_to_keep.append(usuario)
+
+        # Remover jogadores
+        def on_unblock(player, sucesso, tentativas):
+            self.journal.record_unblock(player, sucesso)
+            nome = f"{player.get('gameName')}#{player.get('gameTag')}"
+            sufixo = f" após {tentativas} tentativas" if tentativas > 1 else ""
+            if sucesso:
+                self.log(f"Removido com sucesso: {nome}{sufixo}")
+            else:
+                self.log(f"Falha ao remover: {nome}{sufixo}", logging.WARNING)
+
+        # Jogadores já desbloqueados em uma execução anterior
+        ja_removidos = [p for p in players_to_remove if self.journal.is_unblocked(p)]
+        if ja_removidos:
+            self.log(f"{len(ja_removidos)} jogadores já haviam sido removidos na execução anterior.")
+        pendentes = [p for p in players_to_remove if not self.journal.is_unblocked(p)]
+
+        unblocker = BulkUnblocker(self.client, workers=self.workers)
+        report = unblocker.run(pendentes, on_result=on_unblock)
+        removed_count = len(report.succeeded) + len(ja_removidos)
+        players_to_keep.extend(report.failed)
+
+        # Atualizar arquivo JSON
+        if self.client.save_blocked_players(players_to_keep):
+            self.log("Arquivo de bloqueados atualizado com sucesso.")
+        else:
+            self.log("Erro ao atualizar arquivo de bloqueados.", logging.WARNING)
+
+        self.blocklist = BlocklistSnapshot(players_to_keep)
+        self.identity_cache.evict()
+
+        self.log(f"\nLimpeza concluída:")
+        self.log(f"Jogadores removidos: {removed_count}")
+        self.log(f"Falhas na remoção: {len(report.failed)}")
+        self.log(f"Remoções com novas tentativas: {len(report.retried)}")
+        self.log(f"Jogadores mantidos: {len(players_to_keep)}")
+        self.log(f"Requisições por endpoint:\n{self.client.metrics.summary()}", logging.DEBUG)
+
+        resumo.update(
+            removidos=removed_count,
+            falhas=len(report.failed),
+            repetidos=len(report.retried),
+            mantidos=len(players_to_keep),
+            jogadores=self._resumo_jogadores(blocked_to_process, resultados)
+        )
+        return resumo
@@ -0,0 +1,80 @@
+import threading
+
+
+class FriendsIndex:
+    """
+    Índice da lista de amigos por nome, construído sob demanda.
+
+    A lista `/lol-chat/v1/friends` é baixada apenas na primeira consulta e
+    mantida até `invalidate()` ser chamado (normalmente no início de cada
+    análise ou limpeza).
+
+    Attributes:
+        client (LolClient): Cliente usado para buscar a lista de amigos
+    """
+    def __init__(self, client):
+        self.client = client
+        self._by_name = None
+        self._lock = threading.Lock()
+
+    def _construir(self):
+        """Baixa a lista de amigos e monta o índice nome -> puuid."""
+        index = {}
+        response = self.client.request("GET", "/lol-chat/v1/friends")
+        if response and response.status_code == 200:
+            for friend in response.json():
+                puuid = friend.get('puuid')
+                if not puuid:
+                    continue
+                for name in (friend.get('name'), friend.get('gameName')):
+                    if name:
+                        index.setdefault(name.casefold(), puuid)
+        return index
+
+    def lookup(self, game_name):
+        """Retorna o PUUID do amigo com o nome informado, ou None."""
+        with self._lock:
+            if self._by_name is None:
+                self._by_name = self._construir()
+            return self._by_name.get((game_name or '').casefold())
+
+    def invalidate(self):
+        """Descarta o índice; a próxima consulta baixa a lista novamente."""
+        with self._lock:
+            self._by_name = None
+
+
+class BlocklistSnapshot:
+    """
+    Cópia da lista de bloqueados de uma execução, com índices por id e nome.
+
+    Carregada uma vez por análise/limpeza e compartilhada por todas as
+    etapas, evitando baixar e regravar a lista a cada jogador não resolvido.
+
+    Attributes:
+        players: Lista de jogadores bloqueados, na ordem do cliente
+    """
+    def __init__(self, players):
+        self.players = list(players or [])
+        self._by_id = {}
+        self._by_name = {}
+        for player in self.players:
+            game_name = (player.get('gameName') or '').lower()
+            if player.get('id') is not None:
+                self._by_id.setdefault(str(player['id']), player)
+            if game_name:
+                self._by_name.setdefault(game_name, []).append(player)
+
+    def __len__(self):
+        return len(self.players)
+
+    def __iter__(self):
+        return iter(self.players)
+
+    def by_id(self, player_id):
+        """Retorna o jogador com o id informado (número ou texto), ou None."""
+        return self._by_id.get(str(player_id))
+
+    def by_name(self, game_name):
+        """Retorna os jogadores com o gameName informado (sem diferenciar maiúsculas)."""
+        return self._by_name.get((game_name or '').lower(), [])
@@ -0,0 +1,124 @@
+import time
+from elo_ladder import TIER_ORDER, RANK_ORDER, UNRANKED, APEX_TIER, ladder_value, sort_key
+
+TIER_NAMES = {valor: tier for tier, valor in TIER_ORDER.items()}
+RANK_NAMES = {valor: divisao for divisao, valor in RANK_ORDER.items()}
+
+# Rótulos das colunas do relatório, aplicados apenas na exportação
+COLUMNS = (
+    'Nome', 'id', 'Summoner ID', 'puuid', 'Fila', 'Elo', 'Pontos de Liga (LP)',
+    'Vitórias', 'Derrotas', 'Winrate', 'Diferença de Elo', 'Rank obtido em'
+)
+
+
+def parse_elo(elo):
+    """
+    Converte um elo em texto (ex.: "GOLD II") para (tier, divisão) inteiros.
+
+    Jogadores sem rank retornam (UNRANKED, 0).
+    """
+    if not elo or elo.lower() == 'unranked':
+        return UNRANKED, 0
+    parts = elo.split()
+    tier = TIER_ORDER.get(parts[0].upper(), UNRANKED)
+    division = RANK_ORDER.get(parts[1], 0) if len(parts) > 1 else RANK_ORDER['I']
+    return tier, division
+
+
+def ladder_of(elo):
+    """Posição na escada (ver `elo_ladder`) de um elo em texto."""
+    return ladder_value(*parse_elo(elo))
+
+
+class PlayerRecord:
+    """
+    Resultado compacto da análise de um jogador bloqueado.
+
+    Tier, divisão, LP, vitórias e derrotas ficam guardados como inteiros; o
+    elo em texto, o winrate formatado e os rótulos das colunas só são
+    montados na exportação (`to_row`).
+
+    Attributes:
+        name: Riot ID do jogador ("nome#tag")
+        player_id: Id do jogador na lista de bloqueados
+        summoner_id: Summoner ID do jogador
+        puuid: PUUID do jogador
+        queue: Fila ranqueada ("" se o jogador não tem ranked solo)
+        tier: Valor de TIER_ORDER, ou UNRANKED
+        division: Valor de RANK_ORDER
+        lp: Pontos de liga
+        wins: Vitórias
+        losses: Derrotas
+        elo_diff: Diferença de elo (em tiers) em relação ao jogador conectado
+        fetched_at: Timestamp em que o rank foi obtido (None se não houver)
+    """
+    __slots__ = (
+        'name', 'player_id', 'summoner_id', 'puuid', 'queue', 'tier', 'division',
+        'lp', 'wins', 'losses', 'elo_diff', 'fetched_at'
+    )
+
+    def __init__(self, name, player_id, summoner_id, puuid, queue="", tier=UNRANKED, division=0,
+                 lp=0, wins=0, losses=0, elo_diff=0, fetched_at=None):
+        self.name = name
+        self.player_id = player_id
+        self.summoner_id = summoner_id
+        self.puuid = puuid
+        self.queue = queue
+        self.tier = tier
+        self.division = division
+        self.lp = lp
+        self.wins = wins
+        self.losses = losses
+        self.elo_diff = elo_diff
+        self.fetched_at = fetched_at
+
+    @property
+    def ranked(self):
+        return self.tier != UNRANKED
+
+    @property
+    def elo(self):
+        """Elo em texto, como exibido no relatório (ex.: "GOLD II")."""
+        if not self.ranked:
+            return "unranked"
+        if self.tier >= APEX_TIER:
+            return TIER_NAMES[self.tier]  # MASTER+ não tem divisões
+        return f"{TIER_NAMES[self.tier]} {RANK_NAMES[self.division]}"
+
+    @property
+    def ladder(self):
+        """Posição do elo na escada (ver `elo_ladder`)."""
+        return ladder_value(self.tier, self.division)
+
+    @property
+    def sort_key(self):
+        """Chave de ordenação por elo e LP; jogadores sem rank ficam no final."""
+        return sort_key(self.ladder, self.lp)
+
+    @property
+    def winrate(self):
+        """Percentual de vitórias, ou None se não houver partidas."""
+        games = self.wins + self.losses
+        return self.wins / games * 100 if games else None
+
+    def to_row(self):
+        """Linha do relatório com os rótulos de exibição."""
+        if not self.ranked:
+            valores = (self.name, self.player_id, self.summoner_id, self.puuid, "", "unranked", "", "", "", "", 0, "")
+        else:
+            winrate = self.winrate
+            valores = (
+                self.name, self.player_id, self.summoner_id, self.puuid, self.queue, self.elo, self.lp,
+                self.wins, self.losses, f"{winrate:.2f}%" if winrate is not None else "", self.elo_diff,
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.fetched_at)) if self.fetched_at else ""
+            )
+        return dict(zip(COLUMNS, valores))
+
+    def to_dict(self):
+        """Representação compacta para gravar em disco (diário, análise, relatório)."""
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Recria o registro a partir de `to_dict`."""
+        return cls(**data)
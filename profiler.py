@@ -0,0 +1,234 @@
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+# Modos opcionais além das etapas medidas
+PROFILE_MODES = (None, "cprofile", "sampling")
+DEFAULT_SAMPLE_INTERVAL = 0.005  # segundos
+
+
+class _SemMedicao:
+    """Contexto vazio usado quando o perfil está desativado."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_SEM_MEDICAO = _SemMedicao()
+
+
+class _Span:
+    def __init__(self, profiler, stage, player):
+        self.profiler = profiler
+        self.stage = stage
+        self.player = player
+
+    def __enter__(self):
+        pilha = self.profiler._pilha()
+        self.filhos = 0.0
+        pilha.append(self)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duracao = time.perf_counter() - self.inicio
+        pilha = self.profiler._pilha()
+        pilha.pop()
+        if pilha:
+            pilha[-1].filhos += duracao
+            player = self.player if self.player is not None else pilha[0].player
+        else:
+            player = self.player
+        caminho = tuple(span.stage for span in pilha) + (self.stage,)
+        self.profiler._registrar(self.stage, player, caminho, self.inicio, duracao, duracao - self.filhos)
+        return False
+
+
+class StageProfiler:
+    """
+    Perfil opcional das etapas do processamento de cada jogador.
+
+    Com `enabled`, cada `span(etapa, jogador)` é registrado com início e
+    duração. O resultado pode ser gravado como trace do Chrome
+    (chrome://tracing, Perfetto) ou como pilhas "folded" para flame graphs.
+    Opcionalmente, `mode` acrescenta o cProfile ("cprofile", por thread de
+    trabalho) ou um perfil por amostragem de todas as threads ("sampling").
+    Desativado, `span` não mede nada.
+
+    Attributes:
+        enabled: Se as etapas são medidas
+        mode: None, "cprofile" ou "sampling"
+        sample_interval: Intervalo entre amostras no modo "sampling" (segundos)
+        spans: Etapas registradas (etapa, jogador, caminho, thread, início, duração, tempo próprio)
+    """
+    def __init__(self, enabled=False, mode=None, sample_interval=DEFAULT_SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfil inválido: {mode}")
+        self.enabled = enabled
+        self.mode = mode if enabled else None
+        self.sample_interval = sample_interval
+        self.spans = []
+        self.samples = Counter()
+        self._inicio = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._perfis = []
+        self._amostrador = None
+        self._parar = threading.Event()
+
+    def _pilha(self):
+        pilha = getattr(self._local, "pilha", None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        return pilha
+
+    def _registrar(self, stage, player, caminho, inicio, duracao, proprio):
+        with self._lock:
+            self.spans.append((stage, player, caminho, threading.get_ident(), inicio, duracao, proprio))
+
+    def span(self, stage, player=None):
+        """Contexto que mede uma etapa. `player` identifica o jogador (herdado das etapas externas)."""
+        if not self.enabled:
+            return _SEM_MEDICAO
+        return _Span(self, stage, player)
+
+    @contextmanager
+    def task(self):
+        """Contexto de uma tarefa em uma thread de trabalho (ativa o cProfile dessa thread)."""
+        perfil = None
+        if self.mode == "cprofile":
+            perfil = getattr(self._local, "perfil", None)
+            novo = perfil is None
+            if novo:
+                perfil = self._local.perfil = cProfile.Profile()
+            try:
+                perfil.enable()
+            except ValueError:
+                # A partir do Python 3.12 só um cProfile pode estar ativo por vez
+                perfil = None
+            else:
+                if novo:
+                    with self._lock:
+                        self._perfis.append(perfil)
+        try:
+            yield
+        finally:
+            if perfil is not None:
+                perfil.disable()
+
+    def start(self):
+        """Inicia a medição (e o amostrador, no modo "sampling")."""
+        self.spans = []
+        self.samples = Counter()
+        self._inicio = time.perf_counter()
+        if self.mode == "sampling" and self._amostrador is None:
+            self._parar.clear()
+            self._amostrador = threading.Thread(target=self._amostrar, name="amostrador-perfil", daemon=True)
+            self._amostrador.start()
+
+    def stop(self):
+        """Encerra o amostrador, se estiver em execução."""
+        if self._amostrador is not None:
+            self._parar.set()
+            self._amostrador.join()
+            self._amostrador = None
+
+    def _amostrar(self):
+        proprio = threading.get_ident()
+        while not self._parar.wait(self.sample_interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == proprio:
+                    continue
+                pilha = []
+                while frame is not None:
+                    code = frame.f_code
+                    pilha.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(pilha))] += 1
+
+    def summary(self):
+        """Tempo por etapa: quantidade, total, média e máximo."""
+        por_etapa = defaultdict(list)
+        with self._lock:
+            for stage, _, _, _, _, duracao, _ in self.spans:
+                por_etapa[stage].append(duracao)
+        linhas = []
+        for stage, duracoes in sorted(por_etapa.items(), key=lambda item: sum(item[1]), reverse=True):
+            total = sum(duracoes)
+            linhas.append(
+                f"{stage}: {len(duracoes)}x, total {total:.2f}s, "
+                f"média {total / len(duracoes) * 1000:.1f}ms, máx {max(duracoes) * 1000:.1f}ms"
+            )
+        return "\n".join(linhas) if linhas else "Nenhuma etapa registrada."
+
+    def chrome_trace(self):
+        """Etapas no formato de trace do Chrome (eventos completos, em microssegundos)."""
+        pid = os.getpid()
+        with self._lock:
+            eventos = [
+                {
+                    "name": stage,
+                    "cat": "jogador",
+                    "ph": "X",
+                    "ts": (inicio - self._inicio) * 1e6,
+                    "dur": duracao * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"jogador": player} if player is not None else {}
+                }
+                for stage, player, _, tid, inicio, duracao, _ in self.spans
+            ]
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def folded(self):
+        """
+        Pilhas "folded" para flame graphs (`pilha valor` por linha).
+
+        No modo "sampling", o valor é a quantidade de amostras; nos demais,
+        o tempo próprio de cada etapa em microssegundos.
+        """
+        if self.mode == "sampling":
+            pilhas = self.samples
+        else:
+            pilhas = Counter()
+            with self._lock:
+                for _, _, caminho, _, _, _, proprio in self.spans:
+                    pilhas[";".join(caminho)] += int(proprio * 1e6)
+        return "".join(f"{pilha} {valor}\n" for pilha, valor in sorted(pilhas.items()))
+
+    def save(self, path):
+        """
+        Grava o trace do Chrome em `path`, as pilhas folded em `<path>.folded`
+        e, no modo "cprofile", as estatísticas em `<path>.prof` (pstats).
+
+        Returns:
+            list: Arquivos gravados
+        """
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+        arquivos = [path]
+
+        folded_path = path.with_suffix(".folded")
+        folded_path.write_text(self.folded(), encoding='utf-8')
+        arquivos.append(folded_path)
+
+        with self._lock:
+            perfis = list(self._perfis)
+        if perfis:
+            stats = pstats.Stats(perfis[0])
+            for perfil in perfis[1:]:
+                stats.add(perfil)
+            prof_path = path.with_suffix(".prof")
+            stats.dump_stats(prof_path)
+            arquivos.append(prof_path)
+        return arquivos
@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Janela em que a entrada é considerada atual (segundos)
+DEFAULT_FRESH_FOR = 10 * 60
+# Idade máxima em que uma entrada antiga ainda pode ser usada enquanto é atualizada
+DEFAULT_MAX_STALE = 24 * 3600
+
+
+def _chave(key):
+    """Normaliza a chave (ids chegam como número do cliente e como texto do SQLite)."""
+    return str(key)
+
+
+class RankCache:
+    """
+    Cache em memória de ranks com validade e atualização em segundo plano.
+
+    Entradas dentro de `fresh_for` são retornadas diretamente. Entradas
+    antigas (até `max_stale`) são retornadas imediatamente e atualizadas em
+    segundo plano (stale-while-revalidate). Mais antigas que isso são
+    buscadas novamente de forma síncrona.
+
+    As chaves são normalizadas para texto, então o mesmo invocador é
+    encontrado tanto pelo id numérico do cliente quanto pelo id lido do
+    cache de identidades.
+
+    Attributes:
+        fresh_for: Janela de validade em segundos
+        max_stale: Idade máxima para uso de entradas antigas em segundos
+    """
+    def __init__(self, fresh_for=DEFAULT_FRESH_FOR, max_stale=DEFAULT_MAX_STALE, refresh_workers=2):
+        self.fresh_for = fresh_for
+        self.max_stale = max_stale
+        self._entries = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers)
+
+    def get(self, key, loader):
+        """
+        Retorna o valor em cache ou carregado por `loader`.
+
+        Returns:
+            tuple: (valor, fetched_at), onde fetched_at é o timestamp da busca
+        """
+        key = _chave(key)
+        agora = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry:
+            value, fetched_at = entry
+            idade = agora - fetched_at
+            if idade < self.fresh_for:
+                return value, fetched_at
+            if idade < self.max_stale:
+                self._revalidar(key, loader)
+                return value, fetched_at
+
+        value = loader()
+        if value is None:
+            return None, None
+        return value, self.put(key, value)
+
+    def put(self, key, value, fetched_at=None):
+        """Grava um valor no cache. Retorna o timestamp registrado."""
+        key = _chave(key)
+        fetched_at = fetched_at or time.time()
+        with self._lock:
+            self._entries[key] = (value, fetched_at)
+        return fetched_at
+
+    def invalidate(self, key=None):
+        """Remove uma entrada ou, sem argumentos, todo o cache."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(_chave(key), None)
+
+    def _revalidar(self, key, loader):
+        """Agenda a atualização da entrada, evitando buscas duplicadas."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def tarefa():
+            try:
+                value = loader()
+                if value is not None:
+                    self.put(key, value)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(tarefa)
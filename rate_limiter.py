@@ -0,0 +1,166 @@
+import threading
+import time
+
+# Configuração padrão (requisições por segundo, rajada) por família de endpoint.
+# As chamadas vão para o cliente local, então não há limite (taxa None) até o
+# próprio cliente sinalizar sobrecarga (429/503/Retry-After).
+DEFAULT_LIMITS = {}
+DEFAULT_RATE = None
+DEFAULT_BURST = 20
+# Taxa aplicada no primeiro 429/503 de uma família sem limite; acima dela o limite é retirado
+DEFAULT_BACKOFF_RATE = 20.0
+# Aumento da taxa (requisições/s) a cada resposta bem-sucedida durante a recuperação
+DEFAULT_INCREASE = 0.5
+
+# Códigos de status que indicam que o cliente está sobrecarregado
+BACKOFF_STATUS = (429, 503)
+
+
+class TokenBucket:
+    """
+    Balde de tokens adaptativo para uma família de endpoints.
+
+    Sem `rate`, as requisições não são limitadas até o primeiro 429/503:
+    a taxa passa então a `backoff_rate`. Cada novo 429/503 reduz a taxa
+    pela metade (até `min_rate`) e cada resposta bem-sucedida a aumenta em
+    `increase`; ao passar de `backoff_rate`, o limite é retirado. Com
+    `rate`, a taxa começa nesse máximo e se recupera até ele.
+
+    Attributes:
+        max_rate: Taxa máxima configurada (requisições por segundo), ou None
+        rate: Taxa atual, ou None enquanto não há limite
+        burst: Quantidade máxima de tokens acumulados
+        min_rate: Taxa mínima durante o backoff
+    """
+    def __init__(self, rate=None, burst=DEFAULT_BURST, min_rate=0.5, backoff_rate=DEFAULT_BACKOFF_RATE,
+                 increase=DEFAULT_INCREASE):
+        self.max_rate = float(rate) if rate else None
+        self.rate = self.max_rate
+        self.burst = max(1, int(burst))
+        self.min_rate = min(float(min_rate), self.max_rate or float(min_rate))
+        self.backoff_rate = min(float(backoff_rate), self.max_rate or float(backoff_rate))
+        self.increase = float(increase)
+        self.tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reabastecer(self, now):
+        """Adiciona os tokens gerados desde a última verificação."""
+        elapsed = now - self._last
+        self._last = now
+        if self.rate is None:
+            self.tokens = float(self.burst)
+        else:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """Bloqueia até haver um token disponível. Retorna o tempo esperado em segundos."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._reabastecer(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self.rate is None:
+                    return waited
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def on_success(self):
+        """Recupera a taxa aos poucos (aumento aditivo) após uma resposta normal."""
+        with self._lock:
+            if self.rate is None or self.rate == self.max_rate:
+                return
+            self.rate += self.increase
+            if self.max_rate is not None:
+                self.rate = min(self.max_rate, self.rate)
+            elif self.rate > self.backoff_rate:
+                self.rate = None
+
+    def on_backoff(self, retry_after=None):
+        """Reduz a taxa e, se informado, pausa o balde pelo tempo do Retry-After."""
+        with self._lock:
+            if self.rate is None:
+                self.rate = self.backoff_rate
+            else:
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0.0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+class RateLimiter:
+    """
+    Limitador compartilhado com um balde de tokens por família de endpoint.
+
+    A família é o primeiro segmento do caminho (ex.: `/lol-ranked/v1/...`
+    pertence à família `lol-ranked`).
+
+    Attributes:
+        limits: Configuração (taxa, rajada) por família
+        buckets: Baldes já criados, por família
+    """
+    def __init__(self, limits=None, default_rate=DEFAULT_RATE, default_burst=DEFAULT_BURST):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def family_of(endpoint):
+        """Retorna a família de um endpoint."""
+        path = endpoint.split("?", 1)[0].lstrip("/")
+        return path.split("/", 1)[0] or "default"
+
+    def _bucket(self, endpoint):
+        family = self.family_of(endpoint)
+        with self._lock:
+            bucket = self.buckets.get(family)
+            if bucket is None:
+                rate, burst = self.limits.get(family, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self.buckets[family] = bucket
+            return bucket
+
+    def acquire(self, endpoint):
+        """Aguarda permissão para chamar o endpoint. Retorna o tempo esperado em segundos."""
+        return self._bucket(endpoint).acquire()
+
+    def feedback(self, endpoint, response):
+        """Ajusta a taxa da família de acordo com a resposta recebida."""
+        if response is None:
+            return
+        bucket = self._bucket(endpoint)
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code in BACKOFF_STATUS or retry_after:
+            bucket.on_backoff(retry_after)
+        else:
+            bucket.on_success()
+
+    def current_rate(self, endpoint_or_family):
+        """Retorna a taxa atual (requisições/s) de uma família ou endpoint (None se sem limite)."""
+        return self._bucket(endpoint_or_family).rate
+
+    def rates(self):
+        """Retorna um dicionário com a taxa atual de cada família já utilizada (None se sem limite)."""
+        with self._lock:
+            return {family: bucket.rate for family, bucket in self.buckets.items()}
+
+
+def _parse_retry_after(value):
+    """Converte o cabeçalho Retry-After (em segundos) para float."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        # Formato de data HTTP não é usado pelo cliente; aplica uma pausa curta
+        return 1.0
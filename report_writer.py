@@ -0,0 +1,138 @@
+import csv
+import heapq
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from elo_ladder import sort_order
+
+# Linhas mantidas em memória por bloco durante a ordenação final
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class StreamingReportWriter:
+    """
+    Relatório gravado incrementalmente, uma linha por jogador concluído.
+
+    As linhas são acrescentadas a um arquivo JSON lines (e, opcionalmente, a
+    um CSV) assim que cada jogador termina, de modo que resultados parciais
+    ficam sempre em disco. A visão final ordenada é gerada por
+    `export_sorted_xlsx` a partir do arquivo JSON lines.
+
+    Attributes:
+        path: Arquivo JSON lines com as linhas do relatório
+        csv_path: Arquivo CSV opcional com as mesmas linhas
+        format_row: Função opcional que converte a linha gravada na linha
+            exibida no CSV (ex.: aplicar rótulos de colunas)
+        rows: Quantidade de linhas gravadas
+    """
+    def __init__(self, path, csv_path=None, format_row=None):
+        self.path = Path(path)
+        self.csv_path = Path(csv_path) if csv_path else None
+        self.format_row = format_row
+        self.rows = 0
+        self._columns = None
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._csv_file = open(self.csv_path, 'w', encoding='utf-8', newline='') if self.csv_path else None
+        self._csv_writer = None
+
+    def append(self, row):
+        """Acrescenta uma linha (dicionário) ao relatório."""
+        with self._lock:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._file.flush()
+            if self._csv_file:
+                if self.format_row:
+                    row = self.format_row(row)
+                if self._columns is None:
+                    self._columns = list(row)
+                if self._csv_writer is None:
+                    self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self._columns, extrasaction='ignore')
+                    self._csv_writer.writeheader()
+                self._csv_writer.writerow(row)
+                self._csv_file.flush()
+            self.rows += 1
+
+    def close(self):
+        """Fecha os arquivos do relatório."""
+        with self._lock:
+            self._file.close()
+            if self._csv_file:
+                self._csv_file.close()
+
+
+def _ler_linhas(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_sorted(path, key, reverse=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Percorre as linhas de um arquivo JSON lines em ordem, com memória limitada.
+
+    As linhas são ordenadas em blocos de `chunk_size`, gravados em arquivos
+    temporários e intercalados com `heapq.merge`. `key` deve retornar um
+    inteiro (a ordenação de cada bloco é feita com NumPy).
+    """
+    blocos = []
+    try:
+        bloco = []
+        for row in _ler_linhas(path):
+            bloco.append(row)
+            if len(bloco) >= chunk_size:
+                blocos.append(_gravar_bloco(bloco, key, reverse))
+                bloco = []
+        if bloco or not blocos:
+            blocos.append(_gravar_bloco(bloco, key, reverse))
+
+        iteradores = [_ler_linhas(bloco_path) for bloco_path in blocos]
+        yield from heapq.merge(*iteradores, key=key, reverse=reverse)
+    finally:
+        for bloco_path in blocos:
+            os.unlink(bloco_path)
+
+
+def _gravar_bloco(bloco, key, reverse):
+    """Ordena um bloco e o grava em um arquivo temporário. Retorna o caminho."""
+    chaves = [key(row) for row in bloco]
+    if all(type(chave) is int for chave in chaves):
+        ordem = sort_order(chaves, reverse=reverse) if chaves else []
+    else:
+        # Chaves não inteiras (ex.: tuplas) não cabem na ordenação vetorizada
+        ordem = sorted(range(len(bloco)), key=chaves.__getitem__, reverse=reverse)
+    fd, bloco_path = tempfile.mkstemp(prefix='bloco_relatorio_', suffix='.jsonl')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for indice in ordem:
+            f.write(json.dumps(bloco[indice], ensure_ascii=False) + "\n")
+    return bloco_path
+
+
+def export_sorted_xlsx(path, xlsx_path, key, reverse=False, chunk_size=DEFAULT_CHUNK_SIZE, format_row=None):
+    """
+    Gera o Excel ordenado a partir do relatório em JSON lines.
+
+    Usa o modo somente escrita do openpyxl, que não mantém a planilha em
+    memória. `format_row`, se informado, converte cada linha antes de ser
+    escrita. Retorna a quantidade de linhas exportadas.
+    """
+    # openpyxl só é carregado quando há algo a exportar
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    columns = None
+    total = 0
+    for row in iter_sorted(path, key, reverse=reverse, chunk_size=chunk_size):
+        if format_row:
+            row = format_row(row)
+        if columns is None:
+            columns = list(row)
+            sheet.append(columns)
+        sheet.append([row.get(column) for column in columns])
+        total += 1
+    workbook.save(xlsx_path)
+    return total
@@ -0,0 +1,217 @@
+import json
+import re
+import threading
+import urllib.parse
+from collections import Counter
+from pathlib import Path
+
+# Limites (em segundos) dos baldes do histograma de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Famílias exportadas no formato do Prometheus (nome, tipo), na ordem de saída
+PROMETHEUS_FAMILIES = (
+    ("lcu_requests_total", "counter"),
+    ("lcu_request_errors_total", "counter"),
+    ("lcu_request_duration_seconds", "histogram"),
+    ("lcu_rate_limiter_wait_seconds_total", "counter"),
+    ("lcu_bytes_sent_total", "counter"),
+    ("lcu_bytes_received_total", "counter"),
+)
+
+# Modelos dos endpoints com partes variáveis, para agrupar as métricas
+ENDPOINT_TEMPLATES = (
+    (re.compile(r"^/lol-summoner/v2/summoners/by-riot-id/[^/]+/[^/]+$"), "/lol-summoner/v2/summoners/by-riot-id/{gameName}/{tagLine}"),
+    (re.compile(r"^/lol-summoner/v1/summoners/by-puuid/[^/]+$"), "/lol-summoner/v1/summoners/by-puuid/{puuid}"),
+    (re.compile(r"^/lol-ranked/v1/ranked-stats/[^/]+$"), "/lol-ranked/v1/ranked-stats/{summonerId}"),
+    (re.compile(r"^/lol-chat/v1/blocked-players/[^/]+$"), "/lol-chat/v1/blocked-players/{id}"),
+)
+# Segmentos genéricos tratados como identificadores (contêm dígitos, exceto versões como "v1")
+_SEGMENTO_VARIAVEL = re.compile(r"\d")
+_VERSAO = re.compile(r"^v\d+$")
+
+
+def endpoint_template(method, endpoint):
+    """
+    Agrupa o endpoint pelo seu modelo, sem as partes variáveis.
+
+    Ex.: ("GET", "/lol-ranked/v1/ranked-stats/123") -> "GET /lol-ranked/v1/ranked-stats/{summonerId}"
+    """
+    url = urllib.parse.urlsplit(endpoint)
+    path = url.path
+    for padrao, modelo in ENDPOINT_TEMPLATES:
+        if padrao.match(path):
+            path = modelo
+            break
+    else:
+        path = "/".join("{id}" if _SEGMENTO_VARIAVEL.search(s) and not _VERSAO.match(s) else s for s in path.split("/"))
+    if url.query:
+        path += "?" + "&".join(f"{nome}={{{nome}}}" for nome in urllib.parse.parse_qs(url.query, keep_blank_values=True))
+    return f"{method.upper()} {path}"
+
+
+class EndpointStats:
+    """
+    Métricas acumuladas de um modelo de endpoint.
+
+    Attributes:
+        count: Quantidade de requisições
+        statuses: Respostas por código de status
+        exceptions: Falhas por tipo de exceção
+        latency_sum: Tempo total de rede (segundos)
+        latency_max: Maior tempo de rede (segundos)
+        buckets: Contagem por balde de LATENCY_BUCKETS (não cumulativa; o último é +Inf)
+        wait_sum: Tempo total de espera no limitador de taxa (segundos)
+        bytes_sent: Bytes enviados no corpo das requisições
+        bytes_received: Bytes recebidos no corpo das respostas
+    """
+    def __init__(self):
+        self.count = 0
+        self.statuses = Counter()
+        self.exceptions = Counter()
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.wait_sum = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def errors(self):
+        """Exceções mais respostas com status >= 400."""
+        return sum(self.exceptions.values()) + sum(n for status, n in self.statuses.items() if status >= 400)
+
+    def quantile(self, q):
+        """Estimativa do quantil `q` (0-1) da latência, pelo limite superior do balde."""
+        if not self.count:
+            return 0.0
+        alvo = q * self.count
+        acumulado = 0
+        for limite, quantidade in zip(LATENCY_BUCKETS, self.buckets):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return limite
+        return self.latency_max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "exceptions": dict(self.exceptions),
+            "latencySeconds": {
+                "sum": self.latency_sum,
+                "max": self.latency_max,
+                "p50": self.quantile(0.5),
+                "p99": self.quantile(0.99),
+                "buckets": {str(limite): n for limite, n in zip(LATENCY_BUCKETS + ("+Inf",), self.buckets)},
+            },
+            "rateLimiterWaitSeconds": self.wait_sum,
+            "bytesSent": self.bytes_sent,
+            "bytesReceived": self.bytes_received,
+        }
+
+
+class RequestMetrics:
+    """
+    Métricas das requisições ao cliente, agrupadas por modelo de endpoint.
+
+    O tempo de rede e o tempo de espera no limitador de taxa são medidos
+    separadamente. As métricas podem ser exportadas em JSON ou no formato
+    texto do Prometheus.
+
+    Attributes:
+        endpoints: EndpointStats por modelo de endpoint
+    """
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, endpoint, latency, wait=0.0, status=None, exception=None, bytes_sent=0, bytes_received=0):
+        """Registra uma requisição concluída (com resposta ou exceção)."""
+        template = endpoint_template(method, endpoint)
+        indice = next((i for i, limite in enumerate(LATENCY_BUCKETS) if latency <= limite), len(LATENCY_BUCKETS))
+        with self._lock:
+            stats = self.endpoints.get(template)
+            if stats is None:
+                stats = self.endpoints[template] = EndpointStats()
+            stats.count += 1
+            if status is not None:
+                stats.statuses[status] += 1
+            if exception is not None:
+                stats.exceptions[exception] += 1
+            stats.latency_sum += latency
+            stats.latency_max = max(stats.latency_max, latency)
+            stats.buckets[indice] += 1
+            stats.wait_sum += wait
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+    def reset(self):
+        with self._lock:
+            self.endpoints = {}
+
+    def snapshot(self):
+        """Cópia das métricas atuais, como dicionário."""
+        with self._lock:
+            return {template: stats.to_dict() for template, stats in sorted(self.endpoints.items())}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """Métricas no formato texto do Prometheus, agrupadas por família."""
+        familias = {nome: [] for nome, _ in PROMETHEUS_FAMILIES}
+        with self._lock:
+            for template, stats in sorted(self.endpoints.items()):
+                method, path = template.split(" ", 1)
+                rotulos = f'method="{method}",endpoint="{_escapar(path)}"'
+                for status, n in sorted(stats.statuses.items()):
+                    familias["lcu_requests_total"].append(f'lcu_requests_total{{{rotulos},status="{status}"}} {n}')
+                for exception, n in sorted(stats.exceptions.items()):
+                    familias["lcu_request_errors_total"].append(
+                        f'lcu_request_errors_total{{{rotulos},exception="{_escapar(exception)}"}} {n}')
+                duracao = familias["lcu_request_duration_seconds"]
+                acumulado = 0
+                for limite, n in zip(LATENCY_BUCKETS, stats.buckets):
+                    acumulado += n
+                    duracao.append(f'lcu_request_duration_seconds_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+                duracao.append(f'lcu_request_duration_seconds_bucket{{{rotulos},le="+Inf"}} {stats.count}')
+                duracao.append(f'lcu_request_duration_seconds_sum{{{rotulos}}} {stats.latency_sum}')
+                duracao.append(f'lcu_request_duration_seconds_count{{{rotulos}}} {stats.count}')
+                familias["lcu_rate_limiter_wait_seconds_total"].append(
+                    f'lcu_rate_limiter_wait_seconds_total{{{rotulos}}} {stats.wait_sum}')
+                familias["lcu_bytes_sent_total"].append(f'lcu_bytes_sent_total{{{rotulos}}} {stats.bytes_sent}')
+                familias["lcu_bytes_received_total"].append(f'lcu_bytes_received_total{{{rotulos}}} {stats.bytes_received}')
+
+        linhas = []
+        for nome, tipo in PROMETHEUS_FAMILIES:
+            linhas.append(f"# TYPE {nome} {tipo}")
+            linhas.extend(familias[nome])
+        return "\n".join(linhas) + "\n"
+
+    def save(self, path):
+        """Grava as métricas em `path`: Prometheus para `.prom`/`.txt`, JSON nos demais casos."""
+        path = Path(path)
+        conteudo = self.to_prometheus() if path.suffix in (".prom", ".txt") else self.to_json()
+        path.write_text(conteudo, encoding='utf-8')
+
+    def summary(self, top=5):
+        """
+        Resumo em texto dos endpoints que mais consumiram tempo.
+
+        Cada linha mostra a quantidade de requisições, a latência média e p99
+        (rede), o tempo de espera no limitador e a quantidade de erros.
+        """
+        with self._lock:
+            itens = sorted(self.endpoints.items(), key=lambda item: item[1].latency_sum + item[1].wait_sum, reverse=True)
+            linhas = []
+            for template, stats in itens[:top]:
+                media = stats.latency_sum / stats.count * 1000 if stats.count else 0.0
+                linhas.append(
+                    f"{template}: {stats.count} req, média {media:.0f}ms, p99 ≤{stats.quantile(0.99) * 1000:.0f}ms, "
+                    f"espera {stats.wait_sum:.1f}s, erros {stats.errors}"
+                )
+        return "\n".join(linhas) if linhas else "Nenhuma requisição registrada."
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"')
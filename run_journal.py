@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+from pathlib import Path
+from player_record import PlayerRecord
+
+DEFAULT_JOURNAL_FILE = "execucao_bloqueados.jsonl"
+
+
+class RunJournal:
+    """
+    Diário em disco (JSON lines) do resultado de cada jogador processado.
+
+    Cada jogador concluído é gravado imediatamente, permitindo retomar uma
+    análise ou limpeza interrompida sem reprocessar quem já foi concluído.
+
+    Attributes:
+        path: Caminho do arquivo do diário
+        results: Resultados já gravados, por id de jogador
+        unblocked: Ids dos jogadores já desbloqueados
+    """
+    def __init__(self, path=DEFAULT_JOURNAL_FILE):
+        self.path = Path(path)
+        self.results = {}
+        self.unblocked = set()
+        self._lock = threading.Lock()
+
+    def start(self, mode, resume=False):
+        """
+        Inicia uma execução.
+
+        Com `resume`, carrega o diário existente e continua gravando nele;
+        caso contrário, o diário anterior é descartado.
+        """
+        with self._lock:
+            self.results = {}
+            self.unblocked = set()
+            if resume and self.path.exists():
+                self._carregar()
+            else:
+                self.path.write_text("", encoding='utf-8')
+        self._gravar({"type": "start", "mode": mode, "resume": resume})
+
+    def _carregar(self):
+        """Lê o diário existente, ignorando uma eventual linha incompleta no final."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if record.get("type") == "result":
+                        player_data = PlayerRecord.from_dict(record["playerData"]) if record["playerData"] else None
+                        self.results[record["id"]] = (player_data, record["remove"], record["reason"])
+                    elif record.get("type") == "unblock" and record.get("status") == "ok":
+                        self.unblocked.add(record["id"])
+                except ValueError:
+                    continue
+                except (TypeError, KeyError, AttributeError):
+                    continue  # Registro gravado em um formato anterior
+
+    def _gravar(self, record):
+        record["ts"] = time.time()
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+    def completed(self, jogador):
+        """Retorna o resultado já gravado do jogador, ou None."""
+        return self.results.get(str(jogador.get('id')))
+
+    def is_unblocked(self, jogador):
+        """Indica se o jogador já foi desbloqueado em uma execução anterior."""
+        return str(jogador.get('id')) in self.unblocked
+
+    def record_result(self, jogador, resultado):
+        """Grava o resultado (dados, remover, motivo) de um jogador."""
+        player_data, should_remove, reason = resultado
+        player_id = str(jogador.get('id'))
+        with self._lock:
+            self.results[player_id] = resultado
+        self._gravar({
+            "type": "result",
+            "id": player_id,
+            "name": f"{jogador.get('gameName', '')}#{jogador.get('gameTag', '')}",
+            "resolution": "ok" if player_data else reason,
+            "elo": player_data.elo if player_data else None,
+            "remove": bool(should_remove),
+            "reason": reason,
+            "playerData": player_data.to_dict() if player_data else None
+        })
+
+    def record_unblock(self, jogador, sucesso):
+        """Grava o resultado do desbloqueio de um jogador."""
+        player_id = str(jogador.get('id'))
+        if sucesso:
+            with self._lock:
+                self.unblocked.add(player_id)
+        self._gravar({"type": "unblock", "id": player_id, "status": "ok" if sucesso else "failed"})
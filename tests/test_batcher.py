@@ -0,0 +1,53 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batcher import RequestBatcher  # noqa: E402
+
+
+class LoteTest(unittest.TestCase):
+    def test_envia_quando_todas_as_threads_aguardam(self):
+        lotes = []
+
+        def bulk(chaves):
+            lotes.append(sorted(chaves))
+            return {chave: chave * 2 for chave in chaves}
+
+        batcher = RequestBatcher(bulk, lambda chave: None, batch_size=50, batch_delay=10)
+        resultados = {}
+        pronto = threading.Barrier(2)
+
+        def worker(chave):
+            with batcher.worker():
+                pronto.wait()
+                resultados[chave] = batcher.submit(chave)
+
+        threads = [threading.Thread(target=worker, args=(chave,)) for chave in (1, 2)]
+        inicio = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertLess(time.monotonic() - inicio, 5)
+        self.assertEqual(resultados, {1: 2, 2: 4})
+        self.assertEqual(lotes, [[1, 2]])
+
+    def test_excecao_vai_so_para_a_chave_que_falhou(self):
+        def single(chave):
+            if chave == 1:
+                raise ValueError("falhou")
+            return chave
+
+        batcher = RequestBatcher(lambda chaves: None, single)
+        resultados = batcher.fetch_each([1, 2])
+        self.assertIsInstance(resultados[1], ValueError)
+        self.assertEqual(resultados[2], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from blocklist_store import BlocklistStore  # noqa: E402
+
+
+class HistoricoTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        pasta = Path(self.tmp.name)
+        self.path = pasta / "bloqueados.json"
+        self.changelog = pasta / "bloqueados_alteracoes.jsonl"
+
+    def store(self):
+        return BlocklistStore(self.path, changelog_path=self.changelog)
+
+    def test_desbloqueio_vai_para_o_historico_e_e_consolidado(self):
+        jogadores = [{"id": 1, "gameName": "Um"}, {"id": 2, "gameName": "Dois"}]
+        store = self.store()
+        store.save(jogadores)
+        original = self.path.read_bytes()
+
+        store.save(jogadores[:1])
+        self.assertEqual(self.path.read_bytes(), original)
+        registros = [json.loads(linha) for linha in self.changelog.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([(r["type"], r["id"]) for r in registros], [("unblock", "2")])
+        self.assertEqual(self.store().load(), jogadores[:1])
+
+        store.compact()
+        self.assertFalse(self.changelog.exists())
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["usuariosBlock"], jogadores[:1])
+
+    def test_compact_sem_historico_nao_grava(self):
+        store = self.store()
+        store.compact()
+        self.assertFalse(self.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from client_mirror import BLOCKED_PLAYERS_URI, CURRENT_SUMMONER_URI, ClientMirror  # noqa: E402
+
+
+class EspelhoTest(unittest.TestCase):
+    def setUp(self):
+        self.mirror = ClientMirror()
+        self.mirror.replace([{"id": 1, "gameName": "Um"}, {"id": 2, "gameName": "Dois"}], {"displayName": "Eu"})
+
+    def evento(self, uri, tipo, data=None):
+        self.mirror.apply({"uri": uri, "eventType": tipo, "data": data})
+
+    def test_create_update_delete(self):
+        versao = self.mirror.version
+        self.evento(BLOCKED_PLAYERS_URI + "/3", "Create", {"id": 3, "gameName": "Três"})
+        self.assertEqual(self.mirror.get(3)["gameName"], "Três")
+
+        self.evento(BLOCKED_PLAYERS_URI + "/1", "Update", {"id": 1, "gameName": "Um Novo"})
+        self.assertEqual(self.mirror.get("1")["gameName"], "Um Novo")
+
+        self.evento(BLOCKED_PLAYERS_URI + "/2", "Delete")
+        self.assertIsNone(self.mirror.get(2))
+        self.assertEqual([p["id"] for p in self.mirror.players()], [1, 3])
+        self.assertEqual(self.mirror.version, versao + 3)
+
+    def test_delete_de_jogador_desconhecido_nao_altera_versao(self):
+        versao = self.mirror.version
+        self.evento(BLOCKED_PLAYERS_URI + "/99", "Delete")
+        self.assertEqual(self.mirror.version, versao)
+        self.assertEqual(len(self.mirror), 2)
+
+    def test_colecao_inteira_e_invocador(self):
+        self.evento(BLOCKED_PLAYERS_URI, "Update", [{"id": 5}])
+        self.assertEqual([p["id"] for p in self.mirror.players()], [5])
+
+        self.evento(CURRENT_SUMMONER_URI, "Update", {"displayName": "Outro"})
+        self.assertEqual(self.mirror.summoner["displayName"], "Outro")
+        self.evento(CURRENT_SUMMONER_URI, "Delete")
+        self.assertIsNone(self.mirror.summoner)
+
+
+if __name__ == "__main__":
+    unittest.main()
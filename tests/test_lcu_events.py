@@ -0,0 +1,137 @@
+import json
+import os
+import socket
+import struct
+import sys
+import time
+import unittest
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "benchmarks"))
+
+import lcu_mock  # noqa: E402
+from client_mirror import BLOCKED_PLAYERS_URI  # noqa: E402
+from lcu_events import (  # noqa: E402
+    BLOCKED_PLAYERS_EVENT, LcuEventStream, WebSocketError, _mascarar, encode_frame,
+)
+
+
+def frame(opcode, payload, final=True, mascarado=True):
+    """Monta um frame como o servidor poderia enviar (com ou sem máscara, fragmentado ou não)."""
+    cabecalho = bytearray([(0x80 if final else 0) | opcode])
+    bit_mascara = 0x80 if mascarado else 0
+    n = len(payload)
+    if n < 126:
+        cabecalho.append(bit_mascara | n)
+    elif n < 1 << 16:
+        cabecalho.append(bit_mascara | 126)
+        cabecalho += struct.pack("!H", n)
+    else:
+        cabecalho.append(bit_mascara | 127)
+        cabecalho += struct.pack("!Q", n)
+    if not mascarado:
+        return bytes(cabecalho) + payload
+    mascara = os.urandom(4)
+    return bytes(cabecalho) + mascara + _mascarar(payload, mascara)
+
+
+def aguardar(condicao, timeout=5.0):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condicao():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class FramesTest(unittest.TestCase):
+    """Leitura de frames direto de um par de sockets, sem handshake."""
+    def setUp(self):
+        self.stream = LcuEventStream("http://127.0.0.1:1", "x", [], on_event=lambda evento: None)
+        self.stream._sock, self.par = socket.socketpair()
+        self.addCleanup(self.par.close)
+        self.addCleanup(self.stream._fechar_socket)
+
+    def test_mensagem_fragmentada_com_ping_no_meio(self):
+        self.par.sendall(
+            frame(0x1, b'[8, "t", ', final=False)
+            + frame(0x9, b"oi")
+            + frame(0x0, b'{"a": 1}]', final=False)
+            + frame(0x0, b"", mascarado=False)
+        )
+        mensagens = self.stream._ler_mensagens()
+        self.assertEqual(json.loads(next(mensagens)), [8, "t", {"a": 1}])
+
+        pong = lcu_mock._ConexaoWebSocket(self.par.makefile("rb"), None).receive()
+        self.assertEqual(pong, (0xA, b"oi"))
+
+    def test_tamanhos_estendidos(self):
+        for tamanho in (125, 126, 70000):
+            payload = os.urandom(tamanho)
+            self.par.sendall(frame(0x2, payload, mascarado=tamanho != 126))
+            self.assertEqual(next(self.stream._ler_mensagens()), payload)
+
+    def test_frames_do_cliente_sao_mascarados(self):
+        bruto = encode_frame(0x1, b"[5, \"t\"]")
+        self.assertTrue(bruto[1] & 0x80)
+        self.stream._buffer = bytearray(bruto)
+        self.assertEqual(self.stream._ler_frame(), (True, 0x1, b"[5, \"t\"]"))
+
+    def test_fechamento_responde_e_encerra(self):
+        self.par.sendall(frame(0x8, struct.pack("!H", 1000) + b"tchau", mascarado=False))
+        self.assertEqual(list(self.stream._ler_mensagens()), [])
+        resposta = lcu_mock._ConexaoWebSocket(self.par.makefile("rb"), None).receive()
+        self.assertEqual(resposta, (0x8, struct.pack("!H", 1000)))
+
+
+class AssinaturaTest(unittest.TestCase):
+    """Handshake, eventos e reconexão contra o servidor simulado."""
+    def setUp(self):
+        opcoes = lcu_mock.MockOptions(players=3, password="segredo")
+        self.server, self.state = lcu_mock.start(opcoes)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def assinantes(self):
+        with self.state._lock:
+            return [c for c in self.state.subscribers if BLOCKED_PLAYERS_EVENT in c.topics]
+
+    def test_handshake_recusado_com_senha_errada(self):
+        stream = LcuEventStream(self.url, "errada", [BLOCKED_PLAYERS_EVENT], on_event=lambda evento: None)
+        self.addCleanup(stream._fechar_socket)
+        with self.assertRaisesRegex(WebSocketError, "401"):
+            stream._conectar()
+
+    def test_eventos_e_reconexao(self):
+        eventos = []
+        fechamentos = []
+        stream = LcuEventStream(
+            self.url, "segredo", [BLOCKED_PLAYERS_EVENT], on_event=eventos.append,
+            on_closed=lambda: fechamentos.append(1), initial_backoff=0.05,
+        )
+        stream.start()
+        self.addCleanup(stream.stop)
+
+        self.assertTrue(aguardar(lambda: self.assinantes()))
+        self.state.publish(BLOCKED_PLAYERS_EVENT, BLOCKED_PLAYERS_URI + "/9", "Create", {"id": 9})
+        self.assertTrue(aguardar(lambda: eventos))
+        self.assertEqual(eventos[0]["eventType"], "Create")
+
+        # O servidor fecha a conexão: a assinatura deve ser refeita
+        for conexao in self.assinantes():
+            conexao.send(0x8, struct.pack("!H", 1001))
+        self.assertTrue(aguardar(lambda: stream.subscriptions == 2 and self.assinantes()))
+        self.assertEqual(fechamentos, [1])
+
+        self.state.publish(BLOCKED_PLAYERS_EVENT, BLOCKED_PLAYERS_URI + "/9", "Delete")
+        self.assertTrue(aguardar(lambda: len(eventos) == 2))
+
+        stream.stop()
+        self.assertFalse(stream.connected)
+        self.assertEqual(fechamentos, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from identity_cache import IdentityCache  # noqa: E402
+from rank_cache import RankCache  # noqa: E402
+
+
+class ChaveRankTest(unittest.TestCase):
+    def test_id_numerico_e_texto_usam_a_mesma_entrada(self):
+        cache = RankCache()
+        buscas = []
+
+        def loader():
+            buscas.append(1)
+            return [{"queueType": "RANKED_SOLO_5x5"}]
+
+        cache.get(42, loader)
+        cache.get("42", loader)
+        self.assertEqual(len(buscas), 1)
+
+        cache.invalidate("42")
+        cache.get(42, loader)
+        self.assertEqual(len(buscas), 2)
+
+    def test_cache_de_identidades_devolve_id_numerico(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = IdentityCache(Path(tmp) / "identidades.db")
+            cache.put("1", "Jogador", "BR1", "puuid-1", 42)
+            self.assertEqual(cache.get("1", "Jogador", "BR1")["summoner_id"], 42)
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
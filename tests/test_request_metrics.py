@@ -0,0 +1,32 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from request_metrics import RequestMetrics  # noqa: E402
+
+
+class PrometheusTest(unittest.TestCase):
+    def test_amostras_agrupadas_por_familia(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "/lol-ranked/v1/ranked-stats/1", 0.01, status=200, bytes_received=10)
+        metrics.record("GET", "/lol-chat/v1/blocked-players", 0.02, exception="ConnectionError")
+
+        familia = None
+        vistas = []
+        for linha in metrics.to_prometheus().splitlines():
+            if linha.startswith("# TYPE "):
+                familia = linha.split()[2]
+                self.assertNotIn(familia, vistas)
+                vistas.append(familia)
+            else:
+                nome = linha.split("{", 1)[0]
+                self.assertIsNotNone(familia)
+                self.assertTrue(nome == familia or nome.startswith(familia + "_"), linha)
+
+        self.assertIn("lcu_request_errors_total", vistas)
+
+
+if __name__ == "__main__":
+    unittest.main()
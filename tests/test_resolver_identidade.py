@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lol_client import LookupFailed  # noqa: E402
+from motor_bloqueio import MotorBloqueios  # noqa: E402
+
+
+class ClienteFalso:
+    """Responde todas as consultas com o mesmo status; o invocador existe só com 200."""
+    def __init__(self, status):
+        self.status = status
+        self.available = True
+        self.supervisor = SimpleNamespace(on_event=None)
+        self.load_blocked_players = lambda: []
+        self.get_blocked_player = lambda player_id: None
+
+    def request(self, method, endpoint, data=None):
+        if self.status == 200:
+            return SimpleNamespace(status_code=200, json=lambda: {"puuid": "puuid-1"})
+        return SimpleNamespace(status_code=self.status, json=lambda: {})
+
+    def get_summoner_by_puuid(self, puuid):
+        if self.status == 200:
+            return {"puuid": puuid, "summonerId": 42}
+        if self.status == 404:
+            return None
+        raise LookupFailed(f"invocador {puuid}: {self.status}")
+
+
+class ResolverIdentidadeTest(unittest.TestCase):
+    JOGADOR = {"id": "1", "gameName": "Jogador", "gameTag": "BR1"}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def motor(self, status):
+        motor = MotorBloqueios(client=ClienteFalso(status), on_log=lambda mensagem, nivel: None)
+        self.addCleanup(motor.identity_cache.close)
+        return motor
+
+    def test_falha_temporaria_nao_vai_para_o_cache(self):
+        motor = self.motor(503)
+        self.assertEqual(motor._resolver_identidade(self.JOGADOR)[2], "PUUID não encontrado")
+        self.assertIsNone(motor.identity_cache.get("1", "Jogador", "BR1"))
+
+    def test_404_vai_para_o_cache(self):
+        motor = self.motor(404)
+        motor._resolver_identidade(self.JOGADOR)
+        self.assertFalse(motor.identity_cache.get("1", "Jogador", "BR1")["found"])
+        self.assertEqual(motor._resolver_identidade(self.JOGADOR)[2], "PUUID não encontrado (cache)")
+
+    def test_negativo_em_cache_nao_ignora_puuid_do_pid(self):
+        motor = self.motor(200)
+        motor.identity_cache.put("1", "Jogador", "BR1")
+        jogador = dict(self.JOGADOR, pid="puuid-1@br1")
+        self.assertEqual(motor._resolver_identidade(jogador), ("puuid-1", 42, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from player_record import PlayerRecord  # noqa: E402
+from run_journal import RunJournal  # noqa: E402
+
+
+class RetomarDiarioTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "execucao.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ignora_linha_em_formato_anterior(self):
+        record = PlayerRecord("Novo#BR1", "2", 200, "puuid-2", tier=3, division=2, elo_diff=1)
+        linhas = [
+            {"type": "start", "mode": "analisar", "resume": False},
+            # Formato anterior: playerData com os rótulos das colunas
+            {"type": "result", "id": "1", "remove": True, "reason": "diferença de elo: 4",
+             "playerData": {"Nome": "Antigo#BR1", "Tier": "GOLD", "Rank": "II"}},
+            {"type": "result", "id": "2", "remove": False, "reason": "diferença de elo: 1",
+             "playerData": record.to_dict()},
+            {"type": "result", "id": "3"},
+            {"type": "unblock", "id": "4", "status": "ok"},
+        ]
+        self.path.write_text("".join(json.dumps(l) + "\n" for l in linhas) + '{"type": "res', encoding="utf-8")
+
+        journal = RunJournal(self.path)
+        journal.start("analisar", resume=True)
+
+        self.assertIsNone(journal.completed({"id": "1"}))
+        self.assertIsNone(journal.completed({"id": "3"}))
+        player_data, remover, motivo = journal.completed({"id": "2"})
+        self.assertEqual(player_data.name, "Novo#BR1")
+        self.assertFalse(remover)
+        self.assertEqual(motivo, "diferença de elo: 1")
+        self.assertTrue(journal.is_unblocked({"id": "4"}))
+
+
+if __name__ == "__main__":
+    unittest.main()